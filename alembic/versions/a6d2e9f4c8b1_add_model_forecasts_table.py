@@ -0,0 +1,49 @@
+"""add model_forecasts table
+
+Revision ID: a6d2e9f4c8b1
+Revises: f3b8c1d6e2a7
+Create Date: 2026-10-19 18:00:00
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "a6d2e9f4c8b1"
+down_revision: Union[str, Sequence[str], None] = "f3b8c1d6e2a7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+
+    if inspector.has_table("model_forecasts"):
+        return
+
+    op.create_table(
+        "model_forecasts",
+        sa.Column("spot_id", sa.Integer(), nullable=False),
+        sa.Column("timestamp", sa.DateTime(), nullable=False),
+        sa.Column("wave_height", sa.Float(), nullable=True),
+        sa.Column("wave_period", sa.Float(), nullable=True),
+        sa.Column("wave_direction", sa.Float(), nullable=True),
+        sa.Column("wind_speed", sa.Float(), nullable=True),
+        sa.Column("wind_direction", sa.Float(), nullable=True),
+        sa.Column("updated_at", sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(["spot_id"], ["spots.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("spot_id", "timestamp"),
+    )
+    op.create_index("ix_model_forecasts_timestamp", "model_forecasts", ["timestamp"])
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    if inspector.has_table("model_forecasts"):
+        op.drop_index("ix_model_forecasts_timestamp", table_name="model_forecasts")
+        op.drop_table("model_forecasts")
@@ -0,0 +1,102 @@
+"""add spot_review_daily aggregate table
+
+Revision ID: b7d4e1f2a3c9
+Revises: aa12bb34cc56
+Create Date: 2026-10-19 09:00:00
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b7d4e1f2a3c9"
+down_revision: Union[str, Sequence[str], None] = "aa12bb34cc56"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+REVIEW_METRICS = (
+    "quality",
+    "crowded_level",
+    "wave_height_index",
+    "short_long_index",
+    "wind_index",
+)
+# Must match app.services.spot_review_daily_service.REVIEW_DECAY_HOURS
+REVIEW_DECAY_HOURS = 3.0
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+
+    if inspector.has_table("spot_review_daily"):
+        return
+
+    metric_columns = []
+    for metric in REVIEW_METRICS:
+        metric_columns.extend(
+            [
+                sa.Column(f"{metric}_count", sa.Integer(), server_default="0", nullable=False),
+                sa.Column(f"{metric}_weighted_sum", sa.Float(), server_default="0", nullable=False),
+                sa.Column(f"{metric}_weight_sum", sa.Float(), server_default="0", nullable=False),
+            ]
+        )
+
+    op.create_table(
+        "spot_review_daily",
+        sa.Column("spot_id", sa.Integer(), nullable=False),
+        sa.Column("date", sa.Date(), nullable=False),
+        sa.Column("review_count", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("latest_observed_at", sa.DateTime(), nullable=True),
+        *metric_columns,
+        sa.ForeignKeyConstraint(["spot_id"], ["spots.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("spot_id", "date"),
+    )
+
+    weight = (
+        "exp(extract(epoch FROM r.observed_at - date_trunc('day', r.observed_at)) "
+        f"/ 3600.0 / {REVIEW_DECAY_HOURS})"
+    )
+    metric_names = []
+    metric_selects = []
+    for metric in REVIEW_METRICS:
+        metric_names.extend([f"{metric}_count", f"{metric}_weighted_sum", f"{metric}_weight_sum"])
+        metric_selects.extend(
+            [
+                f"count(r.{metric})",
+                f"coalesce(sum(r.{metric} * {weight}), 0)",
+                f"coalesce(sum(CASE WHEN r.{metric} IS NOT NULL THEN {weight} END), 0)",
+            ]
+        )
+
+    op.execute(
+        sa.text(
+            f"""
+            INSERT INTO spot_review_daily (
+                spot_id,
+                date,
+                review_count,
+                latest_observed_at,
+                {", ".join(metric_names)}
+            )
+            SELECT
+                r.spot_id,
+                CAST(r.observed_at AS DATE),
+                count(*),
+                max(r.observed_at),
+                {", ".join(metric_selects)}
+            FROM surf_session_reviews AS r
+            GROUP BY r.spot_id, CAST(r.observed_at AS DATE)
+            """
+        )
+    )
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    if inspector.has_table("spot_review_daily"):
+        op.drop_table("spot_review_daily")
@@ -0,0 +1,51 @@
+"""add (spot_id, observed_at DESC, id DESC) index for review keyset pagination
+
+Revision ID: c8e5f2a3b4d0
+Revises: b7d4e1f2a3c9
+Create Date: 2026-10-19 10:00:00
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c8e5f2a3b4d0"
+down_revision: Union[str, Sequence[str], None] = "b7d4e1f2a3c9"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    review_indexes = {idx["name"] for idx in inspector.get_indexes("surf_session_reviews")}
+
+    if "ix_surf_session_reviews_spot_observed_id" not in review_indexes:
+        op.create_index(
+            "ix_surf_session_reviews_spot_observed_id",
+            "surf_session_reviews",
+            ["spot_id", sa.text("observed_at DESC"), sa.text("id DESC")],
+            unique=False,
+        )
+    # Superseded by the index above, which has the same leading columns.
+    if "ix_surf_session_reviews_spot_observed_at" in review_indexes:
+        op.drop_index("ix_surf_session_reviews_spot_observed_at", table_name="surf_session_reviews")
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    review_indexes = {idx["name"] for idx in inspector.get_indexes("surf_session_reviews")}
+
+    if "ix_surf_session_reviews_spot_observed_at" not in review_indexes:
+        op.create_index(
+            "ix_surf_session_reviews_spot_observed_at",
+            "surf_session_reviews",
+            ["spot_id", "observed_at"],
+            unique=False,
+        )
+    if "ix_surf_session_reviews_spot_observed_id" in review_indexes:
+        op.drop_index("ix_surf_session_reviews_spot_observed_id", table_name="surf_session_reviews")
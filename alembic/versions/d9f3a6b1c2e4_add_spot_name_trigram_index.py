@@ -0,0 +1,48 @@
+"""add pg_trgm GIN index on spots.name for fuzzy search
+
+Revision ID: d9f3a6b1c2e4
+Revises: c8e5f2a3b4d0
+Create Date: 2026-10-19 12:00:00
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d9f3a6b1c2e4"
+down_revision: Union[str, Sequence[str], None] = "c8e5f2a3b4d0"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name != "postgresql":
+        return
+    inspector = sa.inspect(bind)
+    spot_indexes = {idx["name"] for idx in inspector.get_indexes("spots")}
+
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    if "ix_spots_name_trgm" not in spot_indexes:
+        op.create_index(
+            "ix_spots_name_trgm",
+            "spots",
+            ["name"],
+            unique=False,
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        )
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name != "postgresql":
+        return
+    inspector = sa.inspect(bind)
+    spot_indexes = {idx["name"] for idx in inspector.get_indexes("spots")}
+
+    if "ix_spots_name_trgm" in spot_indexes:
+        op.drop_index("ix_spots_name_trgm", table_name="spots")
@@ -0,0 +1,41 @@
+"""add (user_id, datetime DESC, id DESC) index for session keyset pagination
+
+Revision ID: e4a7b2c9d1f3
+Revises: d9f3a6b1c2e4
+Create Date: 2026-10-19 13:00:00
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e4a7b2c9d1f3"
+down_revision: Union[str, Sequence[str], None] = "d9f3a6b1c2e4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    session_indexes = {idx["name"] for idx in inspector.get_indexes("surf_sessions")}
+
+    if "ix_surf_sessions_user_datetime_id" not in session_indexes:
+        op.create_index(
+            "ix_surf_sessions_user_datetime_id",
+            "surf_sessions",
+            ["user_id", sa.text("datetime DESC"), sa.text("id DESC")],
+            unique=False,
+        )
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    session_indexes = {idx["name"] for idx in inspector.get_indexes("surf_sessions")}
+
+    if "ix_surf_sessions_user_datetime_id" in session_indexes:
+        op.drop_index("ix_surf_sessions_user_datetime_id", table_name="surf_sessions")
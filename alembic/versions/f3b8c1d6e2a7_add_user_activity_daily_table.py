@@ -0,0 +1,75 @@
+"""add user_activity_daily rollup table
+
+Revision ID: f3b8c1d6e2a7
+Revises: e4a7b2c9d1f3
+Create Date: 2026-10-19 15:00:00
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "f3b8c1d6e2a7"
+down_revision: Union[str, Sequence[str], None] = "e4a7b2c9d1f3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+
+    if inspector.has_table("user_activity_daily"):
+        return
+
+    op.create_table(
+        "user_activity_daily",
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("date", sa.Date(), nullable=False),
+        sa.Column("spot_id", sa.Integer(), nullable=False),
+        sa.Column("session_count", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("total_minutes", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("reviewed_count", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("quality_sum", sa.Integer(), server_default="0", nullable=False),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["spot_id"], ["spots.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("user_id", "date", "spot_id"),
+    )
+
+    op.execute(
+        sa.text(
+            """
+            INSERT INTO user_activity_daily (
+                user_id,
+                date,
+                spot_id,
+                session_count,
+                total_minutes,
+                reviewed_count,
+                quality_sum
+            )
+            SELECT
+                s.user_id,
+                CAST(s.datetime AS DATE),
+                s.spot_id,
+                count(*),
+                coalesce(sum(s.duration_minutes), 0),
+                count(r.quality),
+                coalesce(sum(r.quality), 0)
+            FROM surf_sessions AS s
+            LEFT JOIN surf_session_reviews AS r ON r.surf_session_id = s.id
+            WHERE s.user_id IS NOT NULL AND s.spot_id IS NOT NULL
+            GROUP BY s.user_id, CAST(s.datetime AS DATE), s.spot_id
+            """
+        )
+    )
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    if inspector.has_table("user_activity_daily"):
+        op.drop_table("user_activity_daily")
@@ -3,6 +3,7 @@ from sqladmin import Admin
 from app.admin.auth import AdminAuth
 from app.admin.views import (
     ForecastAdmin,
+    ModelForecastAdmin,
     SpotAdmin,
     SurfboardAdmin,
     SurfForecastAdmin,
@@ -30,5 +31,6 @@ def init_admin(app):
     admin.add_view(SurfSessionReviewAdmin)
     admin.add_view(ForecastAdmin)
     admin.add_view(SurfForecastAdmin)
+    admin.add_view(ModelForecastAdmin)
     admin.add_view(TideAdmin)
     return admin
@@ -1,11 +1,16 @@
+import logging
+
 from sqladmin.authentication import AuthenticationBackend
 from sqlalchemy import select
 from starlette.requests import Request
 
+from app.core.password_hashing import PasswordHashingBusy, password_hash_pool
 from app.core.security import verify_password
 from app.database import async_session
 from app.models import User
 
+logger = logging.getLogger(__name__)
+
 
 class AdminAuth(AuthenticationBackend):
     """Cookie-based authentication for SQLAdmin."""
@@ -30,7 +35,11 @@ class AdminAuth(AuthenticationBackend):
         if user is None:
             return False
 
-        if not verify_password(password, user.hashed_password):
+        try:
+            if not await password_hash_pool.run(verify_password, password, user.hashed_password):
+                return False
+        except PasswordHashingBusy:
+            logger.warning("admin_login_rejected", extra={"reason": "password_hashing_busy"})
             return False
 
         request.session.update({"admin_user_id": str(user.id)})
@@ -1,7 +1,12 @@
 from sqladmin import ModelView, filters
+from sqladmin._queries import Query
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import async_object_session
+from sqlalchemy.orm import selectinload
 
 from app.models import (
     Forecast,
+    ModelForecast,
     Spot,
     Surfboard,
     SurfForecast,
@@ -9,7 +14,113 @@ from app.models import (
     SurfSessionReview,
     Tide,
     User,
+    UserActivityDaily,
 )
+from app.services.spot_catalogue_cache import bump_spot_catalogue_version
+from app.services.spot_index import spot_index
+from app.services.spot_review_daily_service import (
+    add_review_to_daily,
+    rebuild_spot_review_daily,
+    remove_review_from_daily,
+    review_contribution,
+)
+from app.services.user_activity_daily_service import (
+    ActivityContribution,
+    add_session_to_activity,
+    remove_session_from_activity,
+    replace_session_in_activity,
+    session_contribution,
+)
+from app.services.user_cache import invalidate_user
+
+
+class SpotCatalogueInvalidationMixin:
+    """Invalidate the cached spot catalogue (and optionally the spot index) after admin edits."""
+
+    resets_spot_index = False
+
+    def _invalidate(self) -> None:
+        bump_spot_catalogue_version()
+        if self.resets_spot_index:
+            spot_index.reset()
+
+    async def after_model_change(self, data, model, is_created, request) -> None:
+        self._invalidate()
+
+    async def after_model_delete(self, model, request) -> None:
+        self._invalidate()
+
+
+class RollupSyncMixin:
+    """Apply ``sync_rollups`` in the same transaction as an admin insert or update.
+
+    sqladmin calls ``on_model_change`` before the form is applied (and, on insert, before the
+    row is in a session), so this mirrors its async ``Query.insert``/``Query.update`` and runs
+    the rollup deltas after a flush, ahead of the single commit.
+    """
+
+    async def sync_rollups(self, db, model, is_created, request) -> None:
+        raise NotImplementedError
+
+    async def insert_model(self, request, data):
+        model = self.model()
+        async with self.session_maker(expire_on_commit=False) as db:
+            await self.on_model_change(data, model, True, request)
+            model = await Query(self)._set_attributes_async(db, model, data)
+            db.add(model)
+            await db.flush()
+            await self.sync_rollups(db, model, True, request)
+            await db.commit()
+            await self.after_model_change(data, model, True, request)
+            return model
+
+    async def update_model(self, request, pk, data):
+        stmt = self._stmt_by_identifier(pk)
+        for relation in self._form_relations:
+            stmt = stmt.options(selectinload(relation))
+        async with self.session_maker(expire_on_commit=False) as db:
+            model = (await db.execute(stmt)).scalars().first()
+            await self.on_model_change(data, model, False, request)
+            model = await Query(self)._set_attributes_async(db, model, data)
+            await db.flush()
+            await self.sync_rollups(db, model, False, request)
+            await db.commit()
+            await self.after_model_change(data, model, False, request)
+            return model
+
+
+async def _session_activity(db, surf_session: SurfSession) -> ActivityContribution | None:
+    """The session's current rollup contribution, or None if it has no owner."""
+    if surf_session.user_id is None:
+        return None
+    quality = await db.scalar(
+        select(SurfSessionReview.quality).where(SurfSessionReview.surf_session_id == surf_session.id)
+    )
+    return session_contribution(surf_session, quality)
+
+
+async def _swap_activity(db, previous: ActivityContribution | None, current: ActivityContribution | None) -> None:
+    if previous is not None and current is not None:
+        await replace_session_in_activity(db, previous, current)
+    elif previous is not None:
+        await remove_session_from_activity(db, previous)
+    elif current is not None:
+        await add_session_to_activity(db, current)
+
+
+async def _move_review_quality(db, previous: tuple | None, current: tuple | None) -> None:
+    """Re-point a review's quality in user_activity_daily; each side is ``(surf_session_id, quality)``."""
+    if previous == current:
+        return
+    for surf_session_id in {pair[0] for pair in (previous, current) if pair is not None}:
+        surf_session = await db.get(SurfSession, surf_session_id)
+        if surf_session is None or surf_session.user_id is None:
+            continue
+        old = previous[1] if previous is not None and previous[0] == surf_session_id else None
+        new = current[1] if current is not None and current[0] == surf_session_id else None
+        await replace_session_in_activity(
+            db, session_contribution(surf_session, old), session_contribution(surf_session, new)
+        )
 
 
 class UserAdmin(ModelView, model=User):
@@ -21,8 +132,32 @@ class UserAdmin(ModelView, model=User):
     form_excluded_columns = ["hashed_password", "surf_sessions", "surfboards", "created_at"]
     column_details_exclude_list = ["hashed_password"]
 
+    # Drop the cached principal so admin toggles and deletions apply to the next request.
+    async def after_model_change(self, data, model, is_created, request) -> None:
+        invalidate_user(model.id)
+
+    async def on_model_delete(self, model, request) -> None:
+        # The user's reviews go with them (ondelete=CASCADE); delete them here so the
+        # affected spot aggregates can be rebuilt in the same transaction.
+        db = async_object_session(model)
+        spot_ids = (
+            await db.scalars(select(SurfSessionReview.spot_id).where(SurfSessionReview.user_id == model.id).distinct())
+        ).all()
+        if spot_ids:
+            await db.execute(delete(SurfSessionReview).where(SurfSessionReview.user_id == model.id))
+            await rebuild_spot_review_daily(db, spot_ids)
+        request.state.reviews_removed = bool(spot_ids)
+        # Their sessions are kept but orphaned, so they no longer count towards any rollup.
+        await db.execute(delete(UserActivityDaily).where(UserActivityDaily.user_id == model.id))
+
+    async def after_model_delete(self, model, request) -> None:
+        invalidate_user(model.id)
+        if request.state.reviews_removed:
+            bump_spot_catalogue_version()
+
 
-class SpotAdmin(ModelView, model=Spot):
+class SpotAdmin(SpotCatalogueInvalidationMixin, ModelView, model=Spot):
+    resets_spot_index = True
     name = "Spot"
     name_plural = "Spots"
     can_delete = True
@@ -56,7 +191,7 @@ class SurfboardAdmin(ModelView, model=Surfboard):
     column_sortable_list = [Surfboard.id, Surfboard.length_ft]
 
 
-class SurfSessionAdmin(ModelView, model=SurfSession):
+class SurfSessionAdmin(RollupSyncMixin, ModelView, model=SurfSession):
     name = "Surf Session"
     name_plural = "Surf Sessions"
     column_list = [
@@ -80,8 +215,30 @@ class SurfSessionAdmin(ModelView, model=SurfSession):
     ]
     form_excluded_columns = ["created_at"]
 
+    # Keep user_activity_daily in step with admin writes, as surf_session_service does for the API.
+    async def on_model_change(self, data, model, is_created, request) -> None:
+        request.state.previous_activity = (
+            None if is_created else await _session_activity(async_object_session(model), model)
+        )
+
+    async def sync_rollups(self, db, model, is_created, request) -> None:
+        await _swap_activity(db, request.state.previous_activity, await _session_activity(db, model))
+
+    async def on_model_delete(self, model, request) -> None:
+        db = async_object_session(model)
+        review = await db.scalar(select(SurfSessionReview).where(SurfSessionReview.surf_session_id == model.id))
+        if review is not None:
+            # The review is removed with the session (ondelete=CASCADE).
+            await remove_review_from_daily(db, review_contribution(review))
+        await _swap_activity(db, await _session_activity(db, model), None)
+        request.state.review_removed = review is not None
+
+    async def after_model_delete(self, model, request) -> None:
+        if request.state.review_removed:
+            bump_spot_catalogue_version()
+
 
-class SurfSessionReviewAdmin(ModelView, model=SurfSessionReview):
+class SurfSessionReviewAdmin(RollupSyncMixin, SpotCatalogueInvalidationMixin, ModelView, model=SurfSessionReview):
     name = "Surf Session Review"
     name_plural = "Surf Session Reviews"
     column_list = [
@@ -105,6 +262,25 @@ class SurfSessionReviewAdmin(ModelView, model=SurfSessionReview):
     ]
     form_excluded_columns = ["created_at"]
 
+    # Keep spot_review_daily in step: the old contribution is captured before the form is
+    # applied, then swapped for the new one in the same transaction as the edit.
+    async def on_model_change(self, data, model, is_created, request) -> None:
+        request.state.previous_review = None if is_created else review_contribution(model)
+        request.state.previous_quality = None if is_created else (model.surf_session_id, model.quality)
+
+    async def sync_rollups(self, db, model, is_created, request) -> None:
+        previous = request.state.previous_review
+        if review_contribution(model) != previous:
+            if previous is not None:
+                await remove_review_from_daily(db, previous)
+            await add_review_to_daily(db, model)
+        await _move_review_quality(db, request.state.previous_quality, (model.surf_session_id, model.quality))
+
+    async def on_model_delete(self, model, request) -> None:
+        db = async_object_session(model)
+        await remove_review_from_daily(db, review_contribution(model))
+        await _move_review_quality(db, (model.surf_session_id, model.quality), None)
+
 
 class ForecastAdmin(ModelView, model=Forecast):
     name = "Forecast"
@@ -152,6 +328,29 @@ class SurfForecastAdmin(ModelView, model=SurfForecast):
     form_excluded_columns = []
 
 
+class ModelForecastAdmin(ModelView, model=ModelForecast):
+    name = "Model Forecast"
+    name_plural = "Model Forecasts"
+    column_list = [
+        ModelForecast.spot_id,
+        ModelForecast.timestamp,
+        ModelForecast.wave_height,
+        ModelForecast.wave_period,
+        ModelForecast.wave_direction,
+        ModelForecast.wind_speed,
+        ModelForecast.wind_direction,
+        ModelForecast.updated_at,
+    ]
+    column_sortable_list = [ModelForecast.timestamp, ModelForecast.updated_at]
+    column_filters = [
+        filters.OperationColumnFilter(ModelForecast.spot_id),
+        filters.OperationColumnFilter(ModelForecast.timestamp),
+    ]
+    # Written only by the worker's Open-Meteo job.
+    can_create = False
+    can_edit = False
+
+
 class TideAdmin(ModelView, model=Tide):
     name = "Tide"
     name_plural = "Tides"
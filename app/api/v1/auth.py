@@ -1,4 +1,3 @@
-import asyncio
 import traceback
 from datetime import timedelta
 from typing import Annotated
@@ -8,16 +7,24 @@ from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
 
 from app.api.deps import db_dependency
 from app.core.config import settings
+from app.core.password_hashing import password_hash_pool
 from app.core.security import create_access_token, verify_password, verify_token
-from app.models import User
 from app.schemas.user import TokenResponse, UserCreate, UserResponse
 from app.services.demo_service import reset_demo_data
-from app.services.user_service import create_user, get_user, get_user_by_email
+from app.services.user_cache import UserPrincipal, principal_claims, principal_from_claims, user_principal_cache
+from app.services.user_service import create_user, get_user_by_email, get_user_principal
 
 router = APIRouter(prefix="/auth", tags=["auth"])
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/login")
 
 
+def _token_data(user) -> dict:
+    """Token payload; the principal claims are only added when trusted mode will read them."""
+    if settings.AUTH_TRUST_TOKEN_CLAIMS:
+        return {"sub": str(user.id), **principal_claims(user)}
+    return {"sub": str(user.id)}
+
+
 @router.post("/register", status_code=status.HTTP_201_CREATED, response_model=UserResponse)
 async def register_user_endpoint(db: db_dependency, user_create: UserCreate) -> UserResponse:
     user = await create_user(db, user_create)
@@ -33,18 +40,19 @@ async def login_user_endpoint(
     user = await get_user_by_email(db, form_data.username)
     if not user:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid credentials")
-    if not await asyncio.to_thread(verify_password, form_data.password, user.hashed_password):
+    if not await password_hash_pool.run(verify_password, form_data.password, user.hashed_password):
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid credentials")
     expires_delta = (
         timedelta(days=settings.ACCESS_TOKEN_EXPIRE_DAYS_REMEMBER_ME)
         if remember_me
         else timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
     )
-    access_token = create_access_token({"sub": str(user.id)}, expires_delta=expires_delta)
+    access_token = create_access_token(_token_data(user), expires_delta=expires_delta)
     return TokenResponse(access_token=access_token, token_type="Bearer")
 
 
-async def get_current_user(db: db_dependency, token: str = Depends(oauth2_scheme)) -> User:
+async def get_current_user(db: db_dependency, token: str = Depends(oauth2_scheme)) -> UserPrincipal:
+    """Principal of the token's user; served from ``user_principal_cache`` while fresh."""
     if not token:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -68,20 +76,28 @@ async def get_current_user(db: db_dependency, token: str = Depends(oauth2_scheme
         )
     # Ensure user_id is an integer (JWT might return it as string)
     user_id = int(user_id) if isinstance(user_id, str) else user_id
-    user = await get_user(db, user_id)
+    user = user_principal_cache.get(user_id)
+    if user is not None:
+        return user
+
+    if settings.AUTH_TRUST_TOKEN_CLAIMS and user_principal_cache.trusts_token(user_id, payload.get("iat")):
+        user = principal_from_claims(user_id, payload)
+    if user is None:
+        user = await get_user_principal(db, user_id)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="User not found",
             headers={"WWW-Authenticate": "Bearer"},
         )
+    user_principal_cache.put(user.id, user)
     return user
 
 
-CurrentUser = Annotated[User, Depends(get_current_user)]
+CurrentUser = Annotated[UserPrincipal, Depends(get_current_user)]
 
 
-async def require_admin_user(current_user: CurrentUser) -> User:
+async def require_admin_user(current_user: CurrentUser) -> UserPrincipal:
     if not current_user.is_admin:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
@@ -90,7 +106,7 @@ async def require_admin_user(current_user: CurrentUser) -> User:
     return current_user
 
 
-AdminUser = Annotated[User, Depends(require_admin_user)]
+AdminUser = Annotated[UserPrincipal, Depends(require_admin_user)]
 
 
 @router.get("/me", status_code=status.HTTP_200_OK, response_model=UserResponse)
@@ -123,5 +139,5 @@ async def demo_login_endpoint(db: db_dependency) -> TokenResponse:
         ) from e
 
     expires_delta = timedelta(hours=settings.DEMO_TOKEN_EXPIRE_HOURS)
-    token = create_access_token({"sub": str(user.id)}, expires_delta=expires_delta)
+    token = create_access_token(_token_data(user), expires_delta=expires_delta)
     return TokenResponse(access_token=token, token_type="Bearer")
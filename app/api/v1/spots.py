@@ -1,21 +1,159 @@
-from fastapi import APIRouter, HTTPException, Query, status
+from datetime import datetime, timezone
+
+from fastapi import APIRouter, HTTPException, Query, Request, Response, status
+from fastapi.responses import JSONResponse
+from pydantic_core import to_json
 
 from app.api.deps import db_dependency
 from app.api.v1.auth import AdminUser, CurrentUser
-from app.schemas.spot import SpotCreate, SpotResponse, SpotUpdate
+from app.core.exceptions import ValidationError
+from app.core.pagination import NEXT_CURSOR_HEADER, decode_cursor, encode_cursor
+from app.core.serialization import RowJSONResponse
+from app.schemas.spot import (
+    SpotClusterResponse,
+    SpotCreate,
+    SpotNearbyResponse,
+    SpotResponse,
+    SpotSearchResponse,
+    SpotUpdate,
+)
 from app.schemas.surf_session_review import SpotReviewResponse
-from app.services.spot_service import create_spot, delete_spot, get_spot_by_id, list_spots, spot_exists, update_spot
-from app.services.surf_session_review_service import list_spot_reviews
+from app.services.spot_catalogue_cache import etag_matches, spot_catalogue_cache
+from app.services.spot_index import MAX_CLUSTER_ZOOM, MAX_UNBOUNDED_CLUSTER_ZOOM, SpotPoint, spot_index
+from app.services.spot_service import (
+    create_spot,
+    delete_spot,
+    get_spot_by_id,
+    list_spot_rows,
+    search_spots,
+    spot_exists,
+    update_spot,
+)
+from app.services.surf_session_review_service import list_spot_review_rows
 
 router = APIRouter(prefix="/spot", tags=["spot"])
 
+SPOT_MARKER_FIELDS = SpotPoint._fields
+
+
+def _parse_bbox(bbox: str) -> tuple[float, float, float, float]:
+    try:
+        min_lon, min_lat, max_lon, max_lat = (float(part) for part in bbox.split(","))
+    except ValueError as e:
+        raise ValidationError("bbox must be 'minLon,minLat,maxLon,maxLat'") from e
+    if not (-180 <= min_lon <= 180 and -180 <= max_lon <= 180):
+        raise ValidationError("bbox longitudes must be between -180 and 180")
+    if not (-90 <= min_lat <= max_lat <= 90):
+        raise ValidationError("bbox latitudes must be between -90 and 90 with minLat <= maxLat")
+    return min_lon, min_lat, max_lon, max_lat
+
+
+def _parse_fields(fields: str | None) -> tuple[str, ...]:
+    if fields is None:
+        return SPOT_MARKER_FIELDS
+    requested = tuple(dict.fromkeys(field.strip() for field in fields.split(",") if field.strip()))
+    unknown = set(requested) - set(SPOT_MARKER_FIELDS)
+    if not requested or unknown:
+        raise ValidationError(f"fields must be a subset of {','.join(SPOT_MARKER_FIELDS)}")
+    return requested
+
+
+@router.get(
+    "/",
+    status_code=status.HTTP_200_OK,
+    response_model=list[SpotResponse],
+    description=(
+        "Full catalogue with review summaries. With `bbox` and/or `fields`, returns only the "
+        f"lightweight marker projection ({', '.join(SPOT_MARKER_FIELDS)}) from the in-memory spot index."
+    ),
+)
+async def list_spots_endpoint(
+    request: Request,
+    current_user: CurrentUser,
+    db: db_dependency,
+    bbox: str | None = Query(default=None, description="minLon,minLat,maxLon,maxLat"),
+    fields: str | None = Query(default=None, description=f"Comma-separated subset of {','.join(SPOT_MARKER_FIELDS)}"),
+):
+    if bbox is not None or fields is not None:
+        selected = _parse_fields(fields)
+        bounds = _parse_bbox(bbox) if bbox is not None else None
+        await spot_index.ensure_loaded(db)
+        points = spot_index.within_bbox(*bounds) if bounds is not None else spot_index.all()
+        return JSONResponse([{field: getattr(point, field) for field in selected} for point in points])
+
+    today = datetime.now(timezone.utc).date()
+    version = spot_catalogue_cache.version
+    etag = spot_catalogue_cache.etag(version, today)
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    body = spot_catalogue_cache.get(version, today)
+    if body is None:
+        # Same Rust encoder as SpotResponse.model_dump_json, fed trusted rows instead of validated models.
+        body = to_json(await list_spot_rows(db))
+        spot_catalogue_cache.put(version, today, body)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+@router.get(
+    "/nearby",
+    status_code=status.HTTP_200_OK,
+    response_model=list[SpotNearbyResponse],
+)
+async def list_nearby_spots_endpoint(
+    current_user: CurrentUser,
+    db: db_dependency,
+    lat: float = Query(ge=-90, le=90),
+    lon: float = Query(ge=-180, le=180),
+    radius_km: float = Query(default=20.0, gt=0, le=20_000),
+    limit: int = Query(default=20, ge=1, le=200),
+) -> list[SpotNearbyResponse]:
+    await spot_index.ensure_loaded(db)
+    return [
+        SpotNearbyResponse(
+            id=point.id,
+            name=point.name,
+            latitude=point.latitude,
+            longitude=point.longitude,
+            distance_km=round(distance_km, 3),
+        )
+        for point, distance_km in spot_index.nearest(lat, lon, radius_km, limit)
+    ]
+
+
+@router.get(
+    "/clusters",
+    status_code=status.HTTP_200_OK,
+    response_model=list[SpotClusterResponse],
+)
+async def list_spot_clusters_endpoint(
+    current_user: CurrentUser,
+    db: db_dependency,
+    zoom: int = Query(ge=0, le=MAX_CLUSTER_ZOOM),
+    bbox: str | None = Query(default=None, description="minLon,minLat,maxLon,maxLat"),
+) -> list[SpotClusterResponse]:
+    if bbox is None and zoom > MAX_UNBOUNDED_CLUSTER_ZOOM:
+        raise ValidationError(f"bbox is required above zoom {MAX_UNBOUNDED_CLUSTER_ZOOM}")
+    bounds = _parse_bbox(bbox) if bbox is not None else ()
+    await spot_index.ensure_loaded(db)
+    return [SpotClusterResponse(**cluster._asdict()) for cluster in spot_index.clusters(zoom, *bounds)]
+
 
 @router.get(
-    "/", status_code=status.HTTP_200_OK, response_model=list[SpotResponse]
+    "/search",
+    status_code=status.HTTP_200_OK,
+    response_model=list[SpotSearchResponse],
 )
-async def list_spots_endpoint(current_user: CurrentUser, db: db_dependency):
-    spots = await list_spots(db)
-    return spots
+async def search_spots_endpoint(
+    current_user: CurrentUser,
+    db: db_dependency,
+    q: str = Query(min_length=1, max_length=100),
+    limit: int = Query(default=10, ge=1, le=50),
+) -> list[SpotSearchResponse]:
+    points = await search_spots(db, q, limit)
+    return [SpotSearchResponse(**point._asdict()) for point in points]
 
 
 @router.get(
@@ -45,10 +183,18 @@ async def list_spot_reviews_endpoint(
     db: db_dependency,
     limit: int = Query(default=50, ge=1, le=200),
     offset: int = Query(default=0, ge=0),
+    cursor: str | None = Query(default=None, description="Opaque cursor from a previous X-Next-Cursor header"),
 ):
+    after = decode_cursor(cursor) if cursor else None
     if not await spot_exists(db, spot_id):
         raise HTTPException(status_code=404, detail="Spot not found")
-    return await list_spot_reviews(db, spot_id=spot_id, limit=limit, offset=offset)
+    reviews = await list_spot_review_rows(db, spot_id=spot_id, limit=limit + 1, offset=offset, after=after)
+    headers = {}
+    if len(reviews) > limit:
+        reviews = reviews[:limit]
+        last = reviews[-1]
+        headers[NEXT_CURSOR_HEADER] = encode_cursor(last.observed_at, last.id)
+    return RowJSONResponse([review._asdict() for review in reviews], headers=headers)
 
 
 @router.post(
@@ -1,15 +1,41 @@
-from fastapi import APIRouter, HTTPException, status
+from datetime import date, datetime
+from typing import Annotated
+
+from fastapi import APIRouter, HTTPException, Query, Request, status
+from fastapi.responses import StreamingResponse
 
 from app.api.deps import db_dependency
 from app.api.v1.auth import CurrentUser
-from app.schemas.surf_session import SurfSessionCreate, SurfSessionResponse
+from app.core.pagination import NEXT_CURSOR_HEADER, decode_cursor, encode_cursor
+from app.core.serialization import RowJSONResponse
+from app.schemas.surf_session import (
+    ExportFormat,
+    ImportFormat,
+    ListShape,
+    StatsBucket,
+    StatsRange,
+    SurfSessionCreate,
+    SurfSessionImportResponse,
+    SurfSessionNormalizedListResponse,
+    SurfSessionResponse,
+    SurfSessionStatsResponse,
+)
+from app.services.surf_session_export_service import (
+    EXPORT_MEDIA_TYPES,
+    export_filename,
+    export_surf_sessions,
+    parquet_available,
+)
+from app.services.surf_session_import_service import import_format_for, import_surf_sessions
 from app.services.surf_session_service import (
     create_surf_session,
     delete_surf_session,
+    get_related_rows_for_sessions,
     get_surf_session,
-    list_surf_sessions,
+    list_surf_session_rows,
     update_surf_session,
 )
+from app.services.surf_session_stats_service import get_surf_session_stats
 
 router = APIRouter(prefix="/surf_session", tags=["surf_session"])
 
@@ -28,12 +54,109 @@ async def create_surf_session_endpoint(
     return created
 
 
+@router.post(
+    "/import",
+    status_code=status.HTTP_200_OK,
+    response_model=SurfSessionImportResponse,
+    description=(
+        "Bulk import from a streamed CSV or NDJSON request body (`Content-Type: text/csv` or "
+        "`application/x-ndjson`, or `?format=`). Valid rows are imported; invalid ones are reported by line."
+    ),
+)
+async def import_surf_sessions_endpoint(
+    request: Request,
+    current_user: CurrentUser,
+    db: db_dependency,
+    import_format: Annotated[ImportFormat | None, Query(alias="format")] = None,
+):
+    import_format = import_format or import_format_for(request.headers.get("content-type"))
+    if import_format is None:
+        raise HTTPException(
+            status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+            detail="Upload CSV (text/csv) or NDJSON (application/x-ndjson), or pass ?format=csv|ndjson",
+        )
+    return await import_surf_sessions(db, current_user.id, request.stream(), import_format)
+
+
 @router.get(
-    "/", status_code=status.HTTP_200_OK, response_model=list[SurfSessionResponse]
+    "/",
+    status_code=status.HTTP_200_OK,
+    response_model=list[SurfSessionResponse] | SurfSessionNormalizedListResponse,
 )
-async def list_surf_sessions_endpoint(current_user: CurrentUser, db: db_dependency):
-    sessions = await list_surf_sessions(db, current_user.id)
-    return sessions
+async def list_surf_sessions_endpoint(
+    current_user: CurrentUser,
+    db: db_dependency,
+    start: Annotated[datetime | None, Query(alias="from", description="Inclusive lower bound on datetime")] = None,
+    end: Annotated[datetime | None, Query(alias="to", description="Exclusive upper bound on datetime")] = None,
+    spot_id: int | None = Query(default=None),
+    limit: int | None = Query(default=None, ge=1, le=200),
+    cursor: str | None = Query(default=None, description="Opaque cursor from a previous X-Next-Cursor header"),
+    shape: Annotated[
+        ListShape, Query(description="`normalized` returns sessions with top-level spots/surfboards keyed by id")
+    ] = "nested",
+):
+    after = decode_cursor(cursor) if cursor else None
+    normalized = shape == "normalized"
+    # Response-shaped rows rendered directly; see app.core.serialization.
+    sessions = await list_surf_session_rows(
+        db,
+        current_user.id,
+        start=start,
+        end=end,
+        spot_id=spot_id,
+        limit=limit + 1 if limit is not None else None,
+        after=after,
+        embed_related=not normalized,
+    )
+    headers = {}
+    if limit is not None and len(sessions) > limit:
+        sessions = sessions[:limit]
+        last = sessions[-1]
+        headers[NEXT_CURSOR_HEADER] = encode_cursor(last["datetime"], last["id"])
+    if normalized:
+        spots, surfboards = await get_related_rows_for_sessions(db, sessions)
+        return RowJSONResponse({"sessions": sessions, "spots": spots, "surfboards": surfboards}, headers=headers)
+    return RowJSONResponse(sessions, headers=headers)
+
+
+@router.get(
+    "/export",
+    status_code=status.HTTP_200_OK,
+    response_class=StreamingResponse,
+    description=(
+        "Every session as a streamed CSV, NDJSON or Parquet file (flat columns, oldest first). "
+        "Parquet needs pyarrow, which the api extra installs."
+    ),
+)
+async def export_surf_sessions_endpoint(
+    current_user: CurrentUser,
+    db: db_dependency,
+    export_format: Annotated[ExportFormat, Query(alias="format")] = "csv",
+):
+    if export_format == "parquet" and not parquet_available():
+        raise HTTPException(status_code=status.HTTP_501_NOT_IMPLEMENTED, detail="Parquet export is not available")
+    return StreamingResponse(
+        export_surf_sessions(db, current_user.id, export_format),
+        media_type=EXPORT_MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": f'attachment; filename="{export_filename(export_format)}"'},
+    )
+
+
+@router.get(
+    "/stats",
+    status_code=status.HTTP_200_OK,
+    response_model=SurfSessionStatsResponse,
+)
+async def get_surf_session_stats_endpoint(
+    current_user: CurrentUser,
+    db: db_dependency,
+    range_: Annotated[StatsRange, Query(alias="range")] = "week",
+    bucket: Annotated[StatsBucket | None, Query(description="Defaults to day/day/week/month per range")] = None,
+    base_date: Annotated[
+        date | None, Query(alias="date", description="Last day of the range (default today, UTC)")
+    ] = None,
+):
+    return await get_surf_session_stats(db, current_user.id, range_, bucket, base_date)
 
 
 @router.get(
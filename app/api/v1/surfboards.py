@@ -2,12 +2,13 @@ from fastapi import APIRouter, HTTPException, status
 
 from app.api.deps import db_dependency
 from app.api.v1.auth import CurrentUser
+from app.core.serialization import RowJSONResponse
 from app.schemas.surfboard import SurfboardCreate, SurfboardResponse, SurfboardUpdate
 from app.services.surfboard_service import (
     create_surfboard,
     delete_surfboard,
     get_surfboard_by_id,
-    get_surfboards_by_owner_id,
+    list_surfboard_rows,
     update_surfboard,
 )
 
@@ -31,8 +32,7 @@ async def list_surfboards_endpoint(
     current_user: CurrentUser,
     db: db_dependency,
 ):
-    surfboards = await get_surfboards_by_owner_id(db, current_user.id)
-    return surfboards
+    return RowJSONResponse(await list_surfboard_rows(db, current_user.id))
 
 @router.get(
     "/{surfboard_id}",
@@ -24,6 +24,20 @@ class Settings(BaseSettings):
     DEMO_USER_EMAIL: str = "demo@surf.local"
     DEMO_TOKEN_EXPIRE_HOURS: int = 1
     ALGORITHM: str = "HS256"
+    TOKEN_CACHE_MAX_ENTRIES: int = 10_000
+    USER_CACHE_TTL_SECONDS: int = 30
+    USER_CACHE_MAX_ENTRIES: int = 10_000
+    # On a cache miss, resolve the current user from the signed claims of tokens issued within the last
+    # USER_CACHE_TTL_SECONDS instead of querying users; older tokens are always revalidated.
+    AUTH_TRUST_TOKEN_CLAIMS: bool = False
+    PASSWORD_HASH_WORKERS: int = 4
+    PASSWORD_HASH_MAX_QUEUE: int = 32
+    OPENMETEO_MAX_CONNECTIONS: int = 20
+    OPENMETEO_MAX_KEEPALIVE_CONNECTIONS: int = 10
+    OPENMETEO_KEEPALIVE_EXPIRY_SECONDS: float = 30.0
+    OPENMETEO_HTTP2: bool = False
+    WEATHER_CACHE_TTL_SECONDS: int = 3600
+    WEATHER_CACHE_MAX_ENTRIES: int = 1024
     CORS_ALLOWED_ORIGINS: list[str] = []
     SESSION_COOKIE_SECURE: bool = False
     SECURITY_ENABLE_HSTS: bool = False
@@ -0,0 +1,24 @@
+import base64
+import binascii
+import json
+from datetime import datetime
+
+from app.core.exceptions import BusinessLogicError
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def encode_cursor(timestamp: datetime, row_id: int) -> str:
+    """Encode a ``(timestamp, id)`` keyset position as an opaque URL-safe token."""
+    raw = json.dumps([timestamp.isoformat(), row_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, int]:
+    """Decode a token produced by :func:`encode_cursor`."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        timestamp, row_id = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        return datetime.fromisoformat(timestamp), int(row_id)
+    except (ValueError, TypeError, UnicodeError, binascii.Error) as e:
+        raise BusinessLogicError("Invalid pagination cursor", code="INVALID_CURSOR") from e
@@ -0,0 +1,121 @@
+"""Dedicated executor for bcrypt, with admission control.
+
+bcrypt is deliberately slow, so password checks run off the event loop. They get
+their own small thread pool instead of the default executor behind
+``asyncio.to_thread``, which a login burst would otherwise fill for everything
+else that uses it. At most ``PASSWORD_HASH_WORKERS`` hashes run at once and
+``PASSWORD_HASH_MAX_QUEUE`` more may wait; past that a call fails fast with
+``PasswordHashingBusy`` (429) rather than queueing behind the burst.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, TypeVar
+
+from fastapi import status
+
+from app.core.config import settings
+from app.core.exceptions import BusinessLogicError
+
+T = TypeVar("T")
+
+logger = logging.getLogger(__name__)
+
+
+class PasswordHashingBusy(BusinessLogicError):
+    """Raised when the password hashing queue is full."""
+
+    def __init__(self) -> None:
+        super().__init__(
+            "Too many concurrent sign-in attempts, please retry shortly",
+            code="PASSWORD_HASHING_BUSY",
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+        )
+
+
+def _timed(submitted_at: float, fn: Callable[..., T], args: tuple) -> tuple[T, float, float]:
+    started_at = time.perf_counter()
+    result = fn(*args)
+    return result, started_at - submitted_at, time.perf_counter() - started_at
+
+
+class PasswordHashPool:
+    def __init__(self, workers: int, max_queue: int) -> None:
+        self.workers = workers
+        self.max_queue = max_queue
+        self._executor: ThreadPoolExecutor | None = None
+        # Completion callbacks run on worker threads, so counters are guarded.
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._completed = 0
+        self._rejected = 0
+        self._wait_seconds_total = 0.0
+        self._hash_seconds_total = 0.0
+        self._hash_seconds_max = 0.0
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="password-hash")
+        return self._executor
+
+    async def run(self, fn: Callable[..., T], *args: Any) -> T:
+        """``fn(*args)`` on the hashing pool; raises ``PasswordHashingBusy`` when the queue is full."""
+        with self._lock:
+            if self._in_flight >= self.workers + self.max_queue:
+                self._rejected += 1
+                logger.warning("password_hashing_rejected", extra={"in_flight": self._in_flight})
+                raise PasswordHashingBusy()
+            self._in_flight += 1
+        try:
+            future = self._get_executor().submit(_timed, time.perf_counter(), fn, args)
+        except BaseException:
+            with self._lock:
+                self._in_flight -= 1
+            raise
+        # Release the slot when the hash really finishes, not when a cancelled caller stops waiting.
+        future.add_done_callback(self._finished)
+        result, _, _ = await asyncio.wrap_future(future)
+        return result
+
+    def _finished(self, future: Future) -> None:
+        timings = None if future.cancelled() or future.exception() is not None else future.result()
+        with self._lock:
+            self._in_flight -= 1
+            if timings is None:
+                return
+            _, wait_seconds, hash_seconds = timings
+            self._completed += 1
+            self._wait_seconds_total += wait_seconds
+            self._hash_seconds_total += hash_seconds
+            self._hash_seconds_max = max(self._hash_seconds_max, hash_seconds)
+
+    def shutdown(self) -> None:
+        """Stop the worker threads; the next ``run`` starts a fresh executor."""
+        if self._executor is not None:
+            self._executor.shutdown(cancel_futures=True)
+            self._executor = None
+
+    def metrics(self) -> dict[str, Any]:
+        """Queue depth and latency counters for sizing the pool against login peaks."""
+        with self._lock:
+            completed = self._completed
+            return {
+                "workers": self.workers,
+                "max_queue": self.max_queue,
+                "in_flight": self._in_flight,
+                "queue_depth": max(0, self._in_flight - self.workers),
+                "completed": completed,
+                "rejected": self._rejected,
+                "avg_wait_ms": round(self._wait_seconds_total / completed * 1000, 3) if completed else 0.0,
+                "avg_hash_ms": round(self._hash_seconds_total / completed * 1000, 3) if completed else 0.0,
+                "max_hash_ms": round(self._hash_seconds_max * 1000, 3),
+            }
+
+
+password_hash_pool = PasswordHashPool(settings.PASSWORD_HASH_WORKERS, settings.PASSWORD_HASH_MAX_QUEUE)
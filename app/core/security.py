@@ -1,9 +1,13 @@
+import hashlib
+import time
 from datetime import datetime, timedelta, timezone
+from typing import Any
 
 import bcrypt
 from jose import JWTError, jwt
 
 from app.core.config import settings
+from app.core.ttl_lru import TtlLru
 
 
 def hash_password(password: str) -> str:
@@ -15,19 +19,34 @@ def verify_password(password: str, hashed_password: str) -> bool:
 
 
 def create_access_token(
-    data: dict[str, str | int], expires_delta: timedelta | None = None
+    data: dict[str, str | int | bool], expires_delta: timedelta | None = None
 ) -> str:
     to_encode = data.copy()
     expire_delta = expires_delta or timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
-    expire = datetime.now(timezone.utc) + expire_delta
-    to_encode.update({"exp": int(expire.timestamp())})
+    now = datetime.now(timezone.utc)
+    expire = now + expire_delta
+    to_encode.update({"iat": int(now.timestamp()), "exp": int(expire.timestamp())})
     encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
     return encoded_jwt
 
 
+# Verified payloads keyed by a SHA-256 digest of the token, so the raw token never becomes a key,
+# each kept until its ``exp``. Only tokens that decoded successfully are stored, so a hit stands in
+# for the signature and claim checks.
+decoded_token_cache: TtlLru[bytes, dict[str, Any]] = TtlLru(settings.TOKEN_CACHE_MAX_ENTRIES, clock=time.time)
+
+
 def verify_token(token: str) -> dict | None:
+    key = hashlib.sha256(token.encode("utf-8")).digest()
+    payload = decoded_token_cache.get(key)
+    if payload is not None:
+        # Callers get their own dict so the cached payload cannot be mutated.
+        return dict(payload)
     try:
         payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
-        return payload
     except JWTError:
         return None
+    expires_at = payload.get("exp")
+    if isinstance(expires_at, int | float):
+        decoded_token_cache.put(key, payload, expires_at=expires_at)
+    return dict(payload)
@@ -0,0 +1,49 @@
+"""JSON rendering for list endpoints that build their bodies from Core rows.
+
+Those endpoints skip ORM hydration and ``response_model`` validation: their dicts
+hold trusted column values in the response schema's field order, so encoding them
+the way FastAPI would encode the validated models gives byte-identical output.
+"""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Iterable
+from datetime import date, datetime
+from typing import Any
+
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+from sqlalchemy import Column, Table
+
+
+def _encode_temporal(value: Any) -> str:
+    if isinstance(value, datetime):
+        text = value.isoformat()
+        # Pydantic writes a UTC offset as "Z".
+        return text[:-6] + "Z" if text.endswith("+00:00") else text
+    if isinstance(value, date):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+class RowJSONResponse(JSONResponse):
+    """``JSONResponse`` whose content may still hold ``datetime``/``date`` values."""
+
+    def render(self, content: Any) -> bytes:
+        return json.dumps(
+            content,
+            ensure_ascii=False,
+            allow_nan=False,
+            indent=None,
+            separators=(",", ":"),
+            default=_encode_temporal,
+        ).encode("utf-8")
+
+
+def schema_columns(
+    schema: type[BaseModel], table: Table, fields: Iterable[str] | None = None
+) -> tuple[tuple[str, ...], tuple[Column, ...]]:
+    """``(keys, columns)`` for the schema fields ``table`` stores, in schema field order."""
+    keys = tuple(name for name in (fields if fields is not None else schema.model_fields) if name in table.c)
+    return keys, tuple(table.c[name] for name in keys)
@@ -1,5 +1,6 @@
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.engine import make_url
-from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
 from app.core.config import settings
 
@@ -16,3 +17,10 @@ if not url.drivername.startswith("sqlite"):
     })
 async_engine = create_async_engine(settings.database_url, **engine_kwargs)
 async_session = async_sessionmaker(bind=async_engine, expire_on_commit=False)
+
+
+def dialect_insert(db: AsyncSession):
+    """``insert`` construct with ``on_conflict_*`` support for the session's backend."""
+    if db.get_bind().dialect.name == "sqlite":
+        return sqlite.insert
+    return postgresql.insert
@@ -1,32 +1,123 @@
+import asyncio
+import importlib.util
+import logging
 from datetime import date
-from typing import Any, Dict
+from typing import Any, Dict, List, Sequence, Tuple
 
 import httpx
 
+from app.core.config import settings
 from app.core.exceptions import ExternalAPIError
 
+logger = logging.getLogger(__name__)
+
+MARINE_URL = "https://marine-api.open-meteo.com/v1/marine"
+FORECAST_URL = "https://api.open-meteo.com/v1/forecast"
+
+MARINE_HOURLY = "wave_height,wave_period,wave_direction"
+WEATHER_HOURLY = "wind_speed_10m,wind_direction_10m"
+
+# The marine API assembles wave models per request and is the slower of the two.
+MARINE_TIMEOUT = httpx.Timeout(20.0, connect=5.0)
+FORECAST_TIMEOUT = httpx.Timeout(10.0, connect=5.0)
+
+
+def build_http_client() -> httpx.AsyncClient:
+    """Pooled keep-alive client for Open-Meteo, sized by the ``OPENMETEO_*`` settings."""
+    http2 = settings.OPENMETEO_HTTP2
+    if http2 and importlib.util.find_spec("h2") is None:
+        # httpx needs the optional h2 package (``httpx[http2]``) to negotiate HTTP/2.
+        logger.warning("openmeteo_http2_unavailable")
+        http2 = False
+    return httpx.AsyncClient(
+        timeout=FORECAST_TIMEOUT,
+        limits=httpx.Limits(
+            max_connections=settings.OPENMETEO_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.OPENMETEO_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=settings.OPENMETEO_KEEPALIVE_EXPIRY_SECONDS,
+        ),
+        http2=http2,
+    )
+
 
 class OpenMeteoClient:
     """
     Minimal async client for Open-Meteo marine + weather endpoints.
+
+    One instance is meant to live as long as its process (the API lifespan or the
+    worker) so requests reuse pooled connections instead of opening new ones.
+
+    Identical requests (same URL and params) made while one is already in flight
+    are coalesced: every caller awaits the first one's result, so they share the
+    same decoded body and must not mutate it.
     """
 
-    def __init__(self, http_client: httpx.AsyncClient | None = None) -> None:
+    def __init__(
+        self,
+        http_client: httpx.AsyncClient | None = None,
+        marine_url: str = MARINE_URL,
+        forecast_url: str = FORECAST_URL,
+    ) -> None:
         """
         Initialize the OpenMeteo client.
 
         Args:
             http_client: Optional httpx.AsyncClient for dependency injection (useful for testing).
-                If not provided, a new client will be created.
+                If not provided, a pooled client from ``build_http_client`` is created and owned.
+            marine_url: Marine endpoint, overridable to point at a local stub.
+            forecast_url: Weather endpoint, overridable to point at a local stub.
         """
-        self._http = http_client if http_client is not None else httpx.AsyncClient(timeout=20)
+        self._http = http_client if http_client is not None else build_http_client()
         self._owns_client = http_client is None
+        self.marine_url = marine_url
+        self.forecast_url = forecast_url
+        self._in_flight: Dict[Tuple[str, Tuple[Tuple[str, str], ...]], asyncio.Future] = {}
+        self.requests = 0
+        self.coalesced = 0
 
     async def aclose(self) -> None:
         """Close the HTTP client if we own it."""
         if self._owns_client:
             await self._http.aclose()
 
+    def metrics(self) -> Dict[str, Any]:
+        """How many calls were answered by joining a request already in flight."""
+        return {
+            "requests": self.requests,
+            "upstream_requests": self.requests - self.coalesced,
+            "coalesced": self.coalesced,
+            "coalescing_ratio": round(self.coalesced / self.requests, 4) if self.requests else 0.0,
+            "in_flight": len(self._in_flight),
+        }
+
+    async def _get(self, url: str, params: Dict[str, Any], timeout: httpx.Timeout, api: str) -> Any:
+        key = (url, tuple(sorted((name, str(value)) for name, value in params.items())))
+        self.requests += 1
+        future = self._in_flight.get(key)
+        if future is None:
+            future = self._in_flight[key] = asyncio.ensure_future(self._fetch(url, params, timeout, api))
+            future.add_done_callback(lambda done: self._request_done(key, done))
+        else:
+            self.coalesced += 1
+        # Shielded so one caller giving up does not cancel the request for the others.
+        return await asyncio.shield(future)
+
+    def _request_done(self, key: Tuple[str, Tuple[Tuple[str, str], ...]], future: asyncio.Future) -> None:
+        self._in_flight.pop(key, None)
+        if not future.cancelled():
+            # Mark the error retrieved even if every caller was cancelled before it arrived.
+            future.exception()
+
+    async def _fetch(self, url: str, params: Dict[str, Any], timeout: httpx.Timeout, api: str) -> Any:
+        try:
+            resp = await self._http.get(url, params=params, timeout=timeout)
+            resp.raise_for_status()
+            return resp.json()
+        except httpx.HTTPError as e:
+            raise ExternalAPIError(
+                f"OpenMeteo {api} API error: {str(e)}", original_error=e
+            ) from e
+
     async def get_marine_hourly_forecast(
         self,
         lat: float,
@@ -39,24 +130,16 @@ class OpenMeteoClient:
         Fetch hourly marine forecast (waves) for a given date range.
         Uses: https://marine-api.open-meteo.com/v1/marine
         """
-        url = "https://marine-api.open-meteo.com/v1/marine"
         params = {
             "latitude": lat,
             "longitude": lon,
             # wave_* fields from the marine API
-            "hourly": "wave_height,wave_period,wave_direction",
+            "hourly": MARINE_HOURLY,
             "start_date": start_date.isoformat(),
             "end_date": end_date.isoformat(),
             "timezone": timezone,
         }
-        try:
-            resp = await self._http.get(url, params=params)
-            resp.raise_for_status()
-            return resp.json()
-        except httpx.HTTPError as e:
-            raise ExternalAPIError(
-                f"OpenMeteo Marine API error: {str(e)}", original_error=e
-            ) from e
+        return await self._get(self.marine_url, params, MARINE_TIMEOUT, "Marine")
 
     async def get_weather_hourly_forecast(
         self,
@@ -70,21 +153,58 @@ class OpenMeteoClient:
         Fetch hourly weather forecast (wind at 10m) for a given date range.
         Uses: https://api.open-meteo.com/v1/forecast
         """
-        url = "https://api.open-meteo.com/v1/forecast"
         params = {
             "latitude": lat,
             "longitude": lon,
             # wind_* fields are documented as valid hourly variables
-            "hourly": "wind_speed_10m,wind_direction_10m",
+            "hourly": WEATHER_HOURLY,
             "start_date": start_date.isoformat(),
             "end_date": end_date.isoformat(),
             "timezone": timezone,
         }
-        try:
-            resp = await self._http.get(url, params=params)
-            resp.raise_for_status()
-            return resp.json()
-        except httpx.HTTPError as e:
-            raise ExternalAPIError(
-                f"OpenMeteo Weather API error: {str(e)}", original_error=e
-            ) from e
+        return await self._get(self.forecast_url, params, FORECAST_TIMEOUT, "Weather")
+
+    async def get_marine_hourly_forecasts(
+        self,
+        coordinates: Sequence[Tuple[float, float]],
+        start_date: date,
+        end_date: date,
+        timezone: str = "GMT",
+    ) -> List[Dict[str, Any]]:
+        """
+        Hourly marine forecasts for several (lat, lon) points in one request, in input order.
+        """
+        params = _batch_params(coordinates, MARINE_HOURLY, start_date, end_date, timezone)
+        return _as_list(await self._get(self.marine_url, params, MARINE_TIMEOUT, "Marine"))
+
+    async def get_weather_hourly_forecasts(
+        self,
+        coordinates: Sequence[Tuple[float, float]],
+        start_date: date,
+        end_date: date,
+        timezone: str = "GMT",
+    ) -> List[Dict[str, Any]]:
+        """
+        Hourly weather forecasts for several (lat, lon) points in one request, in input order.
+        """
+        params = _batch_params(coordinates, WEATHER_HOURLY, start_date, end_date, timezone)
+        return _as_list(await self._get(self.forecast_url, params, FORECAST_TIMEOUT, "Weather"))
+
+
+def _batch_params(
+    coordinates: Sequence[Tuple[float, float]], hourly: str, start_date: date, end_date: date, timezone: str
+) -> Dict[str, Any]:
+    # Open-Meteo takes comma-separated coordinate lists and answers with one object per location.
+    return {
+        "latitude": ",".join(str(lat) for lat, _ in coordinates),
+        "longitude": ",".join(str(lon) for _, lon in coordinates),
+        "hourly": hourly,
+        "start_date": start_date.isoformat(),
+        "end_date": end_date.isoformat(),
+        "timezone": timezone,
+    }
+
+
+def _as_list(data: Any) -> List[Dict[str, Any]]:
+    # A single location comes back as a bare object rather than a one-element array.
+    return data if isinstance(data, list) else [data]
@@ -0,0 +1,149 @@
+"""Local stand-in for the Open-Meteo marine and forecast endpoints.
+
+A small Starlette app that answers ``/v1/marine`` and ``/v1/forecast`` in
+Open-Meteo's response shape, so ``OpenMeteoClient``, ``get_surf_report`` and the
+worker's batched ingestion can be exercised and load-tested offline:
+
+- comma-separated ``latitude``/``longitude`` lists get one object per location in
+  a JSON array, a single location a bare object, as the real API does;
+- hourly values are synthetic but deterministic: a function of the coordinates
+  and the hour only, so repeated requests and separate runs agree;
+- ``latency_ms`` (plus up to ``jitter_ms``) delays every response and
+  ``error_rate`` turns that share of requests into ``error_status`` errors, drawn
+  from a ``seed``-ed generator so a run is reproducible.
+
+In process, mount it under ``httpx.ASGITransport``; the client's default URLs
+route to it unchanged. Over TCP::
+
+    uvicorn --factory app.external_apis.openmeteo_stub:create_openmeteo_stub --port 8081
+"""
+
+from __future__ import annotations
+
+import asyncio
+import math
+import random
+from collections import Counter
+from collections.abc import Callable
+from datetime import date, datetime, timedelta
+from typing import Any
+
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+
+EPOCH = datetime(1970, 1, 1)
+HOURLY_UNITS = {
+    "time": "iso8601",
+    "wave_height": "m",
+    "wave_period": "s",
+    "wave_direction": "°",
+    "wind_speed_10m": "km/h",
+    "wind_direction_10m": "°",
+}
+
+
+def _phase(lat: float, lon: float) -> float:
+    return (lat * 7.3 + lon * 3.1) % (2 * math.pi)
+
+
+def _series(variable: str, lat: float, lon: float, hours: list[int]) -> list[float | int]:
+    """Deterministic synthetic values for ``variable`` at hours since the epoch."""
+    phase = _phase(lat, lon)
+    if variable == "wave_height":
+        return [round(1.2 + 0.8 * math.sin(h * math.pi / 12 + phase), 2) for h in hours]
+    if variable == "wave_period":
+        return [round(10.0 + 3.0 * math.sin(h * math.pi / 36 + phase), 2) for h in hours]
+    if variable == "wave_direction":
+        return [int(270 + 40 * math.sin(h * math.pi / 48 + phase)) % 360 for h in hours]
+    if variable == "wind_speed_10m":
+        return [round(6.0 + 14.0 * abs(math.sin(h * math.pi / 16 + phase)), 1) for h in hours]
+    if variable == "wind_direction_10m":
+        return [int(math.degrees(phase) + 15 * h) % 360 for h in hours]
+    raise KeyError(variable)
+
+
+def _error(reason: str, status_code: int = 400) -> JSONResponse:
+    return JSONResponse({"error": True, "reason": reason}, status_code=status_code)
+
+
+def _location(lat: float, lon: float, variables: list[str], start: date, end: date, timezone: str) -> dict[str, Any]:
+    first = datetime.combine(start, datetime.min.time())
+    count = ((end - start).days + 1) * 24
+    stamps = [first + timedelta(hours=h) for h in range(count)]
+    hours = [(stamp - EPOCH) // timedelta(hours=1) for stamp in stamps]
+    hourly: dict[str, list] = {"time": [stamp.strftime("%Y-%m-%dT%H:%M") for stamp in stamps]}
+    for variable in variables:
+        hourly[variable] = _series(variable, lat, lon, hours)
+    return {
+        "latitude": lat,
+        "longitude": lon,
+        "generationtime_ms": 0.1,
+        "utc_offset_seconds": 0,
+        "timezone": timezone,
+        "timezone_abbreviation": timezone,
+        "elevation": 0.0,
+        "hourly_units": {name: HOURLY_UNITS[name] for name in hourly},
+        "hourly": hourly,
+    }
+
+
+def create_openmeteo_stub(
+    latency_ms: float = 0.0,
+    jitter_ms: float = 0.0,
+    error_rate: float = 0.0,
+    error_status: int = 503,
+    seed: int = 0,
+) -> Starlette:
+    """Stub app; ``app.state.requests`` and ``app.state.errors`` count calls per endpoint path."""
+    rng = random.Random(seed)
+    requests: Counter[str] = Counter()
+    errors: Counter[str] = Counter()
+
+    def endpoint(variables_allowed: frozenset[str]) -> Callable:
+        async def handle(request: Request) -> JSONResponse:
+            requests[request.url.path] += 1
+            # Draw both values up front so the sequence does not depend on which branch runs.
+            delay = latency_ms + jitter_ms * rng.random()
+            fail = rng.random() < error_rate
+            if delay:
+                await asyncio.sleep(delay / 1000)
+            if fail:
+                errors[request.url.path] += 1
+                return _error("Injected stub failure", error_status)
+
+            params = request.query_params
+            try:
+                lats = [float(v) for v in params["latitude"].split(",")]
+                lons = [float(v) for v in params["longitude"].split(",")]
+                start = date.fromisoformat(params["start_date"])
+                end = date.fromisoformat(params["end_date"])
+            except (KeyError, ValueError) as e:
+                return _error(f"Invalid or missing parameter: {e}")
+            if len(lats) != len(lons):
+                return _error("Parameter 'latitude' and 'longitude' must have the same number of elements")
+            if end < start:
+                return _error("Parameter 'end_date' must not be before 'start_date'")
+            variables = [v for v in params.get("hourly", "").split(",") if v]
+            unknown = [v for v in variables if v not in variables_allowed]
+            if unknown:
+                return _error(f"Cannot initialize WeatherVariable from invalid String value {unknown[0]}")
+
+            timezone = params.get("timezone", "GMT")
+            locations = [
+                _location(lat, lon, variables, start, end, timezone) for lat, lon in zip(lats, lons, strict=True)
+            ]
+            return JSONResponse(locations if len(locations) > 1 else locations[0])
+
+        return handle
+
+    app = Starlette(
+        routes=[
+            Route("/v1/marine", endpoint(frozenset({"wave_height", "wave_period", "wave_direction"}))),
+            Route("/v1/forecast", endpoint(frozenset({"wind_speed_10m", "wind_direction_10m"}))),
+        ]
+    )
+    app.state.requests = requests
+    app.state.errors = errors
+    return app
@@ -3,7 +3,7 @@ import time
 import uuid
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI, Request, status
+from fastapi import Depends, FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from sqlalchemy import text
@@ -14,10 +14,16 @@ from app.admin import init_admin
 from app.api.v1 import auth, spots, surf_sessions, surfboards
 from app.core.config import settings
 from app.core.exceptions import BusinessLogicError, ExternalAPIError, ValidationError
-from app.database import async_engine
+from app.core.pagination import NEXT_CURSOR_HEADER
+from app.core.password_hashing import password_hash_pool
+from app.core.security import decoded_token_cache
+from app.database import async_engine, async_session
+from app.external_apis import OpenMeteoClient
 from app.logging import configure_logging, request_id_var
 from app.routers import weather
 from app.schemas.error import ErrorResponse
+from app.services.spot_index import spot_index
+from app.services.weather_service import get_openmeteo_client, set_openmeteo_client
 
 logger = logging.getLogger(__name__)
 
@@ -25,7 +31,20 @@ logger = logging.getLogger(__name__)
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     configure_logging()
-    yield
+    openmeteo = OpenMeteoClient()
+    set_openmeteo_client(openmeteo)
+    try:
+        async with async_session() as session:
+            await spot_index.ensure_loaded(session)
+    except Exception:
+        # The index loads lazily on first use, so a cold start without a DB is not fatal.
+        logger.warning("spot_index_warmup_failed", exc_info=True)
+    try:
+        yield
+    finally:
+        set_openmeteo_client(None)
+        await openmeteo.aclose()
+        password_hash_pool.shutdown()
 
 
 class RequestContextMiddleware(BaseHTTPMiddleware):
@@ -85,8 +104,8 @@ if settings.CORS_ALLOWED_ORIGINS:
         allow_origins=settings.CORS_ALLOWED_ORIGINS,
         allow_credentials=False,
         allow_methods=["GET", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"],
-        allow_headers=["Authorization", "Content-Type", "X-Request-ID"],
-        expose_headers=["X-Request-ID"],
+        allow_headers=["Authorization", "Content-Type", "X-Request-ID", "If-None-Match"],
+        expose_headers=["X-Request-ID", "ETag", NEXT_CURSOR_HEADER],
     )
 app.add_middleware(SecurityHeadersMiddleware, enable_hsts=settings.SECURITY_ENABLE_HSTS)
 admin = init_admin(app)
@@ -108,6 +127,23 @@ async def healthcheck():
             content={"status": "error", "db": "down"},
         )
 
+
+@app.get("/health/password-hashing", tags=["health"], dependencies=[Depends(auth.require_admin_user)])
+async def password_hashing_metrics():
+    return password_hash_pool.metrics()
+
+
+@app.get("/health/token-cache", tags=["health"], dependencies=[Depends(auth.require_admin_user)])
+async def token_cache_metrics():
+    return decoded_token_cache.metrics()
+
+
+@app.get("/health/openmeteo", tags=["health"], dependencies=[Depends(auth.require_admin_user)])
+async def openmeteo_metrics():
+    client = get_openmeteo_client()
+    return client.metrics() if client is not None else {}
+
+
 @app.exception_handler(BusinessLogicError)
 async def business_logic_error_handler(request: Request, exc: BusinessLogicError):
     logger.warning(
@@ -1,10 +1,13 @@
 from app.models.base import Base
 
 from .forecast import Forecast
+from .model_forecast import ModelForecast
 from .spot import Spot, SpotDifficulty
+from .spot_review_daily import SpotReviewDaily
 from .surf_forecast import SurfForecast
 from .surf_session import SurfSession
 from .surf_session_review import SurfSessionReview
 from .surfboard import Surfboard
 from .tide import Tide, TideType
+from .user_activity_daily import UserActivityDaily
 from .users import User
@@ -0,0 +1,27 @@
+import datetime
+
+from sqlalchemy import Column, DateTime, Float, ForeignKey, Integer
+from sqlalchemy.orm import relationship
+
+from .base import Base
+
+
+class ModelForecast(Base):
+    """Hourly numerical-model forecast (Open-Meteo) for a spot with coordinates.
+
+    A second source next to the scraped ``surf_forecasts``; directions stay in degrees.
+    """
+
+    __tablename__ = "model_forecasts"
+
+    spot_id = Column(Integer, ForeignKey("spots.id", ondelete="CASCADE"), primary_key=True)
+    timestamp = Column(DateTime, primary_key=True, index=True)
+
+    wave_height = Column(Float, nullable=True)
+    wave_period = Column(Float, nullable=True)
+    wave_direction = Column(Float, nullable=True)
+    wind_speed = Column(Float, nullable=True)
+    wind_direction = Column(Float, nullable=True)
+    updated_at = Column(DateTime, nullable=True, default=datetime.datetime.utcnow, onupdate=datetime.datetime.utcnow)
+
+    spot = relationship("Spot", back_populates="model_forecasts", passive_deletes=True)
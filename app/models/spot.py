@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from enum import IntEnum
 
-from sqlalchemy import JSON, Column, Float, Integer, String
+from sqlalchemy import JSON, Column, Float, Index, Integer, String
 from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.orm import relationship
 
@@ -61,3 +61,19 @@ class Spot(Base):
         cascade="all, delete",
         passive_deletes=True,
     )
+    model_forecasts = relationship(
+        "ModelForecast",
+        back_populates="spot",
+        cascade="all, delete",
+        passive_deletes=True,
+    )
+
+    __table_args__ = (
+        # Trigram index behind GET /spot/search; needs the pg_trgm extension, so PostgreSQL only.
+        Index(
+            "ix_spots_name_trgm",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        ).ddl_if(dialect="postgresql"),
+    )
@@ -0,0 +1,38 @@
+from sqlalchemy import Column, Date, DateTime, Float, ForeignKey, Integer
+
+from .base import Base
+
+
+class SpotReviewDaily(Base):
+    """Per-spot, per-day running sums of review metrics.
+
+    Every metric keeps a count plus recency-weighted sums so the weighted average
+    can be read back without touching ``surf_session_reviews``.
+    """
+
+    __tablename__ = "spot_review_daily"
+
+    spot_id = Column(Integer, ForeignKey("spots.id", ondelete="CASCADE"), primary_key=True)
+    date = Column(Date, primary_key=True)
+    review_count = Column(Integer, nullable=False, default=0, server_default="0")
+    latest_observed_at = Column(DateTime, nullable=True)
+
+    quality_count = Column(Integer, nullable=False, default=0, server_default="0")
+    quality_weighted_sum = Column(Float, nullable=False, default=0.0, server_default="0")
+    quality_weight_sum = Column(Float, nullable=False, default=0.0, server_default="0")
+
+    crowded_level_count = Column(Integer, nullable=False, default=0, server_default="0")
+    crowded_level_weighted_sum = Column(Float, nullable=False, default=0.0, server_default="0")
+    crowded_level_weight_sum = Column(Float, nullable=False, default=0.0, server_default="0")
+
+    wave_height_index_count = Column(Integer, nullable=False, default=0, server_default="0")
+    wave_height_index_weighted_sum = Column(Float, nullable=False, default=0.0, server_default="0")
+    wave_height_index_weight_sum = Column(Float, nullable=False, default=0.0, server_default="0")
+
+    short_long_index_count = Column(Integer, nullable=False, default=0, server_default="0")
+    short_long_index_weighted_sum = Column(Float, nullable=False, default=0.0, server_default="0")
+    short_long_index_weight_sum = Column(Float, nullable=False, default=0.0, server_default="0")
+
+    wind_index_count = Column(Integer, nullable=False, default=0, server_default="0")
+    wind_index_weighted_sum = Column(Float, nullable=False, default=0.0, server_default="0")
+    wind_index_weight_sum = Column(Float, nullable=False, default=0.0, server_default="0")
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, DateTime, Float, ForeignKey, Integer, String, func
+from sqlalchemy import Column, DateTime, Float, ForeignKey, Index, Integer, String, func
 from sqlalchemy.orm import relationship
 
 from .base import Base
@@ -49,3 +49,12 @@ class SurfSession(Base):
         cascade="all, delete-orphan",
         passive_deletes=True,
     )
+
+    __table_args__ = (
+        Index(
+            "ix_surf_sessions_user_datetime_id",
+            "user_id",
+            datetime.desc(),
+            id.desc(),
+        ),
+    )
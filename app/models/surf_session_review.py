@@ -1,4 +1,4 @@
-from sqlalchemy import Column, DateTime, ForeignKey, Integer, func
+from sqlalchemy import Column, DateTime, ForeignKey, Index, Integer, func
 from sqlalchemy.orm import relationship
 
 from .base import Base
@@ -34,3 +34,12 @@ class SurfSessionReview(Base):
     surf_session = relationship("SurfSession", back_populates="review")
     spot = relationship("Spot", back_populates="surf_session_reviews")
     user = relationship("User", back_populates="surf_session_reviews")
+
+    __table_args__ = (
+        Index(
+            "ix_surf_session_reviews_spot_observed_id",
+            "spot_id",
+            observed_at.desc(),
+            id.desc(),
+        ),
+    )
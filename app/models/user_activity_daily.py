@@ -0,0 +1,22 @@
+from sqlalchemy import Column, Date, ForeignKey, Integer
+
+from .base import Base
+
+
+class UserActivityDaily(Base):
+    """Per-user, per-day, per-spot running totals of surf sessions.
+
+    Dashboard statistics read these rows instead of scanning ``surf_sessions``;
+    summing over ``spot_id`` gives the daily totals and grouping by it the spot
+    breakdown.
+    """
+
+    __tablename__ = "user_activity_daily"
+
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    date = Column(Date, primary_key=True)
+    spot_id = Column(Integer, ForeignKey("spots.id", ondelete="CASCADE"), primary_key=True)
+    session_count = Column(Integer, nullable=False, default=0, server_default="0")
+    total_minutes = Column(Integer, nullable=False, default=0, server_default="0")
+    reviewed_count = Column(Integer, nullable=False, default=0, server_default="0")
+    quality_sum = Column(Integer, nullable=False, default=0, server_default="0")
@@ -33,3 +33,29 @@ class SpotResponse(BaseModel):
     surf_forecast_name: str | None = None
     review_summary: SpotReviewSummaryResponse | None = None
     recent_reviews: list[SpotReviewResponse] = Field(default_factory=list)
+
+
+class SpotNearbyResponse(BaseModel):
+    """Schema for a spot returned by the nearby search."""
+    id: int
+    name: str
+    latitude: float
+    longitude: float
+    distance_km: float
+
+
+class SpotClusterResponse(BaseModel):
+    """Schema for a map marker cluster; ``spot_id``/``name`` are set when it holds a single spot."""
+    latitude: float
+    longitude: float
+    count: int
+    spot_id: int | None = None
+    name: str | None = None
+
+
+class SpotSearchResponse(BaseModel):
+    """Schema for a spot name autocomplete suggestion."""
+    id: int
+    name: str
+    latitude: float | None = None
+    longitude: float | None = None
@@ -1,4 +1,5 @@
-from datetime import datetime
+from datetime import date, datetime
+from typing import Literal
 
 from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 
@@ -39,7 +40,17 @@ class SurfSessionCreate(SurfSessionBase):
         return self
 
 
-class SurfSessionResponse(SurfSessionBase):
+DIRECTION_FIELDS = ("wave_dir", "wind_dir")
+
+
+def coerce_direction(v: int | str | None) -> str | None:
+    if v is None:
+        return None
+    return str(v).strip() or None
+
+
+class SurfSessionFlatResponse(SurfSessionBase):
+    """A session without its embedded spot and surfboard; they are referenced by id."""
     model_config = ConfigDict(from_attributes=True)
 
     id: int
@@ -47,8 +58,6 @@ class SurfSessionResponse(SurfSessionBase):
     surfboard_id: int | None = None
     user_id: int
     created_at: datetime
-    spot: SpotResponse
-    surfboard: SurfboardResponse | None = None
     review: SurfSessionReviewResponse | None = None
     wave_height_m: float | None = None
     wave_period: float | None = None
@@ -63,9 +72,76 @@ class SurfSessionResponse(SurfSessionBase):
     tide_low_m: float | None = None
     tide_high_m: float | None = None
 
-    @field_validator("wave_dir", "wind_dir", mode="before")
+    @field_validator(*DIRECTION_FIELDS, mode="before")
     @classmethod
     def coerce_dir_to_str(cls, v: int | str | None) -> str | None:
-        if v is None:
-            return None
-        return str(v).strip() or None
+        return coerce_direction(v)
+
+
+class SurfSessionResponse(SurfSessionFlatResponse):
+    spot: SpotResponse
+    surfboard: SurfboardResponse | None = None
+
+
+ListShape = Literal["nested", "normalized"]
+
+
+class SurfSessionNormalizedListResponse(BaseModel):
+    """``?shape=normalized`` list: each spot and surfboard appears once, keyed by id."""
+    sessions: list[SurfSessionFlatResponse]
+    spots: dict[int, SpotResponse]
+    surfboards: dict[int, SurfboardResponse]
+
+
+StatsRange = Literal["week", "month", "3month", "all"]
+StatsBucket = Literal["day", "week", "month"]
+
+
+class SurfSessionStatsBucket(BaseModel):
+    start: date
+    sessions_count: int
+    total_minutes: int
+    avg_quality: float | None = None
+
+
+class SurfSessionStatsSpot(BaseModel):
+    name: str
+    sessions_count: int
+
+
+class SurfSessionStatsSurfboard(BaseModel):
+    name: str
+    length_ft: float | None = None
+    sessions_count: int
+
+
+class SurfSessionStatsResponse(BaseModel):
+    """Dashboard aggregates for one range; ``end`` is exclusive and ``start`` is None for ``all``."""
+    range: StatsRange
+    bucket: StatsBucket
+    start: date | None = None
+    end: date
+    sessions_count: int
+    total_minutes: int
+    avg_quality: float | None = None
+    top_spot: str | None = None
+    spots: list[SurfSessionStatsSpot]
+    surfboards: list[SurfSessionStatsSurfboard]
+    buckets: list[SurfSessionStatsBucket]
+
+
+ImportFormat = Literal["csv", "ndjson"]
+ExportFormat = Literal["csv", "ndjson", "parquet"]
+
+
+class SurfSessionImportError(BaseModel):
+    line: int
+    errors: list[str]
+
+
+class SurfSessionImportResponse(BaseModel):
+    """Outcome of a bulk import; ``errors`` keeps only the first rejected lines when ``errors_truncated``."""
+    imported: int
+    failed: int
+    errors: list[SurfSessionImportError]
+    errors_truncated: bool = False
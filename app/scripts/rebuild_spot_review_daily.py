@@ -0,0 +1,29 @@
+import argparse
+import asyncio
+import sys
+
+from app.database import async_session
+from app.services.spot_review_daily_service import rebuild_spot_review_daily
+
+
+async def main() -> int:
+    parser = argparse.ArgumentParser(description="Rebuild spot_review_daily from surf_session_reviews")
+    parser.add_argument(
+        "--spot-id",
+        type=int,
+        action="append",
+        dest="spot_ids",
+        help="Only rebuild this spot (repeatable); defaults to all spots",
+    )
+    args = parser.parse_args()
+
+    async with async_session() as session:
+        rows = await rebuild_spot_review_daily(session, args.spot_ids)
+        await session.commit()
+
+    print(f"Rebuilt {rows} spot_review_daily rows")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
@@ -0,0 +1,29 @@
+import argparse
+import asyncio
+import sys
+
+from app.database import async_session
+from app.services.user_activity_daily_service import rebuild_user_activity_daily
+
+
+async def main() -> int:
+    parser = argparse.ArgumentParser(description="Rebuild user_activity_daily from surf_sessions")
+    parser.add_argument(
+        "--user-id",
+        type=int,
+        action="append",
+        dest="user_ids",
+        help="Only rebuild this user (repeatable); defaults to all users",
+    )
+    args = parser.parse_args()
+
+    async with async_session() as session:
+        rows = await rebuild_user_activity_daily(session, args.user_ids)
+        await session.commit()
+
+    print(f"Rebuilt {rows} user_activity_daily rows")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
@@ -9,7 +9,7 @@ that was opened by the request, so delete + insert are fully atomic.
 
 import asyncio
 
-from sqlalchemy import delete
+from sqlalchemy import delete, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models import SurfSession, Surfboard, SurfSessionReview
@@ -22,8 +22,11 @@ from app.scripts.seed_dev_data import (
     _parse_iso_datetime,
 )
 from app.scripts.seed_sri_lanka_west_spots import SPOTS
+from app.services.spot_catalogue_cache import bump_spot_catalogue_version
+from app.services.spot_review_daily_service import rebuild_spot_review_daily
 from app.services.surf_session_service import create_surf_session
 from app.services.surfboard_service import create_surfboard
+from app.services.user_activity_daily_service import rebuild_user_activity_daily
 from app.services.spot_service import get_spot_by_name
 
 # Global lock: only one demo reset at a time across all requests
@@ -44,10 +47,17 @@ async def reset_demo_data(db: AsyncSession, demo_user: User) -> None:
 
         # ── 1. Delete all user data ──────────────────────────────────────────
         # CASCADE should delete reviews automatically, but we delete them explicitly for reliability
+        reviewed_spots = await db.execute(
+            select(SurfSessionReview.spot_id).where(SurfSessionReview.user_id == user_id).distinct()
+        )
+        reviewed_spot_ids = reviewed_spots.scalars().all()
         await db.execute(delete(SurfSessionReview).where(SurfSessionReview.user_id == user_id))
+        await rebuild_spot_review_daily(db, reviewed_spot_ids)
         await db.execute(delete(SurfSession).where(SurfSession.user_id == user_id))
+        await rebuild_user_activity_daily(db, [user_id])
         await db.execute(delete(Surfboard).where(Surfboard.owner_id == user_id))
         await db.commit()
+        bump_spot_catalogue_version()
 
         # ── 2. Find fixtures for the demo user ───────────────────────────────
         demo_fixture = next((u for u in SAMPLE_USERS if u["email"] == demo_user.email), None)
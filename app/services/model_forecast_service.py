@@ -0,0 +1,142 @@
+"""Batched Open-Meteo ingestion into ``model_forecasts``.
+
+Every spot with coordinates gets hourly model forecasts, whether or not it has a
+``surf_forecast_name`` for the scraper. Spots are grouped into multi-location
+requests of ``MODEL_FORECAST_BATCH_SIZE`` points, one marine and one weather call
+per group, and each group's rows are upserted in one statement.
+
+Responses are parsed column-wise with NumPy, which the ``worker`` extra installs
+(timestamps as ``datetime64``, gaps as NaN, weather hours aligned to marine hours
+with a sorted search).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from datetime import date, datetime, timedelta, timezone
+from typing import Any
+
+import numpy as np
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.exceptions import ExternalAPIError
+from app.database import dialect_insert
+from app.external_apis import OpenMeteoClient
+from app.models import ModelForecast, Spot
+
+logger = logging.getLogger(__name__)
+
+MODEL_FORECAST_BATCH_SIZE = 50
+MODEL_FORECAST_DAYS = 7
+
+# model_forecasts column -> Open-Meteo hourly variable
+MARINE_VARIABLES = {"wave_height": "wave_height", "wave_period": "wave_period", "wave_direction": "wave_direction"}
+WEATHER_VARIABLES = {"wind_speed": "wind_speed_10m", "wind_direction": "wind_direction_10m"}
+MODEL_FORECAST_FIELDS = (*MARINE_VARIABLES, *WEATHER_VARIABLES)
+
+
+def _padded(values: list | None, length: int) -> Any:
+    # float dtype turns JSON nulls into NaN; a short series is padded with NaN.
+    column = np.full(length, np.nan)
+    values = np.array(values or [], dtype=float)[:length]
+    column[: len(values)] = values
+    return column
+
+
+def model_forecast_rows(spot_id: int, marine: dict[str, Any], weather: dict[str, Any]) -> list[dict[str, Any]]:
+    """``model_forecasts`` rows for one location, on the marine hours, skipping hours with no values at all."""
+    marine_hourly = marine.get("hourly", {})
+    weather_hourly = weather.get("hourly", {})
+    times = np.array(marine_hourly.get("time", []), dtype="datetime64[m]")
+    if not len(times):
+        return []
+    columns = {name: _padded(marine_hourly.get(variable), len(times)) for name, variable in MARINE_VARIABLES.items()}
+
+    weather_times = np.array(weather_hourly.get("time", []), dtype="datetime64[m]")
+    if len(weather_times):
+        positions = np.minimum(np.searchsorted(weather_times, times), len(weather_times) - 1)
+        matched = weather_times[positions] == times
+    for name, variable in WEATHER_VARIABLES.items():
+        if len(weather_times):
+            series = _padded(weather_hourly.get(variable), len(weather_times))
+            columns[name] = np.where(matched, series[positions], np.nan)
+        else:
+            columns[name] = np.full(len(times), np.nan)
+
+    matrix = np.vstack([columns[name] for name in MODEL_FORECAST_FIELDS])
+    keep = ~np.isnan(matrix).all(axis=0)
+    values = matrix[:, keep].astype(object)
+    values[np.isnan(matrix[:, keep])] = None
+    stamps = times[keep].astype("datetime64[us]").tolist()
+    return [
+        {"spot_id": spot_id, "timestamp": stamp, **dict(zip(MODEL_FORECAST_FIELDS, hour, strict=True))}
+        for stamp, hour in zip(stamps, values.T.tolist(), strict=True)
+    ]
+
+
+async def upsert_model_forecasts(db: AsyncSession, rows: list[dict[str, Any]]) -> None:
+    if not rows:
+        return
+    updated_at = datetime.now(timezone.utc).replace(tzinfo=None)
+    stmt = dialect_insert(db)(ModelForecast.__table__)
+    await db.execute(
+        stmt.on_conflict_do_update(
+            index_elements=["spot_id", "timestamp"],
+            set_={name: stmt.excluded[name] for name in (*MODEL_FORECAST_FIELDS, "updated_at")},
+        ),
+        [{**row, "updated_at": updated_at} for row in rows],
+    )
+
+
+async def ingest_model_forecasts(
+    db: AsyncSession,
+    client: OpenMeteoClient,
+    start_date: date | None = None,
+    days: int = MODEL_FORECAST_DAYS,
+    batch_size: int = MODEL_FORECAST_BATCH_SIZE,
+) -> int:
+    """Fetch and upsert ``days`` of hourly forecasts for every spot with coordinates; returns rows written.
+
+    Each batch is committed on its own, and a batch the provider fails is logged and
+    skipped so one bad group does not cost the rest of the run.
+    """
+    start_date = start_date or date.today()
+    end_date = start_date + timedelta(days=days - 1)
+    result = await db.execute(
+        select(Spot.id, Spot.latitude, Spot.longitude)
+        .where(Spot.latitude.is_not(None), Spot.longitude.is_not(None))
+        .order_by(Spot.id)
+    )
+    spots = result.all()
+
+    written = 0
+    for offset in range(0, len(spots), batch_size):
+        batch = spots[offset : offset + batch_size]
+        coordinates = [(spot.latitude, spot.longitude) for spot in batch]
+        try:
+            marine, weather = await asyncio.gather(
+                client.get_marine_hourly_forecasts(coordinates, start_date, end_date),
+                client.get_weather_hourly_forecasts(coordinates, start_date, end_date),
+            )
+            if len(marine) != len(batch) or len(weather) != len(batch):
+                raise ExternalAPIError(
+                    f"OpenMeteo returned {len(marine)}/{len(weather)} locations for a batch of {len(batch)}"
+                )
+        except ExternalAPIError:
+            logger.warning(
+                "model_forecast_batch_failed",
+                exc_info=True,
+                extra={"spot_ids": [spot.id for spot in batch]},
+            )
+            continue
+        rows = [
+            row
+            for spot, spot_marine, spot_weather in zip(batch, marine, weather, strict=True)
+            for row in model_forecast_rows(spot.id, spot_marine, spot_weather)
+        ]
+        await upsert_model_forecasts(db, rows)
+        await db.commit()
+        written += len(rows)
+    return written
@@ -2,6 +2,7 @@
 
 import math
 import os
+from bisect import bisect_left, bisect_right
 from collections import Counter
 from datetime import datetime, timedelta
 from typing import Any
@@ -13,6 +14,7 @@ from app.models.surf_forecast import SurfForecast
 from app.models.tide import Tide
 
 MAX_FORECAST_OFFSET_HOURS = int(os.environ.get("MAX_FORECAST_OFFSET_HOURS", "6"))
+TIDE_WINDOW = timedelta(hours=12)
 
 
 def _hours_between(a: datetime, b: datetime) -> float:
@@ -41,6 +43,52 @@ def _first_or_most_common_direction(values: list[str | None]) -> str | None:
     return candidate
 
 
+def _summarize_forecasts(rows: list[SurfForecast]) -> dict[str, Any]:
+    wave_heights = [r.wave_height for r in rows if r.wave_height is not None]
+    periods = [r.period for r in rows if r.period is not None]
+    wind_speeds = [r.wind_speed for r in rows if r.wind_speed is not None]
+    energies = [r.energy for r in rows if r.energy is not None]
+    ratings = [r.rating for r in rows if r.rating is not None]
+    wave_dirs = [r.wave_direction for r in rows]
+    wind_dirs = [r.wind_direction for r in rows]
+
+    result: dict[str, Any] = {}
+    if wave_heights:
+        result["wave_height_m"] = sum(wave_heights) / len(wave_heights)
+    if periods:
+        result["wave_period"] = sum(periods) / len(periods)
+    if wind_speeds:
+        result["wind_speed_kmh"] = sum(wind_speeds) / len(wind_speeds)
+    if energies:
+        result["energy"] = sum(energies) / len(energies)
+    if ratings:
+        result["rating"] = round(sum(ratings) / len(ratings))
+    wd = _first_or_most_common_direction(wave_dirs)
+    if wd is not None:
+        result["wave_dir"] = wd
+    wnd = _first_or_most_common_direction(wind_dirs)
+    if wnd is not None:
+        result["wind_dir"] = wnd
+    return result
+
+
+def _closest_forecast(
+    candidates: list[SurfForecast],
+    start: datetime,
+    end: datetime,
+    max_offset_hours: int,
+) -> SurfForecast | None:
+    if not candidates:
+        return None
+    closest = min(
+        candidates,
+        key=lambda r: _distance_to_window(r.timestamp, start, end),
+    )
+    if _distance_to_window(closest.timestamp, start, end) > max_offset_hours:
+        return None
+    return closest
+
+
 async def get_weather_for_session(
     db: AsyncSession,
     spot_id: int,
@@ -74,43 +122,12 @@ async def get_weather_for_session(
         all_for_spot = await db.execute(
             select(SurfForecast).where(SurfForecast.spot_id == spot_id)
         )
-        candidates = list(all_for_spot.scalars().all())
-        if not candidates:
-            return None
-        closest = min(
-            candidates,
-            key=lambda r: _distance_to_window(r.timestamp, start, end),
-        )
-        dist = _distance_to_window(closest.timestamp, start, end)
-        if dist > max_offset_hours:
+        closest = _closest_forecast(list(all_for_spot.scalars().all()), start, end, max_offset_hours)
+        if closest is None:
             return None
         rows = [closest]
 
-    wave_heights = [r.wave_height for r in rows if r.wave_height is not None]
-    periods = [r.period for r in rows if r.period is not None]
-    wind_speeds = [r.wind_speed for r in rows if r.wind_speed is not None]
-    energies = [r.energy for r in rows if r.energy is not None]
-    ratings = [r.rating for r in rows if r.rating is not None]
-    wave_dirs = [r.wave_direction for r in rows]
-    wind_dirs = [r.wind_direction for r in rows]
-
-    result: dict[str, Any] = {}
-    if wave_heights:
-        result["wave_height_m"] = sum(wave_heights) / len(wave_heights)
-    if periods:
-        result["wave_period"] = sum(periods) / len(periods)
-    if wind_speeds:
-        result["wind_speed_kmh"] = sum(wind_speeds) / len(wind_speeds)
-    if energies:
-        result["energy"] = sum(energies) / len(energies)
-    if ratings:
-        result["rating"] = round(sum(ratings) / len(ratings))
-    wd = _first_or_most_common_direction(wave_dirs)
-    if wd is not None:
-        result["wave_dir"] = wd
-    wnd = _first_or_most_common_direction(wind_dirs)
-    if wnd is not None:
-        result["wind_dir"] = wnd
+    result = _summarize_forecasts(rows)
 
     # Add tide data
     tide_data = await get_tide_for_session(db, spot_id, session_datetime)
@@ -120,6 +137,76 @@ async def get_weather_for_session(
     return result if result else None
 
 
+async def get_weather_for_sessions(
+    db: AsyncSession,
+    spot_id: int,
+    windows: list[tuple[datetime, int]],
+    max_offset_hours: int | None = None,
+) -> list[dict[str, Any] | None]:
+    """
+    Batch form of ``get_weather_for_session`` for many ``(datetime, duration_minutes)``
+    windows at one spot: one forecast and one tide query cover them all.
+    Forecasts further than ``max_offset_hours`` from every window could never be
+    chosen, so only that span is fetched.
+    """
+    if max_offset_hours is None:
+        max_offset_hours = MAX_FORECAST_OFFSET_HOURS
+    if not windows:
+        return []
+
+    bounds = [(start, start + timedelta(minutes=duration)) for start, duration in windows]
+    first = min(start for start, _ in bounds)
+    last = max(end for _, end in bounds)
+
+    forecast_result = await db.execute(
+        select(SurfForecast)
+        .where(
+            SurfForecast.spot_id == spot_id,
+            SurfForecast.timestamp >= first - timedelta(hours=max_offset_hours),
+            SurfForecast.timestamp <= last + timedelta(hours=max_offset_hours),
+        )
+        .order_by(SurfForecast.timestamp)
+    )
+    forecasts = list(forecast_result.scalars().all())
+    forecast_times = [r.timestamp for r in forecasts]
+
+    tide_result = await db.execute(
+        select(Tide)
+        .where(
+            Tide.spot_id == spot_id,
+            Tide.timestamp >= first - TIDE_WINDOW,
+            Tide.timestamp <= max(start for start, _ in bounds) + TIDE_WINDOW,
+        )
+        .order_by(Tide.timestamp)
+    )
+    tides = list(tide_result.scalars().all())
+    tide_times = [t.timestamp for t in tides]
+
+    results: list[dict[str, Any] | None] = []
+    for start, end in bounds:
+        rows = forecasts[bisect_left(forecast_times, start):bisect_right(forecast_times, end)]
+        if not rows:
+            nearby = forecasts[
+                bisect_left(forecast_times, start - timedelta(hours=max_offset_hours)):
+                bisect_right(forecast_times, end + timedelta(hours=max_offset_hours))
+            ]
+            closest = _closest_forecast(nearby, start, end, max_offset_hours)
+            if closest is None:
+                results.append(None)
+                continue
+            rows = [closest]
+
+        result = _summarize_forecasts(rows)
+        tide_data = _interpolate_tide(
+            tides[bisect_left(tide_times, start - TIDE_WINDOW):bisect_right(tide_times, start + TIDE_WINDOW)],
+            start,
+        )
+        if tide_data:
+            result.update(tide_data)
+        results.append(result if result else None)
+    return results
+
+
 async def get_tide_for_session(
     db: AsyncSession,
     spot_id: int,
@@ -130,8 +217,8 @@ async def get_tide_for_session(
     Uses cosine interpolation: h(t) = h_low + (h_high - h_low) * (1 - cos(pi * (t - t_low) / (t_high - t_low))) / 2
     """
     # Fetch tides for the spot within +/- 12 hours to ensure we get bounding High and Low
-    window_start = session_datetime - timedelta(hours=12)
-    window_end = session_datetime + timedelta(hours=12)
+    window_start = session_datetime - TIDE_WINDOW
+    window_end = session_datetime + TIDE_WINDOW
 
     result = await db.execute(
         select(Tide)
@@ -142,8 +229,11 @@ async def get_tide_for_session(
         )
         .order_by(Tide.timestamp)
     )
-    tides = list(result.scalars().all())
+    return _interpolate_tide(list(result.scalars().all()), session_datetime)
+
 
+def _interpolate_tide(tides: list[Tide], session_datetime: datetime) -> dict[str, Any] | None:
+    """Tide fields at ``session_datetime`` from the time-ordered tides around it."""
     if len(tides) < 2:
         return None
 
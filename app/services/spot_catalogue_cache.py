@@ -0,0 +1,52 @@
+"""In-process versioned cache for the serialized spot catalogue.
+
+The version is bumped after every committed spot or review write. Because the
+API runs as a single process, a module-level counter is sufficient; the boot id
+keeps ETags from a previous process from ever matching.
+"""
+
+from __future__ import annotations
+
+import uuid
+from datetime import date
+
+
+class SpotCatalogueCache:
+    def __init__(self) -> None:
+        self._boot_id = uuid.uuid4().hex[:12]
+        self._version = 0
+        self._bodies: dict[tuple[int, date], bytes] = {}
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    def bump(self) -> None:
+        self._version += 1
+        self._bodies.clear()
+
+    def etag(self, version: int, day: date) -> str:
+        return f'"spots-{self._boot_id}-{version}-{day.isoformat()}"'
+
+    def get(self, version: int, day: date) -> bytes | None:
+        return self._bodies.get((version, day))
+
+    def put(self, version: int, day: date, body: bytes) -> None:
+        # A write may have landed while the body was being built; never cache under a stale version.
+        if version != self._version:
+            return
+        self._bodies = {(version, day): body}
+
+
+spot_catalogue_cache = SpotCatalogueCache()
+
+
+def bump_spot_catalogue_version() -> None:
+    spot_catalogue_cache.bump()
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    candidates = [candidate.strip() for candidate in if_none_match.split(",")]
+    return "*" in candidates or any(candidate.removeprefix("W/") == etag for candidate in candidates)
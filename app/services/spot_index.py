@@ -0,0 +1,456 @@
+"""In-process spatial index over spot coordinates.
+
+Spots change rarely and are small, so the whole catalogue of ``(id, name, lat, lon)``
+points is kept in memory. Writes through ``spot_service`` patch the index in place
+(see :class:`SpotIndex`); the packed trees are rebuilt lazily once enough writes
+accumulate. The API runs as a single process, so this index is authoritative for it.
+"""
+
+from __future__ import annotations
+
+import heapq
+import math
+from typing import Iterable, NamedTuple
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.spot import Spot
+from app.services.spot_search import SpotNameSearch
+
+RTREE_NODE_CAPACITY = 16
+KDTREE_LEAF_SIZE = 8
+EARTH_RADIUS_KM = 6371.0088
+MAX_CLUSTER_ZOOM = 20
+# Above this zoom cells are small enough that a world-wide request is close to one cluster per spot.
+MAX_UNBOUNDED_CLUSTER_ZOOM = 6
+CLUSTER_CELL_PX = 64
+MERCATOR_MAX_LAT = 85.05112878
+
+
+class SpotPoint(NamedTuple):
+    id: int
+    name: str
+    latitude: float | None
+    longitude: float | None
+
+
+class _RTreeNode(NamedTuple):
+    min_lon: float
+    min_lat: float
+    max_lon: float
+    max_lat: float
+    children: tuple["_RTreeNode", ...]
+    points: tuple[SpotPoint, ...]
+
+
+def _leaf(points: list[SpotPoint]) -> _RTreeNode:
+    return _RTreeNode(
+        min(p.longitude for p in points),
+        min(p.latitude for p in points),
+        max(p.longitude for p in points),
+        max(p.latitude for p in points),
+        (),
+        tuple(points),
+    )
+
+
+def _branch(children: list[_RTreeNode]) -> _RTreeNode:
+    return _RTreeNode(
+        min(c.min_lon for c in children),
+        min(c.min_lat for c in children),
+        max(c.max_lon for c in children),
+        max(c.max_lat for c in children),
+        tuple(children),
+        (),
+    )
+
+
+def _str_pack(items: list, center, make_node) -> list[_RTreeNode]:
+    """Sort-Tile-Recursive packing of one level into nodes of at most RTREE_NODE_CAPACITY."""
+    node_count = math.ceil(len(items) / RTREE_NODE_CAPACITY)
+    slab_count = math.ceil(math.sqrt(node_count))
+    slab_size = slab_count * RTREE_NODE_CAPACITY
+
+    items = sorted(items, key=lambda item: center(item)[0])
+    nodes = []
+    for slab_start in range(0, len(items), slab_size):
+        slab = sorted(items[slab_start : slab_start + slab_size], key=lambda item: center(item)[1])
+        for start in range(0, len(slab), RTREE_NODE_CAPACITY):
+            nodes.append(make_node(slab[start : start + RTREE_NODE_CAPACITY]))
+    return nodes
+
+
+def build_rtree(points: Iterable[SpotPoint]) -> _RTreeNode | None:
+    located = [p for p in points if p.latitude is not None and p.longitude is not None]
+    if not located:
+        return None
+
+    level = _str_pack(located, lambda p: (p.longitude, p.latitude), _leaf)
+    while len(level) > 1:
+        level = _str_pack(
+            level,
+            lambda n: ((n.min_lon + n.max_lon) / 2, (n.min_lat + n.max_lat) / 2),
+            _branch,
+        )
+    return level[0]
+
+
+def _query_rtree(
+    root: _RTreeNode | None,
+    min_lon: float,
+    min_lat: float,
+    max_lon: float,
+    max_lat: float,
+) -> list[SpotPoint]:
+    if root is None:
+        return []
+    found: list[SpotPoint] = []
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        if node.max_lon < min_lon or node.min_lon > max_lon or node.max_lat < min_lat or node.min_lat > max_lat:
+            continue
+        if node.points:
+            found.extend(
+                p for p in node.points if min_lon <= p.longitude <= max_lon and min_lat <= p.latitude <= max_lat
+            )
+        else:
+            stack.extend(node.children)
+    return found
+
+
+def haversine_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    d_phi = phi2 - phi1
+    d_lambda = math.radians(lon2 - lon1)
+    a = math.sin(d_phi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(d_lambda / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(a)))
+
+
+def _unit_vector(lat: float, lon: float) -> tuple[float, float, float]:
+    phi, lam = math.radians(lat), math.radians(lon)
+    cos_phi = math.cos(phi)
+    return (cos_phi * math.cos(lam), cos_phi * math.sin(lam), math.sin(phi))
+
+
+class _KDNode:
+    """KD-tree node over unit-sphere vectors; leaves hold small buckets of points."""
+
+    __slots__ = ("axis", "split", "left", "right", "bucket")
+
+    def __init__(self, axis=0, split=0.0, left=None, right=None, bucket=None):
+        self.axis = axis
+        self.split = split
+        self.left = left
+        self.right = right
+        self.bucket = bucket
+
+
+def build_kdtree(points: Iterable[SpotPoint]) -> _KDNode | None:
+    entries = [
+        (_unit_vector(p.latitude, p.longitude), p)
+        for p in points
+        if p.latitude is not None and p.longitude is not None
+    ]
+    if not entries:
+        return None
+
+    def _build(items: list) -> _KDNode:
+        if len(items) <= KDTREE_LEAF_SIZE:
+            return _KDNode(bucket=items)
+        spreads = [
+            max(vec[axis] for vec, _ in items) - min(vec[axis] for vec, _ in items) for axis in range(3)
+        ]
+        axis = spreads.index(max(spreads))
+        items.sort(key=lambda item: item[0][axis])
+        middle = len(items) // 2
+        return _KDNode(
+            axis=axis,
+            split=items[middle][0][axis],
+            left=_build(items[:middle]),
+            right=_build(items[middle:]),
+        )
+
+    return _build(entries)
+
+
+def _query_kdtree(root: _KDNode | None, lat: float, lon: float, radius_km: float, limit: int) -> list[SpotPoint]:
+    if root is None:
+        return []
+    query = _unit_vector(lat, lon)
+    # Chord length on the unit sphere is monotonic in great-circle distance, so it can drive pruning.
+    central_angle = min(radius_km / EARTH_RADIUS_KM, math.pi)
+    max_chord_sq = (2 * math.sin(central_angle / 2)) ** 2
+    best: list[tuple[float, int, SpotPoint]] = []  # max-heap via negated distance
+
+    def _bound() -> float:
+        return -best[0][0] if len(best) >= limit else max_chord_sq
+
+    stack: list[tuple[_KDNode, float]] = [(root, 0.0)]
+    while stack:
+        node, min_dist_sq = stack.pop()
+        if min_dist_sq > _bound():
+            continue
+        if node.bucket is not None:
+            for vec, point in node.bucket:
+                dist_sq = (vec[0] - query[0]) ** 2 + (vec[1] - query[1]) ** 2 + (vec[2] - query[2]) ** 2
+                if dist_sq > max_chord_sq:
+                    continue
+                entry = (-dist_sq, -point.id, point)
+                if len(best) < limit:
+                    heapq.heappush(best, entry)
+                elif entry > best[0]:
+                    heapq.heapreplace(best, entry)
+            continue
+        diff = query[node.axis] - node.split
+        near, far = (node.left, node.right) if diff < 0 else (node.right, node.left)
+        # Push the far side first so the near side is explored (and tightens the bound) before it.
+        stack.append((far, diff * diff))
+        stack.append((near, 0.0))
+
+    return [point for _, _, point in sorted(best, reverse=True)]
+
+
+class SpotCluster(NamedTuple):
+    latitude: float
+    longitude: float
+    count: int
+    spot_id: int | None
+    name: str | None
+
+
+def _cells_per_axis(zoom: int) -> int:
+    """Grid cells per axis so that one cell spans CLUSTER_CELL_PX screen pixels at ``zoom``."""
+    return (2**zoom) * 256 // CLUSTER_CELL_PX
+
+
+def _mercator_cell(lat: float, lon: float, cells: int) -> tuple[int, int]:
+    lat = max(-MERCATOR_MAX_LAT, min(MERCATOR_MAX_LAT, lat))
+    x = (lon + 180.0) / 360.0
+    phi = math.radians(lat)
+    y = (1.0 - math.log(math.tan(phi) + 1.0 / math.cos(phi)) / math.pi) / 2.0
+    return min(cells - 1, max(0, int(x * cells))), min(cells - 1, max(0, int(y * cells)))
+
+
+def build_clusters(points: Iterable[SpotPoint], zoom: int) -> dict[tuple[int, int], SpotCluster]:
+    cells = _cells_per_axis(zoom)
+    buckets: dict[tuple[int, int], list[SpotPoint]] = {}
+    for point in points:
+        if point.latitude is None or point.longitude is None:
+            continue
+        buckets.setdefault(_mercator_cell(point.latitude, point.longitude, cells), []).append(point)
+
+    clusters = {}
+    for cell, members in buckets.items():
+        single = members[0] if len(members) == 1 else None
+        clusters[cell] = SpotCluster(
+            latitude=sum(p.latitude for p in members) / len(members),
+            longitude=sum(p.longitude for p in members) / len(members),
+            count=len(members),
+            spot_id=single.id if single else None,
+            name=single.name if single else None,
+        )
+    return clusters
+
+
+def _in_bbox(point: SpotPoint, min_lon: float, min_lat: float, max_lon: float, max_lat: float) -> bool:
+    if point.latitude is None or point.longitude is None:
+        return False
+    return min_lon <= point.longitude <= max_lon and min_lat <= point.latitude <= max_lat
+
+
+class SpotIndex:
+    """Packed R-tree (bounding boxes) and KD-tree (nearest) plus a small write overlay.
+
+    Writes land in ``_pending`` (new or moved points, scanned linearly) and
+    ``_stale`` (ids whose packed entry must be ignored). The trees are repacked
+    only once the overlay outgrows ``REPACK_MIN_CHANGES`` or ``REPACK_FRACTION``
+    of the catalogue, so a single spot write stays O(1).
+
+    It also keeps the exact name -> id map used to resolve ``spot_name`` on
+    session writes and the in-memory name search.
+    """
+
+    REPACK_MIN_CHANGES = 64
+    REPACK_FRACTION = 0.1
+
+    def __init__(self) -> None:
+        self._points: dict[int, SpotPoint] | None = None
+        self._rtree: _RTreeNode | None = None
+        self._kdtree: _KDNode | None = None
+        self._packed_ids: set[int] = set()
+        self._pending: dict[int, SpotPoint] = {}
+        self._stale: set[int] = set()
+        self._packed = False
+        self._clusters: dict[int, dict[tuple[int, int], SpotCluster]] = {}
+        self._ids_by_name: dict[str, int] = {}
+        self._search: SpotNameSearch | None = None
+
+    @property
+    def loaded(self) -> bool:
+        return self._points is not None
+
+    def reset(self) -> None:
+        """Drop everything; the next query reloads from the database."""
+        self._points = None
+        self._rtree = None
+        self._kdtree = None
+        self._packed_ids = set()
+        self._pending = {}
+        self._stale = set()
+        self._packed = False
+        self._clusters = {}
+        self._ids_by_name = {}
+        self._search = None
+
+    def load(self, points: Iterable[SpotPoint]) -> None:
+        self.reset()
+        self._points = {p.id: p for p in points}
+        self._ids_by_name = {p.name: p.id for p in self._points.values()}
+
+    async def ensure_loaded(self, db: AsyncSession) -> None:
+        if self._points is not None:
+            return
+        result = await db.execute(select(Spot.id, Spot.name, Spot.latitude, Spot.longitude))
+        self.load(SpotPoint(*row) for row in result.all())
+
+    def upsert(self, spot: Spot) -> None:
+        if self._points is None:
+            return
+        point = SpotPoint(spot.id, spot.name, spot.latitude, spot.longitude)
+        previous = self._points.get(spot.id)
+        if previous is not None and previous.name != point.name:
+            self._ids_by_name.pop(previous.name, None)
+        if previous is None or previous.name != point.name:
+            self._ids_by_name[point.name] = point.id
+            if self._search is not None:
+                self._search.add(point.id, point.name)
+        self._points[spot.id] = point
+        self._pending[spot.id] = point
+        if spot.id in self._packed_ids:
+            self._stale.add(spot.id)
+        self._clusters = {}
+
+    def remove(self, spot_id: int) -> None:
+        if self._points is None:
+            return
+        previous = self._points.pop(spot_id, None)
+        if previous is not None:
+            self._ids_by_name.pop(previous.name, None)
+            if self._search is not None:
+                self._search.discard(spot_id)
+        self._pending.pop(spot_id, None)
+        if spot_id in self._packed_ids:
+            self._stale.add(spot_id)
+        self._clusters = {}
+
+    def _refresh(self) -> None:
+        points = self._points or {}
+        overlay = len(self._pending) + len(self._stale)
+        if self._packed and overlay <= max(self.REPACK_MIN_CHANGES, self.REPACK_FRACTION * len(points)):
+            return
+        located = [p for p in points.values() if p.latitude is not None and p.longitude is not None]
+        self._rtree = build_rtree(located)
+        self._kdtree = build_kdtree(located)
+        self._packed_ids = {p.id for p in located}
+        self._pending = {}
+        self._stale = set()
+        self._packed = True
+
+    def id_for_name(self, name: str) -> int | None:
+        return self._ids_by_name.get(name)
+
+    def has_spot(self, spot_id: int) -> bool:
+        return spot_id in (self._points or {})
+
+    def search(self, query: str, limit: int) -> list[SpotPoint]:
+        points = self._points or {}
+        if self._search is None:
+            # Built on first use: the trie costs far more than the spatial trees to construct.
+            self._search = SpotNameSearch()
+            for point in points.values():
+                self._search.add(point.id, point.name)
+        return [points[spot_id] for spot_id in self._search.search(query, limit)]
+
+    def all(self) -> list[SpotPoint]:
+        return sorted((self._points or {}).values(), key=lambda p: p.id)
+
+    def within_bbox(self, min_lon: float, min_lat: float, max_lon: float, max_lat: float) -> list[SpotPoint]:
+        """Spots inside the box; ``min_lon > max_lon`` means the box crosses the antimeridian."""
+        self._refresh()
+        if min_lon <= max_lon:
+            boxes = [(min_lon, min_lat, max_lon, max_lat)]
+        else:
+            boxes = [(min_lon, min_lat, 180.0, max_lat), (-180.0, min_lat, max_lon, max_lat)]
+
+        found: dict[int, SpotPoint] = {}
+        for box in boxes:
+            for point in _query_rtree(self._rtree, *box):
+                if point.id not in self._stale:
+                    found[point.id] = point
+            for point in self._pending.values():
+                if _in_bbox(point, *box):
+                    found[point.id] = point
+        return sorted(found.values(), key=lambda p: p.id)
+
+    def nearest(self, lat: float, lon: float, radius_km: float, limit: int) -> list[tuple[SpotPoint, float]]:
+        """Up to ``limit`` spots within ``radius_km`` of the point, closest first, with haversine distances."""
+        self._refresh()
+        limit = max(limit, 1)
+        # Over-fetch by the number of stale entries so filtering them out cannot starve the result.
+        packed = _query_kdtree(self._kdtree, lat, lon, radius_km, limit + len(self._stale))
+        candidates = [p for p in packed if p.id not in self._stale]
+        candidates.extend(
+            p for p in self._pending.values() if p.latitude is not None and p.longitude is not None
+        )
+
+        scored = [(haversine_km(lat, lon, p.latitude, p.longitude), p.id, p) for p in candidates]
+        scored = sorted(item for item in scored if item[0] <= radius_km)
+        return [(point, distance) for distance, _, point in scored[:limit]]
+
+    def clusters(
+        self,
+        zoom: int,
+        min_lon: float = -180.0,
+        min_lat: float = -90.0,
+        max_lon: float = 180.0,
+        max_lat: float = 90.0,
+    ) -> list[SpotCluster]:
+        """Grid clusters for ``zoom`` whose cell overlaps the box, computed once per zoom until spots change.
+
+        Matching on the cell rather than the centroid keeps spots near the edge of the
+        viewport from disappearing when their cluster's centroid falls just outside it.
+        """
+        zoom = max(0, min(zoom, MAX_CLUSTER_ZOOM))
+        grid = self._clusters.get(zoom)
+        if grid is None:
+            grid = build_clusters((self._points or {}).values(), zoom)
+            self._clusters[zoom] = grid
+
+        if min_lon <= max_lon:
+            boxes = [(min_lon, min_lat, max_lon, max_lat)]
+        else:
+            boxes = [(min_lon, min_lat, 180.0, max_lat), (-180.0, min_lat, max_lon, max_lat)]
+
+        cells = _cells_per_axis(zoom)
+        found: dict[tuple[int, int], SpotCluster] = {}
+        for box_min_lon, box_min_lat, box_max_lon, box_max_lat in boxes:
+            x0, y1 = _mercator_cell(box_min_lat, box_min_lon, cells)
+            x1, y0 = _mercator_cell(box_max_lat, box_max_lon, cells)
+            # Walk the viewport's cells when that is cheaper than scanning every cluster.
+            if (x1 - x0 + 1) * (y1 - y0 + 1) < len(grid):
+                candidates = (
+                    (cell, grid[cell])
+                    for cell in ((x, y) for x in range(x0, x1 + 1) for y in range(y0, y1 + 1))
+                    if cell in grid
+                )
+            else:
+                candidates = (
+                    (cell, cluster) for cell, cluster in grid.items() if x0 <= cell[0] <= x1 and y0 <= cell[1] <= y1
+                )
+            found.update(candidates)
+        return [found[cell] for cell in sorted(found)]
+
+
+spot_index = SpotIndex()
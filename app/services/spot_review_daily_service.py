@@ -0,0 +1,196 @@
+"""Incrementally maintained per-spot daily review aggregates.
+
+Each review contributes ``value * w`` and ``w`` to its metric sums, where
+``w = exp(hours_since_midnight / REVIEW_DECAY_HOURS)``. Because every weight shares
+the same ``exp(-now / tau)`` factor relative to any read time, the recency-weighted
+mean is simply ``weighted_sum / weight_sum`` and never needs the raw reviews.
+"""
+
+from __future__ import annotations
+
+import math
+from datetime import date, datetime, time, timedelta
+from typing import Iterable, NamedTuple
+
+from sqlalchemy import case, delete, func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database import dialect_insert
+from app.models import SpotReviewDaily, SurfSessionReview
+
+REVIEW_DECAY_HOURS = 3.0
+REVIEW_METRICS = (
+    "quality",
+    "crowded_level",
+    "wave_height_index",
+    "short_long_index",
+    "wind_index",
+)
+DAILY_COUNTERS = ("review_count",) + tuple(
+    f"{metric}_{suffix}" for metric in REVIEW_METRICS for suffix in ("count", "weighted_sum", "weight_sum")
+)
+
+
+class ReviewContribution(NamedTuple):
+    """Snapshot of the review fields that feed the daily aggregate."""
+
+    review_id: int | None
+    spot_id: int
+    observed_at: datetime
+    metrics: dict[str, int | None]
+
+
+def review_contribution(review: SurfSessionReview) -> ReviewContribution:
+    return ReviewContribution(
+        review_id=review.id,
+        spot_id=review.spot_id,
+        observed_at=review.observed_at,
+        metrics={metric: getattr(review, metric) for metric in REVIEW_METRICS},
+    )
+
+
+def review_weight(observed_at: datetime) -> float:
+    """Recency weight of a review relative to the start of its day."""
+    start_of_day = datetime.combine(observed_at.date(), time.min)
+    hours = (observed_at - start_of_day).total_seconds() / 3600
+    return math.exp(hours / REVIEW_DECAY_HOURS)
+
+
+def _day_bounds(day: date) -> tuple[datetime, datetime]:
+    start_of_day = datetime.combine(day, time.min)
+    return start_of_day, start_of_day + timedelta(days=1)
+
+
+def _metric_deltas(contribution: ReviewContribution, sign: int) -> dict[str, float]:
+    weight = review_weight(contribution.observed_at)
+    deltas: dict[str, float] = {"review_count": sign}
+    for metric, value in contribution.metrics.items():
+        if value is None:
+            continue
+        deltas[f"{metric}_count"] = sign
+        deltas[f"{metric}_weighted_sum"] = sign * float(value) * weight
+        deltas[f"{metric}_weight_sum"] = sign * weight
+    return deltas
+
+
+def _increments(deltas: dict[str, float]) -> dict:
+    return {getattr(SpotReviewDaily, name): getattr(SpotReviewDaily, name) + delta for name, delta in deltas.items()}
+
+
+def _row_filter(spot_id: int, day: date):
+    return (SpotReviewDaily.spot_id == spot_id, SpotReviewDaily.date == day)
+
+
+async def add_review_to_daily(db: AsyncSession, review: SurfSessionReview) -> None:
+    """Fold a new or updated review into its spot/day aggregate row with a single upsert."""
+    await add_reviews_to_daily(db, [review_contribution(review)])
+
+
+async def add_reviews_to_daily(db: AsyncSession, contributions: Iterable[ReviewContribution]) -> None:
+    """Fold many reviews in with one batched upsert, one row per distinct spot/day."""
+    rows: dict[tuple[int, date], dict] = {}
+    for contribution in contributions:
+        key = (contribution.spot_id, contribution.observed_at.date())
+        row = rows.get(key)
+        if row is None:
+            row = rows[key] = {
+                "spot_id": key[0],
+                "date": key[1],
+                "latest_observed_at": contribution.observed_at,
+                **dict.fromkeys(DAILY_COUNTERS, 0),
+            }
+        row["latest_observed_at"] = max(row["latest_observed_at"], contribution.observed_at)
+        for name, delta in _metric_deltas(contribution, sign=1).items():
+            row[name] += delta
+    if not rows:
+        return
+
+    table = SpotReviewDaily.__table__
+    stmt = dialect_insert(db)(table)
+    values = {name: table.c[name] + stmt.excluded[name] for name in DAILY_COUNTERS}
+    latest = table.c.latest_observed_at
+    values["latest_observed_at"] = case(
+        (latest.is_(None), stmt.excluded.latest_observed_at),
+        (latest < stmt.excluded.latest_observed_at, stmt.excluded.latest_observed_at),
+        else_=latest,
+    )
+    await db.execute(
+        stmt.on_conflict_do_update(index_elements=["spot_id", "date"], set_=values),
+        list(rows.values()),
+    )
+
+
+async def remove_review_from_daily(db: AsyncSession, contribution: ReviewContribution) -> None:
+    """Subtract a previously recorded review from its spot/day aggregate row."""
+    day = contribution.observed_at.date()
+    start_of_day, end_of_day = _day_bounds(day)
+
+    remaining_latest = (
+        select(func.max(SurfSessionReview.observed_at))
+        .where(
+            SurfSessionReview.spot_id == contribution.spot_id,
+            SurfSessionReview.observed_at >= start_of_day,
+            SurfSessionReview.observed_at < end_of_day,
+            SurfSessionReview.id != contribution.review_id,
+        )
+        .scalar_subquery()
+    )
+    values = _increments(_metric_deltas(contribution, sign=-1))
+    values[SpotReviewDaily.latest_observed_at] = remaining_latest
+    await db.execute(update(SpotReviewDaily).where(*_row_filter(contribution.spot_id, day)).values(values))
+
+    await db.execute(
+        delete(SpotReviewDaily).where(
+            *_row_filter(contribution.spot_id, day),
+            SpotReviewDaily.review_count <= 0,
+        )
+    )
+
+
+async def rebuild_spot_review_daily(
+    db: AsyncSession,
+    spot_ids: Iterable[int] | None = None,
+) -> int:
+    """Recompute aggregate rows from ``surf_session_reviews``; returns the number of rows written.
+
+    The caller is responsible for committing.
+    """
+    spot_ids = list(spot_ids) if spot_ids is not None else None
+
+    delete_stmt = delete(SpotReviewDaily)
+    reviews_stmt = select(SurfSessionReview)
+    if spot_ids is not None:
+        if not spot_ids:
+            return 0
+        delete_stmt = delete_stmt.where(SpotReviewDaily.spot_id.in_(spot_ids))
+        reviews_stmt = reviews_stmt.where(SurfSessionReview.spot_id.in_(spot_ids))
+    await db.execute(delete_stmt)
+
+    rows: dict[tuple[int, date], dict] = {}
+    result = await db.stream_scalars(reviews_stmt.execution_options(yield_per=1000))
+    async for review in result:
+        key = (review.spot_id, review.observed_at.date())
+        row = rows.get(key)
+        if row is None:
+            row = {"spot_id": key[0], "date": key[1], "review_count": 0, "latest_observed_at": None}
+            for metric in REVIEW_METRICS:
+                row[f"{metric}_count"] = 0
+                row[f"{metric}_weighted_sum"] = 0.0
+                row[f"{metric}_weight_sum"] = 0.0
+            rows[key] = row
+
+        weight = review_weight(review.observed_at)
+        row["review_count"] += 1
+        if row["latest_observed_at"] is None or row["latest_observed_at"] < review.observed_at:
+            row["latest_observed_at"] = review.observed_at
+        for metric in REVIEW_METRICS:
+            value = getattr(review, metric)
+            if value is None:
+                continue
+            row[f"{metric}_count"] += 1
+            row[f"{metric}_weighted_sum"] += float(value) * weight
+            row[f"{metric}_weight_sum"] += weight
+
+    if rows:
+        await db.execute(dialect_insert(db)(SpotReviewDaily), list(rows.values()))
+    return len(rows)
@@ -0,0 +1,144 @@
+"""In-memory fuzzy spot name search used when ``pg_trgm`` is unavailable (SQLite).
+
+Names are normalised (case-folded, accents and punctuation stripped) and indexed
+twice: a prefix trie over their words answers autocomplete queries, and a
+trigram inverted index catches typos with pg_trgm-style similarity.
+"""
+
+from __future__ import annotations
+
+import heapq
+import math
+import re
+import unicodedata
+
+SEARCH_SIMILARITY_THRESHOLD = 0.3
+
+_NON_WORD = re.compile(r"[^0-9a-z]+")
+
+
+def normalize_name(value: str) -> str:
+    decomposed = unicodedata.normalize("NFKD", value.casefold())
+    stripped = "".join(ch for ch in decomposed if not unicodedata.combining(ch))
+    return _NON_WORD.sub(" ", stripped).strip()
+
+
+def trigrams(value: str) -> set[str]:
+    """Trigrams of every word padded the way pg_trgm pads them ("  word ")."""
+    grams: set[str] = set()
+    for word in normalize_name(value).split():
+        padded = f"  {word} "
+        grams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return grams
+
+
+def trigram_similarity(a: str, b: str) -> float:
+    grams_a, grams_b = trigrams(a), trigrams(b)
+    if not grams_a or not grams_b:
+        return 0.0
+    shared = len(grams_a & grams_b)
+    return shared / (len(grams_a) + len(grams_b) - shared)
+
+
+class _TrieNode:
+    __slots__ = ("children", "ids")
+
+    def __init__(self) -> None:
+        self.children: dict[str, _TrieNode] = {}
+        # Every id with a word passing through this node, so a prefix lookup is O(len(prefix)).
+        self.ids: set[int] = set()
+
+
+class SpotNameSearch:
+    def __init__(self) -> None:
+        self._root = _TrieNode()
+        self._names: dict[int, str] = {}
+        self._normalized: dict[int, str] = {}
+        self._grams: dict[int, set[str]] = {}
+        self._postings: dict[str, set[int]] = {}
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def add(self, spot_id: int, name: str) -> None:
+        self.discard(spot_id)
+        normalized = normalize_name(name)
+        self._names[spot_id] = name
+        self._normalized[spot_id] = normalized
+        for word in set(normalized.split()):
+            node = self._root
+            for ch in word:
+                node = node.children.setdefault(ch, _TrieNode())
+                node.ids.add(spot_id)
+        grams = trigrams(name)
+        self._grams[spot_id] = grams
+        for gram in grams:
+            self._postings.setdefault(gram, set()).add(spot_id)
+
+    def discard(self, spot_id: int) -> None:
+        normalized = self._normalized.pop(spot_id, None)
+        if normalized is None:
+            return
+        del self._names[spot_id]
+        for word in set(normalized.split()):
+            path = [self._root]
+            for ch in word:
+                node = path[-1].children.get(ch)
+                if node is None:
+                    break
+                node.ids.discard(spot_id)
+                path.append(node)
+            for parent, ch in zip(reversed(path[:-1]), reversed(word[:len(path) - 1]), strict=True):
+                child = parent.children[ch]
+                if child.ids:
+                    break
+                del parent.children[ch]
+        for gram in self._grams.pop(spot_id):
+            ids = self._postings[gram]
+            ids.discard(spot_id)
+            if not ids:
+                del self._postings[gram]
+
+    def _prefix_ids(self, prefix: str) -> set[int]:
+        node = self._root
+        for ch in prefix:
+            node = node.children.get(ch)
+            if node is None:
+                return set()
+        return node.ids
+
+    def search(self, query: str, limit: int) -> list[int]:
+        """Ids ranked by whole-name prefix, then word prefixes, then trigram similarity.
+
+        Prefix hits always outrank typo matches, so trigram scoring only runs when
+        the prefixes alone do not fill ``limit``.
+        """
+        normalized = normalize_name(query)
+        words = normalized.split()
+        if not words:
+            return []
+
+        prefix_ids = set.intersection(*(self._prefix_ids(word) for word in words))
+
+        def prefix_rank(spot_id: int) -> tuple:
+            tier = 0 if self._normalized[spot_id].startswith(normalized) else 1
+            return tier, len(self._normalized[spot_id]), self._names[spot_id]
+
+        ranked = heapq.nsmallest(limit, prefix_ids, key=prefix_rank)
+        if len(ranked) >= limit:
+            return ranked
+
+        query_grams = trigrams(query)
+        # A similarity >= t needs at least ceil(t * |q|) shared trigrams, so every match
+        # appears in one of the |q| - that + 1 rarest posting lists; verify only those.
+        min_shared = max(1, math.ceil(SEARCH_SIMILARITY_THRESHOLD * len(query_grams)))
+        postings = sorted((self._postings.get(gram, ()) for gram in query_grams), key=len)
+        candidates = set().union(*postings[: len(query_grams) - min_shared + 1]) - prefix_ids
+        fuzzy = []
+        for spot_id in candidates:
+            grams = self._grams[spot_id]
+            count = len(query_grams & grams)
+            score = count / (len(query_grams) + len(grams) - count)
+            if score >= SEARCH_SIMILARITY_THRESHOLD:
+                fuzzy.append((-score, self._names[spot_id], spot_id))
+        return ranked + [spot_id for _, _, spot_id in heapq.nsmallest(limit - len(ranked), fuzzy)]
@@ -1,15 +1,26 @@
-from sqlalchemy import delete, select
+from collections.abc import Iterable
+
+from sqlalchemy import delete, func, or_, select
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.exceptions import BusinessLogicError
+from app.core.serialization import schema_columns
 from app.models.spot import Spot
-from app.schemas.spot import SpotUpdate
+from app.schemas.spot import SpotResponse, SpotUpdate
+from app.services.spot_catalogue_cache import bump_spot_catalogue_version
+from app.services.spot_index import SpotPoint, spot_index
 from app.services.surf_session_review_service import (
+    get_recent_review_rows_by_spot,
+    get_recent_reviews_by_spot,
     get_recent_spot_reviews,
+    get_spot_review_summaries,
     get_spot_review_summary,
 )
 
+# Stored SpotResponse fields; ``review_summary``/``recent_reviews`` are attached separately.
+SPOT_ROW_KEYS, SPOT_ROW_COLUMNS = schema_columns(SpotResponse, Spot.__table__)
+
 
 async def create_spot(
     db: AsyncSession,
@@ -57,7 +68,9 @@ async def create_spot(
                 code="DATA_INTEGRITY_ERROR",
             ) from e
 
+    bump_spot_catalogue_version()
     await db.refresh(spot_model)
+    spot_index.upsert(spot_model)
     return spot_model
 
 
@@ -77,12 +90,33 @@ async def get_spot_by_id(
 async def list_spots(db: AsyncSession) -> list[Spot]:
     result = await db.execute(select(Spot))
     spots = result.scalars().all()
+    spot_ids = [spot.id for spot in spots]
+    summaries = await get_spot_review_summaries(db, spot_ids)
+    recent_reviews = await get_recent_reviews_by_spot(db, spot_ids, limit=3)
     for spot in spots:
-        spot.review_summary = await get_spot_review_summary(db, spot.id)
-        spot.recent_reviews = await get_recent_spot_reviews(db, spot.id, limit=3)
+        spot.review_summary = summaries[spot.id]
+        spot.recent_reviews = recent_reviews[spot.id]
     return spots
 
 
+def spot_row_dict(values, review_summary=None, recent_reviews=None) -> dict:
+    """``SpotResponse``-shaped dict from a row of ``SPOT_ROW_COLUMNS``."""
+    spot = dict(zip(SPOT_ROW_KEYS, values, strict=True))
+    spot["review_summary"] = review_summary
+    spot["recent_reviews"] = recent_reviews if recent_reviews is not None else []
+    return spot
+
+
+async def list_spot_rows(db: AsyncSession) -> list[dict]:
+    """``list_spots`` as ``SpotResponse``-shaped dicts, without ORM objects."""
+    result = await db.execute(select(*SPOT_ROW_COLUMNS))
+    rows = result.tuples().all()
+    spot_ids = [row[0] for row in rows]
+    summaries = await get_spot_review_summaries(db, spot_ids)
+    recent_reviews = await get_recent_review_rows_by_spot(db, spot_ids, limit=3)
+    return [spot_row_dict(row, summaries[row[0]], recent_reviews[row[0]]) for row in rows]
+
+
 async def get_spot_by_name(
     db: AsyncSession,
     name: str,
@@ -91,6 +125,81 @@ async def get_spot_by_name(
     return result.scalars().first()
 
 
+async def resolve_spot_id(
+    db: AsyncSession,
+    name: str,
+) -> int | None:
+    """Exact name lookup served from the in-memory spot index; misses fall back to the database."""
+    await spot_index.ensure_loaded(db)
+    spot_id = spot_index.id_for_name(name)
+    if spot_id is not None:
+        return spot_id
+    spot = await get_spot_by_name(db, name)
+    return spot.id if spot is not None else None
+
+
+async def resolve_spot_ids(
+    db: AsyncSession,
+    names: Iterable[str],
+) -> dict[str, int]:
+    """Bulk ``resolve_spot_id``: index hits are free and all misses share one query."""
+    await spot_index.ensure_loaded(db)
+    resolved: dict[str, int] = {}
+    missing: set[str] = set()
+    for name in names:
+        spot_id = spot_index.id_for_name(name)
+        if spot_id is None:
+            missing.add(name)
+        else:
+            resolved[name] = spot_id
+    if missing:
+        result = await db.execute(select(Spot.name, Spot.id).where(Spot.name.in_(missing)))
+        resolved.update(result.tuples().all())
+    return resolved
+
+
+async def existing_spot_ids(
+    db: AsyncSession,
+    spot_ids: Iterable[int],
+) -> set[int]:
+    """The subset of ``spot_ids`` that exist, checked against the index before the database."""
+    await spot_index.ensure_loaded(db)
+    found: set[int] = set()
+    missing: set[int] = set()
+    for spot_id in spot_ids:
+        (found if spot_index.has_spot(spot_id) else missing).add(spot_id)
+    if missing:
+        result = await db.execute(select(Spot.id).where(Spot.id.in_(missing)))
+        found.update(result.scalars().all())
+    return found
+
+
+def _escape_like(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+async def search_spots(
+    db: AsyncSession,
+    query: str,
+    limit: int = 10,
+) -> list[SpotPoint]:
+    """Typo-tolerant autocomplete: pg_trgm on PostgreSQL, the in-memory trie/trigram index elsewhere."""
+    if db.get_bind().dialect.name != "postgresql":
+        await spot_index.ensure_loaded(db)
+        return spot_index.search(query, limit)
+
+    escaped = _escape_like(query.strip())
+    name_prefix = Spot.name.ilike(f"{escaped}%", escape="\\")
+    word_prefix = Spot.name.ilike(f"% {escaped}%", escape="\\")
+    result = await db.execute(
+        select(Spot.id, Spot.name, Spot.latitude, Spot.longitude)
+        .where(or_(name_prefix, word_prefix, Spot.name.op("%")(query)))
+        .order_by(name_prefix.desc(), word_prefix.desc(), func.word_similarity(query, Spot.name).desc(), Spot.name)
+        .limit(limit)
+    )
+    return [SpotPoint(*row) for row in result.all()]
+
+
 async def spot_exists(
     db: AsyncSession,
     spot_id: int,
@@ -133,7 +242,9 @@ async def update_spot(
             code="DATA_INTEGRITY_ERROR"
         ) from e
 
+    bump_spot_catalogue_version()
     await db.refresh(spot_model)
+    spot_index.upsert(spot_model)
     return spot_model
 
 
@@ -143,4 +254,6 @@ async def delete_spot(
 ) -> bool:
     result = await db.execute(delete(Spot).where(Spot.id == spot_id))
     await db.commit()
+    bump_spot_catalogue_version()
+    spot_index.remove(spot_id)
     return result.rowcount > 0
@@ -0,0 +1,182 @@
+"""Constant-memory session export as CSV, NDJSON or Parquet.
+
+Rows are projected straight from ``surf_sessions`` joined to the spot name and the
+review metrics, read through a server-side cursor ``EXPORT_BATCH_SIZE`` at a time and
+encoded per batch, so neither ORM objects nor response models are ever built. Column
+names match the import format (``spot_name``, ``review_quality``, ...).
+
+Parquet uses ``pyarrow`` (installed with the ``api`` extra); each batch becomes one row group.
+"""
+
+from __future__ import annotations
+
+import csv
+import io
+import json
+from collections.abc import AsyncIterator, Sequence
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import DateTime, Float, Integer, Select, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import Spot, SurfSession, SurfSessionReview
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover - optional dependency
+    pa = None
+    pq = None
+
+EXPORT_BATCH_SIZE = 1000
+EXPORT_MEDIA_TYPES = {
+    "csv": "text/csv",
+    "ndjson": "application/x-ndjson",
+    "parquet": "application/vnd.apache.parquet",
+}
+EXPORT_COLUMNS = (
+    SurfSession.id,
+    SurfSession.datetime,
+    SurfSession.duration_minutes,
+    SurfSession.spot_id,
+    Spot.name.label("spot_name"),
+    SurfSession.notes,
+    SurfSession.surfboard_id,
+    SurfSession.surfboard_name,
+    SurfSession.surfboard_brand,
+    SurfSession.surfboard_model,
+    SurfSession.surfboard_length_ft,
+    SurfSession.surfboard_width_in,
+    SurfSession.surfboard_thickness_in,
+    SurfSession.surfboard_volume_liters,
+    SurfSession.wave_height_m,
+    SurfSession.wave_period,
+    SurfSession.wave_dir,
+    SurfSession.wind_speed_kmh,
+    SurfSession.wind_dir,
+    SurfSession.energy,
+    SurfSession.rating,
+    SurfSession.tide_height_m,
+    SurfSession.tide_low_m,
+    SurfSession.tide_high_m,
+    SurfSessionReview.quality.label("review_quality"),
+    SurfSessionReview.crowded_level.label("review_crowded_level"),
+    SurfSessionReview.wave_height_index.label("review_wave_height_index"),
+    SurfSessionReview.short_long_index.label("review_short_long_index"),
+    SurfSessionReview.wind_index.label("review_wind_index"),
+    SurfSessionReview.observed_at.label("review_observed_at"),
+    SurfSession.created_at,
+)
+EXPORT_FIELDS = tuple(column.key for column in EXPORT_COLUMNS)
+
+
+def parquet_available() -> bool:
+    return pq is not None
+
+
+def export_filename(export_format: str) -> str:
+    return f"surf_sessions.{export_format}"
+
+
+def _export_query(user_id: int) -> Select:
+    return (
+        select(*EXPORT_COLUMNS)
+        .join(Spot, Spot.id == SurfSession.spot_id)
+        .outerjoin(SurfSessionReview, SurfSessionReview.surf_session_id == SurfSession.id)
+        .where(SurfSession.user_id == user_id)
+        .order_by(SurfSession.datetime, SurfSession.id)
+    )
+
+
+def _text(value: Any) -> Any:
+    return value.isoformat() if isinstance(value, datetime) else value
+
+
+def _csv_batch(rows: Sequence[Sequence[Any]]) -> bytes:
+    buffer = io.StringIO()
+    csv.writer(buffer, lineterminator="\n").writerows([_text(value) for value in row] for row in rows)
+    return buffer.getvalue().encode()
+
+
+def _ndjson_batch(rows: Sequence[Sequence[Any]]) -> bytes:
+    return "".join(
+        json.dumps(dict(zip(EXPORT_FIELDS, row, strict=True)), default=_text) + "\n" for row in rows
+    ).encode()
+
+
+def _arrow_type(column):
+    if isinstance(column.type, DateTime):
+        return pa.timestamp("us")
+    if isinstance(column.type, Integer):
+        return pa.int64()
+    if isinstance(column.type, Float):
+        return pa.float64()
+    return pa.string()
+
+
+class _ChunkSink:
+    """Write-only file object that hands bytes back to the caller instead of keeping them."""
+
+    def __init__(self) -> None:
+        self._chunks: list[bytes] = []
+        self._position = 0
+        self.closed = False
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        self.closed = True
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+async def _stream_rows(db: AsyncSession, user_id: int) -> AsyncIterator[Sequence[Sequence[Any]]]:
+    result = await db.stream(_export_query(user_id).execution_options(yield_per=EXPORT_BATCH_SIZE))
+    try:
+        async for rows in result.partitions():
+            yield rows
+    finally:
+        await result.close()
+
+
+async def _parquet_chunks(batches: AsyncIterator[Sequence[Sequence[Any]]]) -> AsyncIterator[bytes]:
+    schema = pa.schema([(column.key, _arrow_type(column)) for column in EXPORT_COLUMNS])
+    sink = _ChunkSink()
+    writer = pq.ParquetWriter(sink, schema)
+    try:
+        async for rows in batches:
+            columns = zip(*rows, strict=True)
+            arrays = [pa.array(values, type=field.type) for values, field in zip(columns, schema, strict=True)]
+            writer.write_table(pa.Table.from_arrays(arrays, schema=schema))
+            yield sink.drain()
+    finally:
+        writer.close()
+    yield sink.drain()
+
+
+async def export_surf_sessions(db: AsyncSession, user_id: int, export_format: str) -> AsyncIterator[bytes]:
+    """Encoded chunks of every session the user owns, oldest first, one chunk per batch."""
+    batches = _stream_rows(db, user_id)
+    if export_format == "parquet":
+        async for chunk in _parquet_chunks(batches):
+            yield chunk
+        return
+
+    encode = _csv_batch if export_format == "csv" else _ndjson_batch
+    if export_format == "csv":
+        yield _csv_batch([EXPORT_FIELDS])
+    async for rows in batches:
+        yield encode(rows)
@@ -0,0 +1,291 @@
+"""Bulk session import from streamed CSV or NDJSON uploads.
+
+Rows are parsed as the body arrives and validated with ``SurfSessionCreate``, then
+written ``IMPORT_BATCH_SIZE`` at a time: spot names and ids are resolved for the whole
+batch at once, weather comes from one forecast and one tide query per spot, and
+sessions, reviews and both rollups go in as multi-row statements. Each batch commits
+on its own, so only the current batch and the first ``MAX_IMPORT_ERRORS`` row errors
+are ever held in memory.
+
+CSV columns are the ``SurfSessionCreate`` field names; review fields use a
+``review_`` prefix (``review_quality``, ``review_crowded_level``, ...) and empty cells
+count as missing. ``save_surfboard_to_quiver`` is ignored: inline board fields are
+kept on the session.
+"""
+
+from __future__ import annotations
+
+import codecs
+import csv
+import json
+from collections import defaultdict
+from collections.abc import AsyncIterator
+from typing import Any
+
+from pydantic import ValidationError as PydanticValidationError
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import Surfboard, SurfSession, SurfSessionReview
+from app.schemas.surf_session import SurfSessionCreate
+from app.services.session_forecast_service import get_weather_for_sessions
+from app.services.spot_catalogue_cache import bump_spot_catalogue_version
+from app.services.spot_review_daily_service import REVIEW_METRICS, ReviewContribution, add_reviews_to_daily
+from app.services.spot_service import existing_spot_ids, resolve_spot_ids
+from app.services.user_activity_daily_service import ActivityContribution, add_sessions_to_activity
+
+IMPORT_BATCH_SIZE = 500
+MAX_IMPORT_ERRORS = 1000
+REVIEW_COLUMN_PREFIX = "review_"
+IMPORT_CONTENT_TYPES = {
+    "text/csv": "csv",
+    "application/csv": "csv",
+    "application/x-ndjson": "ndjson",
+    "application/ndjson": "ndjson",
+    "application/jsonl": "ndjson",
+}
+WEATHER_FIELDS = (
+    "wave_height_m",
+    "wave_period",
+    "wave_dir",
+    "wind_speed_kmh",
+    "wind_dir",
+    "energy",
+    "rating",
+    "tide_height_m",
+    "tide_low_m",
+    "tide_high_m",
+)
+
+
+class ImportReport:
+    """Running totals plus the first ``MAX_IMPORT_ERRORS`` per-line errors."""
+
+    def __init__(self) -> None:
+        self.imported = 0
+        self.failed = 0
+        self.errors: list[dict[str, Any]] = []
+
+    def fail(self, line: int, messages: list[str]) -> None:
+        self.failed += 1
+        if len(self.errors) < MAX_IMPORT_ERRORS:
+            self.errors.append({"line": line, "errors": messages})
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "imported": self.imported,
+            "failed": self.failed,
+            # Spot and board checks run per batch, after that batch's parse errors were recorded.
+            "errors": sorted(self.errors, key=lambda error: error["line"]),
+            "errors_truncated": self.failed > len(self.errors),
+        }
+
+
+def import_format_for(content_type: str | None) -> str | None:
+    if not content_type:
+        return None
+    return IMPORT_CONTENT_TYPES.get(content_type.split(";", 1)[0].strip().lower())
+
+
+async def _lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[str]:
+    """Decoded lines as the upload arrives; only the unfinished last line is buffered."""
+    decoder = codecs.getincrementaldecoder("utf-8-sig")(errors="replace")
+    pending = ""
+    async for chunk in chunks:
+        pending += decoder.decode(chunk)
+        *complete, pending = pending.split("\n")
+        for line in complete:
+            yield line.removesuffix("\r")
+    pending += decoder.decode(b"", final=True)
+    if pending:
+        yield pending.removesuffix("\r")
+
+
+def _nest_review(payload: dict[str, Any]) -> dict[str, Any]:
+    review = {
+        key.removeprefix(REVIEW_COLUMN_PREFIX): payload.pop(key)
+        for key in [key for key in payload if key.startswith(REVIEW_COLUMN_PREFIX)]
+    }
+    if review:
+        payload["review"] = review
+    return payload
+
+
+async def _csv_rows(lines: AsyncIterator[str]) -> AsyncIterator[tuple[int, dict[str, Any] | str]]:
+    """``(line, payload)`` per record, or ``(line, error)``; quoted cells may span lines."""
+    header: list[str] | None = None
+    record: list[str] = []
+    start = 0
+    line_number = 0
+    async for line in lines:
+        line_number += 1
+        if not record:
+            start = line_number
+        record.append(line)
+        # An odd number of quotes means a quoted cell continues on the next line.
+        if sum(part.count('"') for part in record) % 2:
+            continue
+        text = "\n".join(record)
+        record = []
+        if not text.strip():
+            continue
+        values = next(csv.reader([text]))
+        if header is None:
+            header = [name.strip() for name in values]
+            continue
+        if len(values) != len(header):
+            yield start, f"expected {len(header)} columns, got {len(values)}"
+            continue
+        yield start, _nest_review({name: value for name, value in zip(header, values, strict=True) if value != ""})
+    if record:
+        yield start, "unterminated quoted field"
+
+
+async def _ndjson_rows(lines: AsyncIterator[str]) -> AsyncIterator[tuple[int, dict[str, Any] | str]]:
+    line_number = 0
+    async for line in lines:
+        line_number += 1
+        if not line.strip():
+            continue
+        try:
+            payload = json.loads(line)
+        except json.JSONDecodeError as e:
+            yield line_number, f"invalid JSON: {e.msg}"
+            continue
+        if not isinstance(payload, dict):
+            yield line_number, "expected a JSON object"
+            continue
+        yield line_number, payload
+
+
+def _validation_messages(error: PydanticValidationError) -> list[str]:
+    messages = []
+    for detail in error.errors():
+        location = ".".join(str(part) for part in detail["loc"])
+        messages.append(f"{location}: {detail['msg']}" if location else detail["msg"])
+    return messages
+
+
+async def _write_batch(
+    db: AsyncSession,
+    user_id: int,
+    batch: list[tuple[int, SurfSessionCreate]],
+    report: ImportReport,
+) -> None:
+    spot_ids_by_name = await resolve_spot_ids(db, {row.spot_name for _, row in batch if row.spot_name is not None})
+    known_spot_ids = await existing_spot_ids(db, {row.spot_id for _, row in batch if row.spot_id is not None})
+    board_ids = {row.surfboard_id for _, row in batch if row.surfboard_id is not None}
+    owned_board_ids = set()
+    if board_ids:
+        result = await db.execute(
+            select(Surfboard.id).where(Surfboard.id.in_(board_ids), Surfboard.owner_id == user_id)
+        )
+        owned_board_ids = set(result.scalars().all())
+
+    accepted: list[tuple[int, SurfSessionCreate]] = []
+    for line, row in batch:
+        spot_id = row.spot_id if row.spot_id in known_spot_ids else spot_ids_by_name.get(row.spot_name)
+        if spot_id is None:
+            report.fail(line, [f"Spot '{row.spot_name or row.spot_id}' not found"])
+        elif row.surfboard_id is not None and row.surfboard_id not in owned_board_ids:
+            report.fail(line, [f"Surfboard {row.surfboard_id} not found"])
+        else:
+            row.spot_id = spot_id
+            accepted.append((line, row))
+    if not accepted:
+        return
+
+    by_spot: dict[int, list[int]] = defaultdict(list)
+    for index, (_, row) in enumerate(accepted):
+        by_spot[row.spot_id].append(index)
+    weather: list[dict[str, Any] | None] = [None] * len(accepted)
+    for spot_id, indexes in by_spot.items():
+        windows = [(accepted[i][1].datetime, accepted[i][1].duration_minutes) for i in indexes]
+        for index, session_weather in zip(indexes, await get_weather_for_sessions(db, spot_id, windows), strict=True):
+            weather[index] = session_weather
+
+    session_rows = []
+    for (_, row), session_weather in zip(accepted, weather, strict=True):
+        values = row.model_dump(exclude={"review", "spot_name", "save_surfboard_to_quiver"})
+        values["user_id"] = user_id
+        values.update(dict.fromkeys(WEATHER_FIELDS), **(session_weather or {}))
+        session_rows.append(values)
+    # Core executemany skips the ORM bulk path's per-row bookkeeping; PostgreSQL sends it as
+    # multi-row INSERTs ("insertmanyvalues"), SQLite one row at a time to keep RETURNING ordered.
+    sessions_table = SurfSession.__table__
+    result = await db.execute(
+        insert(sessions_table).returning(sessions_table.c.id, sort_by_parameter_order=True),
+        session_rows,
+    )
+    session_ids = result.scalars().all()
+
+    review_rows = []
+    for session_id, (_, row) in zip(session_ids, accepted, strict=True):
+        if row.review is not None:
+            review_rows.append(
+                {
+                    **row.review.model_dump(exclude={"observed_at"}),
+                    "surf_session_id": session_id,
+                    "spot_id": row.spot_id,
+                    "user_id": user_id,
+                    "observed_at": row.review.observed_at or row.datetime,
+                }
+            )
+    if review_rows:
+        await db.execute(insert(SurfSessionReview.__table__), review_rows)
+        await add_reviews_to_daily(
+            db,
+            (
+                ReviewContribution(
+                    review_id=None,
+                    spot_id=review["spot_id"],
+                    observed_at=review["observed_at"],
+                    metrics={metric: review[metric] for metric in REVIEW_METRICS},
+                )
+                for review in review_rows
+            ),
+        )
+    await add_sessions_to_activity(
+        db,
+        (
+            ActivityContribution(
+                user_id=user_id,
+                spot_id=row.spot_id,
+                day=row.datetime.date(),
+                minutes=row.duration_minutes,
+                quality=row.review.quality if row.review is not None else None,
+            )
+            for _, row in accepted
+        ),
+    )
+    await db.commit()
+    if review_rows:
+        bump_spot_catalogue_version()
+    report.imported += len(accepted)
+
+
+async def import_surf_sessions(
+    db: AsyncSession,
+    user_id: int,
+    chunks: AsyncIterator[bytes],
+    import_format: str,
+) -> dict[str, Any]:
+    """Import every valid row of a CSV/NDJSON upload; returns counts and per-line errors."""
+    parse_rows = _csv_rows if import_format == "csv" else _ndjson_rows
+    report = ImportReport()
+    batch: list[tuple[int, SurfSessionCreate]] = []
+    async for line, payload in parse_rows(_lines(chunks)):
+        if isinstance(payload, str):
+            report.fail(line, [payload])
+            continue
+        try:
+            batch.append((line, SurfSessionCreate.model_validate(payload)))
+        except PydanticValidationError as e:
+            report.fail(line, _validation_messages(e))
+            continue
+        if len(batch) >= IMPORT_BATCH_SIZE:
+            await _write_batch(db, user_id, batch, report)
+            batch = []
+    if batch:
+        await _write_batch(db, user_id, batch, report)
+    return report.as_dict()
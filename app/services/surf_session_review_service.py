@@ -1,35 +1,32 @@
 from __future__ import annotations
 
-from datetime import date, datetime, timedelta, timezone
-from typing import Iterable
+from datetime import datetime, timezone
+from typing import Iterable, Sequence
 
-from sqlalchemy import desc, select
+from sqlalchemy import Row, Select, desc, func, select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
 
-from app.models import SurfSessionReview
-from app.schemas.surf_session_review import SpotReviewSummaryResponse
+from app.core.serialization import schema_columns
+from app.models import SpotReviewDaily, SurfSessionReview
+from app.schemas.surf_session_review import SpotReviewResponse, SpotReviewSummaryResponse
 
+SPOT_REVIEW_ROW_KEYS, SPOT_REVIEW_ROW_COLUMNS = schema_columns(SpotReviewResponse, SurfSessionReview.__table__)
 
-def _weight_for_hours_diff(hours_diff: float) -> float:
-    return 1.0 / (1.0 + abs(hours_diff))
 
-
-def _weighted_metric_average(
-    rows: Iterable[tuple[SurfSessionReview, float]],
-    metric: str,
-) -> float | None:
-    weighted_total = 0.0
-    weight_sum = 0.0
-    for review, hours_diff in rows:
-        value = getattr(review, metric)
-        if value is None:
-            continue
-        weight = _weight_for_hours_diff(hours_diff)
-        weighted_total += float(value) * weight
-        weight_sum += weight
-    if weight_sum == 0:
-        return None
-    return weighted_total / weight_sum
+def _filter_spot_reviews(
+    stmt: Select,
+    spot_id: int,
+    limit: int,
+    offset: int,
+    after: tuple[datetime, int] | None,
+) -> Select:
+    stmt = stmt.where(SurfSessionReview.spot_id == spot_id)
+    if after is not None:
+        stmt = stmt.where(tuple_(SurfSessionReview.observed_at, SurfSessionReview.id) < tuple_(*after))
+    else:
+        stmt = stmt.offset(max(offset, 0))
+    return stmt.order_by(desc(SurfSessionReview.observed_at), desc(SurfSessionReview.id)).limit(max(limit, 1))
 
 
 async def list_spot_reviews(
@@ -37,17 +34,29 @@ async def list_spot_reviews(
     spot_id: int,
     limit: int = 50,
     offset: int = 0,
+    after: tuple[datetime, int] | None = None,
 ) -> list[SurfSessionReview]:
-    result = await db.execute(
-        select(SurfSessionReview)
-        .where(SurfSessionReview.spot_id == spot_id)
-        .order_by(desc(SurfSessionReview.observed_at))
-        .offset(max(offset, 0))
-        .limit(max(limit, 1))
-    )
+    """List a spot's reviews newest first.
+
+    ``after`` is a keyset position ``(observed_at, id)``; when given, rows strictly
+    older than it are returned and ``offset`` is ignored.
+    """
+    result = await db.execute(_filter_spot_reviews(select(SurfSessionReview), spot_id, limit, offset, after))
     return result.scalars().all()
 
 
+async def list_spot_review_rows(
+    db: AsyncSession,
+    spot_id: int,
+    limit: int = 50,
+    offset: int = 0,
+    after: tuple[datetime, int] | None = None,
+) -> Sequence[Row]:
+    """Read-only ``list_spot_reviews``: named-tuple rows of the ``SpotReviewResponse`` columns, in field order."""
+    result = await db.execute(_filter_spot_reviews(select(*SPOT_REVIEW_ROW_COLUMNS), spot_id, limit, offset, after))
+    return result.all()
+
+
 async def get_recent_spot_reviews(
     db: AsyncSession,
     spot_id: int,
@@ -56,58 +65,91 @@ async def get_recent_spot_reviews(
     return await list_spot_reviews(db, spot_id=spot_id, limit=limit, offset=0)
 
 
-async def _get_reviews_for_date(
-    db: AsyncSession,
-    spot_id: int,
-    target_date: date,
-) -> list[SurfSessionReview]:
-    """Fetch reviews for a specific spot on a specific date, filtered in SQL."""
-    start_of_day = datetime.combine(target_date, datetime.min.time())
-    end_of_day = start_of_day + timedelta(days=1)
+def _ranked_reviews(spot_ids: list[int]):
+    """Reviews of ``spot_ids`` numbered newest first within each spot."""
+    row_number = (
+        func.row_number()
+        .over(
+            partition_by=SurfSessionReview.spot_id,
+            order_by=(desc(SurfSessionReview.observed_at), desc(SurfSessionReview.id)),
+        )
+        .label("row_number")
+    )
+    return (
+        select(SurfSessionReview, row_number)
+        .where(SurfSessionReview.spot_id.in_(spot_ids))
+        .subquery()
+    )
 
+
+async def get_recent_reviews_by_spot(
+    db: AsyncSession,
+    spot_ids: Iterable[int],
+    limit: int = 3,
+) -> dict[int, list[SurfSessionReview]]:
+    """Fetch the latest ``limit`` reviews for every spot in a single windowed query."""
+    spot_ids = list(spot_ids)
+    if not spot_ids:
+        return {}
+
+    ranked = _ranked_reviews(spot_ids)
+    ranked_review = aliased(SurfSessionReview, ranked)
     result = await db.execute(
-        select(SurfSessionReview)
-        .where(
-            SurfSessionReview.spot_id == spot_id,
-            SurfSessionReview.observed_at >= start_of_day,
-            SurfSessionReview.observed_at < end_of_day,
-        )
-        .order_by(desc(SurfSessionReview.observed_at))
+        select(ranked_review)
+        .where(ranked.c.row_number <= max(limit, 1))
+        .order_by(ranked.c.spot_id, ranked.c.row_number)
     )
-    return result.scalars().all()
 
+    reviews_by_spot: dict[int, list[SurfSessionReview]] = {spot_id: [] for spot_id in spot_ids}
+    for review in result.scalars().all():
+        reviews_by_spot[review.spot_id].append(review)
+    return reviews_by_spot
 
-def _compute_weighted_summary(
-    reviews: list[SurfSessionReview],
-    now_value: datetime,
-) -> SpotReviewSummaryResponse:
-    """Build a weighted summary from reviews already filtered to today."""
-    if not reviews:
-        return SpotReviewSummaryResponse(review_count=0)
 
-    today_rows: list[tuple[SurfSessionReview, float]] = []
-    for review in reviews:
-        if review.observed_at is None:
-            continue
-        diff_hours = abs((now_value - review.observed_at).total_seconds()) / 3600
-        today_rows.append((review, diff_hours))
+async def get_recent_review_rows_by_spot(
+    db: AsyncSession,
+    spot_ids: Iterable[int],
+    limit: int = 3,
+) -> dict[int, list[dict]]:
+    """``get_recent_reviews_by_spot`` as ``SpotReviewResponse``-shaped dicts, without ORM objects."""
+    spot_ids = list(spot_ids)
+    if not spot_ids:
+        return {}
+
+    ranked = _ranked_reviews(spot_ids)
+    keys = SPOT_REVIEW_ROW_KEYS
+    result = await db.execute(
+        select(ranked.c.spot_id, *(ranked.c[key] for key in keys))
+        .where(ranked.c.row_number <= max(limit, 1))
+        .order_by(ranked.c.spot_id, ranked.c.row_number)
+    )
+
+    reviews_by_spot: dict[int, list[dict]] = {spot_id: [] for spot_id in spot_ids}
+    for spot_id, *values in result.tuples():
+        reviews_by_spot[spot_id].append(dict(zip(keys, values, strict=True)))
+    return reviews_by_spot
 
-    if not today_rows:
+
+def _summary_from_daily(row: Row | None) -> SpotReviewSummaryResponse:
+    if row is None or row.review_count <= 0:
         return SpotReviewSummaryResponse(review_count=0)
 
-    latest_observed_at = max(
-        (r.observed_at for r, _ in today_rows if r.observed_at is not None),
-        default=None,
-    )
+    def _average(metric: str) -> float | None:
+        if getattr(row, f"{metric}_count") <= 0:
+            return None
+        weight_sum = getattr(row, f"{metric}_weight_sum")
+        if weight_sum <= 0:
+            return None
+        return getattr(row, f"{metric}_weighted_sum") / weight_sum
 
     return SpotReviewSummaryResponse(
-        weighted_quality=_weighted_metric_average(today_rows, "quality"),
-        avg_crowded_level=_weighted_metric_average(today_rows, "crowded_level"),
-        avg_wave_height_index=_weighted_metric_average(today_rows, "wave_height_index"),
-        avg_short_long_index=_weighted_metric_average(today_rows, "short_long_index"),
-        avg_wind_index=_weighted_metric_average(today_rows, "wind_index"),
-        review_count=len(today_rows),
-        latest_observed_at=latest_observed_at,
+        weighted_quality=_average("quality"),
+        avg_crowded_level=_average("crowded_level"),
+        avg_wave_height_index=_average("wave_height_index"),
+        avg_short_long_index=_average("short_long_index"),
+        avg_wind_index=_average("wind_index"),
+        review_count=row.review_count,
+        latest_observed_at=row.latest_observed_at,
     )
 
 
@@ -116,6 +158,25 @@ async def get_spot_review_summary(
     spot_id: int,
     now: datetime | None = None,
 ) -> SpotReviewSummaryResponse:
+    summaries = await get_spot_review_summaries(db, [spot_id], now=now)
+    return summaries[spot_id]
+
+
+async def get_spot_review_summaries(
+    db: AsyncSession,
+    spot_ids: Iterable[int],
+    now: datetime | None = None,
+) -> dict[int, SpotReviewSummaryResponse]:
+    """Read today's weighted summaries for many spots from the daily aggregate table."""
+    spot_ids = list(spot_ids)
+    if not spot_ids:
+        return {}
+
     now_value = now or datetime.now(timezone.utc).replace(tzinfo=None)
-    today_reviews = await _get_reviews_for_date(db, spot_id, now_value.date())
-    return _compute_weighted_summary(today_reviews, now_value)
+    # Plain rows: nothing is mutated, so the identity map (and populate_existing) is not needed.
+    daily = SpotReviewDaily.__table__
+    result = await db.execute(
+        select(daily).where(daily.c.spot_id.in_(spot_ids), daily.c.date == now_value.date())
+    )
+    rows = {row.spot_id: row for row in result.all()}
+    return {spot_id: _summary_from_daily(rows.get(spot_id)) for spot_id in spot_ids}
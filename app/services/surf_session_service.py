@@ -1,15 +1,46 @@
+from datetime import datetime
+
 from fastapi import status
-from sqlalchemy import delete, select
+from sqlalchemy import Select, delete, desc, select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import joinedload, selectinload
 
 from app.core.exceptions import BusinessLogicError
-from app.models import SurfSession, SurfSessionReview
-from app.schemas.surf_session import SurfSessionCreate
+from app.core.serialization import schema_columns
+from app.models import Spot, Surfboard, SurfSession, SurfSessionReview
+from app.schemas.surf_session import DIRECTION_FIELDS, SurfSessionCreate, SurfSessionFlatResponse, coerce_direction
+from app.schemas.surf_session_review import SurfSessionReviewResponse
 from app.schemas.surfboard import SurfboardCreate
 from app.services.session_forecast_service import get_weather_for_session
-from app.services.spot_service import get_spot_by_name
-from app.services.surfboard_service import create_surfboard
+from app.services.spot_catalogue_cache import bump_spot_catalogue_version
+from app.services.spot_review_daily_service import (
+    add_review_to_daily,
+    remove_review_from_daily,
+    review_contribution,
+)
+from app.services.spot_service import SPOT_ROW_COLUMNS, resolve_spot_id, spot_row_dict
+from app.services.surfboard_service import SURFBOARD_ROW_COLUMNS, SURFBOARD_ROW_KEYS, build_surfboard
+from app.services.user_activity_daily_service import (
+    add_session_to_activity,
+    remove_session_from_activity,
+    replace_session_in_activity,
+    session_contribution,
+)
+
+# Column layout of the list fast path: SurfSessionFlatResponse fields around the nested
+# review, then the embedded spot and surfboard.
+_FLAT_FIELDS = tuple(SurfSessionFlatResponse.model_fields)
+SESSION_HEAD_KEYS, SESSION_HEAD_COLUMNS = schema_columns(
+    SurfSessionFlatResponse, SurfSession.__table__, _FLAT_FIELDS[: _FLAT_FIELDS.index("review")]
+)
+SESSION_TAIL_KEYS, SESSION_TAIL_COLUMNS = schema_columns(
+    SurfSessionFlatResponse, SurfSession.__table__, _FLAT_FIELDS[_FLAT_FIELDS.index("review") + 1 :]
+)
+REVIEW_ROW_KEYS, REVIEW_ROW_COLUMNS = schema_columns(SurfSessionReviewResponse, SurfSessionReview.__table__)
+_REVIEW_START = len(SESSION_HEAD_COLUMNS)
+_TAIL_START = _REVIEW_START + len(REVIEW_ROW_COLUMNS)
+_RELATED_START = _TAIL_START + len(SESSION_TAIL_COLUMNS)
+_SURFBOARD_START = _RELATED_START + len(SPOT_ROW_COLUMNS)
 
 
 async def _resolve_spot_name_to_id(db: AsyncSession, session_data: dict) -> None:
@@ -18,20 +49,20 @@ async def _resolve_spot_name_to_id(db: AsyncSession, session_data: dict) -> None
     if spot_name is None:
         return
 
-    spot = await get_spot_by_name(db, spot_name)
-    if spot is None:
+    spot_id = await resolve_spot_id(db, spot_name)
+    if spot_id is None:
         raise BusinessLogicError(
             f"Spot '{spot_name}' not found",
             code="SPOT_NOT_FOUND",
             status_code=status.HTTP_404_NOT_FOUND,
         )
-    session_data["spot_id"] = spot.id
+    session_data["spot_id"] = spot_id
 
 
 async def _maybe_create_quiver_surfboard(
     db: AsyncSession, session_data: dict, user_id: int
 ) -> None:
-    """Create a surfboard owned by the user when requested and attach its id."""
+    """Attach a new surfboard owned by the user when requested; it is inserted with the session."""
     should_save = bool(session_data.pop("save_surfboard_to_quiver", False))
     # If user selected an existing board, nothing to do.
     if session_data.get("surfboard_id") is not None or not should_save:
@@ -45,8 +76,7 @@ async def _maybe_create_quiver_surfboard(
             status_code=status.HTTP_400_BAD_REQUEST,
         )
 
-    surfboard = await create_surfboard(
-        db,
+    session_data["surfboard"] = build_surfboard(
         SurfboardCreate(
             name=session_data.get("surfboard_name"),
             brand=session_data.get("surfboard_brand"),
@@ -58,7 +88,41 @@ async def _maybe_create_quiver_surfboard(
         ),
         owner_id=user_id,
     )
-    session_data["surfboard_id"] = surfboard.id
+
+
+async def _attach_related(db: AsyncSession, surf_session_model: SurfSession) -> None:
+    """Point ``spot``/``surfboard`` at the rows behind their ids so the response needs no re-select.
+
+    Unchanged relationships cost nothing; otherwise each is one primary-key lookup
+    (free on an identity-map hit). Lookups run before any assignment so a 404 leaves
+    the session untouched.
+    """
+    spot = surf_session_model.spot
+    if surf_session_model.spot_id is not None and (spot is None or spot.id != surf_session_model.spot_id):
+        spot = await db.get(Spot, surf_session_model.spot_id)
+        if spot is None:
+            raise BusinessLogicError(
+                "Spot not found",
+                code="SPOT_NOT_FOUND",
+                status_code=status.HTTP_404_NOT_FOUND,
+            )
+
+    surfboard = surf_session_model.surfboard
+    if surfboard is not None and surfboard.id is None:
+        pass  # new quiver board, flushed together with the session
+    elif surf_session_model.surfboard_id is None:
+        surfboard = None
+    elif surfboard is None or surfboard.id != surf_session_model.surfboard_id:
+        surfboard = await db.get(Surfboard, surf_session_model.surfboard_id)
+        if surfboard is None:
+            raise BusinessLogicError(
+                "Surfboard not found",
+                code="SURFBOARD_NOT_FOUND",
+                status_code=status.HTTP_404_NOT_FOUND,
+            )
+
+    surf_session_model.spot = spot
+    surf_session_model.surfboard = surfboard
 
 
 async def create_surf_session(
@@ -67,6 +131,11 @@ async def create_surf_session(
     user_id: int,
     review_data: dict | None = None,
 ) -> SurfSession:
+    """Insert a session (and its review) and return it fully populated.
+
+    Inserts use ``RETURNING`` for generated columns and the relationships are the
+    objects loaded or built here, so nothing is refreshed or re-selected after commit.
+    """
 
     await _resolve_spot_name_to_id(db, surf_session_data)
     await _maybe_create_quiver_surfboard(db, surf_session_data, user_id)
@@ -88,34 +157,32 @@ async def create_surf_session(
         **weather_data,
         user_id=user_id,
     )
-    db.add(surf_session_model)
-    await db.flush()
+    await _attach_related(db, surf_session_model)
 
+    review_model = None
     if review_data is not None:
         observed_at = review_data.pop("observed_at", None) or surf_session_model.datetime
-        db.add(
-            SurfSessionReview(
-                surf_session_id=surf_session_model.id,
-                spot_id=surf_session_model.spot_id,
-                user_id=user_id,
-                observed_at=observed_at,
-                **review_data,
-            )
+        review_model = SurfSessionReview(
+            spot_id=surf_session_model.spot_id,
+            user_id=user_id,
+            observed_at=observed_at,
+            **review_data,
         )
+    surf_session_model.review = review_model
+    db.add(surf_session_model)
+    await db.flush()
 
-    await db.commit()
-    await db.refresh(surf_session_model)
-
-    result = await db.execute(
-        select(SurfSession)
-        .options(
-            selectinload(SurfSession.spot),
-            selectinload(SurfSession.surfboard),
-            selectinload(SurfSession.review),
-        )
-        .where(SurfSession.id == surf_session_model.id)
+    if review_model is not None:
+        await add_review_to_daily(db, review_model)
+    await add_session_to_activity(
+        db,
+        session_contribution(surf_session_model, review_model.quality if review_model is not None else None),
     )
-    return result.scalars().first()
+
+    await db.commit()
+    if review_model is not None:
+        bump_spot_catalogue_version()
+    return surf_session_model
 
 
 async def get_surf_session(
@@ -127,9 +194,9 @@ async def get_surf_session(
     result = await db.execute(
         select(SurfSession)
         .options(
-            selectinload(SurfSession.spot),
-            selectinload(SurfSession.surfboard),
-            selectinload(SurfSession.review),
+            joinedload(SurfSession.spot),
+            joinedload(SurfSession.surfboard),
+            joinedload(SurfSession.review),
         )
         .where(
             SurfSession.id == surf_session_id,
@@ -139,23 +206,136 @@ async def get_surf_session(
     return result.scalars().first()
 
 
+def _filter_session_list(
+    stmt: Select,
+    user_id: int,
+    start: datetime | None,
+    end: datetime | None,
+    spot_id: int | None,
+    limit: int | None,
+    after: tuple[datetime, int] | None,
+) -> Select:
+    stmt = stmt.where(SurfSession.user_id == user_id)
+    if start is not None:
+        stmt = stmt.where(SurfSession.datetime >= start)
+    if end is not None:
+        stmt = stmt.where(SurfSession.datetime < end)
+    if spot_id is not None:
+        stmt = stmt.where(SurfSession.spot_id == spot_id)
+    if after is not None:
+        stmt = stmt.where(tuple_(SurfSession.datetime, SurfSession.id) < tuple_(*after))
+    if limit is not None:
+        stmt = stmt.limit(max(limit, 1))
+    return stmt.order_by(desc(SurfSession.datetime), desc(SurfSession.id))
+
+
 async def list_surf_sessions(
     db: AsyncSession,
     user_id: int,
+    start: datetime | None = None,
+    end: datetime | None = None,
+    spot_id: int | None = None,
+    limit: int | None = None,
+    after: tuple[datetime, int] | None = None,
 ) -> list[SurfSession]:
+    """List a user's sessions newest first.
 
+    ``start`` is inclusive and ``end`` exclusive. ``after`` is a keyset position
+    ``(datetime, id)``; when given, only sessions strictly older than it are returned.
+    """
+    stmt = _filter_session_list(select(SurfSession), user_id, start, end, spot_id, limit, after)
     result = await db.execute(
-        select(SurfSession)
-        .options(
+        stmt.options(
             selectinload(SurfSession.spot),
             selectinload(SurfSession.surfboard),
             selectinload(SurfSession.review),
         )
-        .where(SurfSession.user_id == user_id)
     )
     return result.scalars().all()
 
 
+def _flat_session_dict(row) -> dict:
+    session = dict(zip(SESSION_HEAD_KEYS, row[:_REVIEW_START], strict=True))
+    # Outer-joined: a session without a review has a NULL review id.
+    has_review = row[_REVIEW_START] is not None
+    session["review"] = dict(zip(REVIEW_ROW_KEYS, row[_REVIEW_START:_TAIL_START], strict=True)) if has_review else None
+    session.update(zip(SESSION_TAIL_KEYS, row[_TAIL_START:_RELATED_START], strict=True))
+    for field in DIRECTION_FIELDS:
+        session[field] = coerce_direction(session[field])
+    return session
+
+
+async def list_surf_session_rows(
+    db: AsyncSession,
+    user_id: int,
+    start: datetime | None = None,
+    end: datetime | None = None,
+    spot_id: int | None = None,
+    limit: int | None = None,
+    after: tuple[datetime, int] | None = None,
+    embed_related: bool = True,
+) -> list[dict]:
+    """``list_surf_sessions`` as response-shaped dicts from a single joined Core query.
+
+    With ``embed_related`` each dict is a ``SurfSessionResponse``; otherwise it is a
+    ``SurfSessionFlatResponse`` and :func:`get_related_rows_for_sessions` loads the rest.
+    """
+    columns = [*SESSION_HEAD_COLUMNS, *REVIEW_ROW_COLUMNS, *SESSION_TAIL_COLUMNS]
+    if embed_related:
+        columns += [*SPOT_ROW_COLUMNS, *SURFBOARD_ROW_COLUMNS]
+    stmt = select(*columns).select_from(SurfSession).outerjoin(
+        SurfSessionReview, SurfSessionReview.surf_session_id == SurfSession.id
+    )
+    if embed_related:
+        stmt = stmt.join(Spot, Spot.id == SurfSession.spot_id).outerjoin(
+            Surfboard, Surfboard.id == SurfSession.surfboard_id
+        )
+    result = await db.execute(_filter_session_list(stmt, user_id, start, end, spot_id, limit, after))
+    if not embed_related:
+        return [_flat_session_dict(row) for row in result.tuples()]
+
+    # Spots and boards repeat across sessions; build each dict once and share it.
+    spots: dict[int, dict] = {}
+    surfboards: dict[int, dict] = {}
+    sessions = []
+    for row in result.tuples():
+        session = _flat_session_dict(row)
+        spot = spots.get(session["spot_id"])
+        if spot is None:
+            spot = spots[session["spot_id"]] = spot_row_dict(row[_RELATED_START:_SURFBOARD_START])
+        session["spot"] = spot
+        surfboard = None
+        if session["surfboard_id"] is not None:
+            surfboard = surfboards.get(session["surfboard_id"])
+            if surfboard is None:
+                surfboard = surfboards[session["surfboard_id"]] = dict(
+                    zip(SURFBOARD_ROW_KEYS, row[_SURFBOARD_START:], strict=True)
+                )
+        session["surfboard"] = surfboard
+        sessions.append(session)
+    return sessions
+
+
+async def get_related_rows_for_sessions(
+    db: AsyncSession,
+    sessions: list[dict],
+) -> tuple[dict[int, dict], dict[int, dict]]:
+    """Response-shaped spots and surfboards behind ``sessions`` keyed by id, one ``IN`` query each."""
+    spot_ids = {session["spot_id"] for session in sessions}
+    surfboard_ids = {session["surfboard_id"] for session in sessions if session["surfboard_id"] is not None}
+    spots: dict[int, dict] = {}
+    surfboards: dict[int, dict] = {}
+    if spot_ids:
+        result = await db.execute(select(*SPOT_ROW_COLUMNS).where(Spot.id.in_(spot_ids)).order_by(Spot.id))
+        spots = {row[0]: spot_row_dict(row) for row in result.tuples()}
+    if surfboard_ids:
+        result = await db.execute(
+            select(*SURFBOARD_ROW_COLUMNS).where(Surfboard.id.in_(surfboard_ids)).order_by(Surfboard.id)
+        )
+        surfboards = {row[0]: dict(zip(SURFBOARD_ROW_KEYS, row, strict=True)) for row in result.tuples()}
+    return spots, surfboards
+
+
 async def update_surf_session(
     db: AsyncSession,
     surf_session_id: int,
@@ -179,12 +359,23 @@ async def update_surf_session(
     await _resolve_spot_name_to_id(db, update_dict)
     await _maybe_create_quiver_surfboard(db, update_dict, user_id)
 
+    previous_review = (
+        review_contribution(surf_session_model.review)
+        if surf_session_model.review is not None
+        else None
+    )
+    previous_activity = session_contribution(
+        surf_session_model,
+        surf_session_model.review.quality if surf_session_model.review is not None else None,
+    )
+
     for field, value in update_dict.items():
         setattr(surf_session_model, field, value)
+    await _attach_related(db, surf_session_model)
 
     if review_payload is None:
-        if surf_session_model.review is not None:
-            await db.delete(surf_session_model.review)
+        # delete-orphan removes the row and leaves the in-memory session without a review.
+        surf_session_model.review = None
     else:
         observed_at = review_payload.pop("observed_at", None) or surf_session_model.datetime
         if surf_session_model.review is None:
@@ -205,6 +396,22 @@ async def update_surf_session(
             surf_session_model.review.short_long_index = review_payload["short_long_index"]
             surf_session_model.review.wind_index = review_payload["wind_index"]
 
+    current_review = (
+        review_contribution(surf_session_model.review)
+        if surf_session_model.review is not None
+        else None
+    )
+    review_changed = current_review != previous_review
+    if review_changed and previous_review is not None:
+        await remove_review_from_daily(db, previous_review)
+    if review_changed and current_review is not None:
+        await add_review_to_daily(db, surf_session_model.review)
+    await replace_session_in_activity(
+        db,
+        previous_activity,
+        session_contribution(surf_session_model, review_payload["quality"] if review_payload is not None else None),
+    )
+
     if weather_relevant_changed and surf_session_model.spot_id is not None:
         session_weather = await get_weather_for_session(
             db,
@@ -232,18 +439,9 @@ async def update_surf_session(
             )
 
     await db.commit()
-    await db.refresh(surf_session_model)
-
-    result = await db.execute(
-        select(SurfSession)
-        .options(
-            selectinload(SurfSession.spot),
-            selectinload(SurfSession.surfboard),
-            selectinload(SurfSession.review),
-        )
-        .where(SurfSession.id == surf_session_model.id)
-    )
-    return result.scalars().first()
+    if review_changed:
+        bump_spot_catalogue_version()
+    return surf_session_model
 
 
 async def delete_surf_session(
@@ -252,6 +450,25 @@ async def delete_surf_session(
     user_id: int,
 ) -> bool:
 
+    session_result = await db.execute(
+        select(SurfSession)
+        .options(joinedload(SurfSession.review))
+        .where(
+            SurfSession.id == surf_session_id,
+            SurfSession.user_id == user_id,
+        )
+    )
+    surf_session_model = session_result.scalars().first()
+    if surf_session_model is None:
+        return False
+    review = surf_session_model.review
+    if review is not None:
+        await remove_review_from_daily(db, review_contribution(review))
+    await remove_session_from_activity(
+        db,
+        session_contribution(surf_session_model, review.quality if review is not None else None),
+    )
+
     result = await db.execute(
         delete(SurfSession).where(
             SurfSession.id == surf_session_id,
@@ -259,4 +476,6 @@ async def delete_surf_session(
         )
     )
     await db.commit()
+    if review is not None:
+        bump_spot_catalogue_version()
     return result.rowcount > 0
@@ -0,0 +1,200 @@
+"""Aggregates behind the dashboard: totals, spot/board breakdowns and chart buckets.
+
+The windows mirror ``frontend/src/utils/stats.ts``: ``week``/``month``/``3month``
+are the last 7/30/90 days ending on ``base_date`` (the UTC date by default); ``all`` covers every session
+while its chart shows the last ``ALL_TIME_CHART_MONTHS`` months.
+
+Totals, spots and buckets are summed from the ``user_activity_daily`` rollup;
+only the surfboard breakdown still reads ``surf_sessions``.
+"""
+
+from __future__ import annotations
+
+from datetime import date, datetime, time, timedelta, timezone
+
+from sqlalchemy import desc, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import Spot, Surfboard, SurfSession, UserActivityDaily
+
+STATS_RANGE_DAYS = {"week": 7, "month": 30, "3month": 90}
+DEFAULT_STATS_BUCKETS = {"week": "day", "month": "day", "3month": "week", "all": "month"}
+ALL_TIME_CHART_MONTHS = 12
+
+
+def _add_months(day: date, months: int) -> date:
+    month_index = day.year * 12 + day.month - 1 + months
+    return date(month_index // 12, month_index % 12 + 1, 1)
+
+
+def stats_window(range_: str, base_date: date) -> tuple[date | None, date]:
+    """``(start, end)`` of the totals window; ``end`` is exclusive and ``start`` is None for ``all``."""
+    end = base_date + timedelta(days=1)
+    if range_ == "all":
+        return None, end
+    return end - timedelta(days=STATS_RANGE_DAYS[range_]), end
+
+
+def _chart_start(range_: str, base_date: date) -> date:
+    start, _ = stats_window(range_, base_date)
+    if start is not None:
+        return start
+    return _add_months(base_date.replace(day=1), -(ALL_TIME_CHART_MONTHS - 1))
+
+
+def _bucket_starts(bucket: str, chart_start: date, end: date) -> list[date]:
+    starts = []
+    current = chart_start.replace(day=1) if bucket == "month" else chart_start
+    while current < end:
+        starts.append(current)
+        if bucket == "month":
+            current = _add_months(current, 1)
+        else:
+            current += timedelta(days=1 if bucket == "day" else 7)
+    return starts
+
+
+def _bucket_start(bucket: str, day: date, chart_start: date) -> date:
+    """Start of the bucket holding ``day``; weeks are 7-day blocks counted from ``chart_start``."""
+    if bucket == "day":
+        return day
+    if bucket == "month":
+        return day.replace(day=1)
+    return chart_start + timedelta(weeks=(day - chart_start).days // 7)
+
+
+def _as_day(value) -> date:
+    # SQLite hands aggregated DATE columns back as ISO strings.
+    return value if isinstance(value, date) else date.fromisoformat(value)
+
+
+def _average(total, count) -> float | None:
+    return float(total) / count if count else None
+
+
+def _activity_filters(user_id: int, start: date | None, end: date | None) -> list:
+    filters = [UserActivityDaily.user_id == user_id]
+    if start is not None:
+        filters.append(UserActivityDaily.date >= start)
+    if end is not None:
+        filters.append(UserActivityDaily.date < end)
+    return filters
+
+
+def _period_filters(user_id: int, start: date | None, end: date | None) -> list:
+    filters = [SurfSession.user_id == user_id]
+    if start is not None:
+        filters.append(SurfSession.datetime >= datetime.combine(start, time.min))
+    if end is not None:
+        filters.append(SurfSession.datetime < datetime.combine(end, time.min))
+    return filters
+
+
+async def get_surf_session_stats(
+    db: AsyncSession,
+    user_id: int,
+    range_: str,
+    bucket: str | None = None,
+    base_date: date | None = None,
+) -> dict:
+    # Session datetimes are stored as naive UTC, so "today" is the UTC date, not the server's local one.
+    base_date = base_date or datetime.now(timezone.utc).date()
+    bucket = bucket or DEFAULT_STATS_BUCKETS[range_]
+    start, end = stats_window(range_, base_date)
+    filters = _period_filters(user_id, start, end if range_ != "all" else None)
+    activity_filters = _activity_filters(user_id, start, end if range_ != "all" else None)
+
+    totals = (
+        await db.execute(
+            select(
+                func.coalesce(func.sum(UserActivityDaily.session_count), 0),
+                func.coalesce(func.sum(UserActivityDaily.total_minutes), 0),
+                func.coalesce(func.sum(UserActivityDaily.quality_sum), 0),
+                func.coalesce(func.sum(UserActivityDaily.reviewed_count), 0),
+            ).where(*activity_filters)
+        )
+    ).one()
+
+    spot_count = func.sum(UserActivityDaily.session_count).label("sessions_count")
+    spots = (
+        await db.execute(
+            select(Spot.name, spot_count)
+            .join(Spot, Spot.id == UserActivityDaily.spot_id)
+            .where(*activity_filters)
+            .group_by(Spot.id, Spot.name)
+            .order_by(desc(spot_count), Spot.name)
+        )
+    ).all()
+
+    # Same fallback chain as the dashboard: quiver board, then the inline name, then brand + model.
+    brand_model = func.coalesce(SurfSession.surfboard_brand, "") + " " + func.coalesce(SurfSession.surfboard_model, "")
+    board_name = func.coalesce(
+        func.nullif(Surfboard.name, ""),
+        func.nullif(SurfSession.surfboard_name, ""),
+        func.nullif(func.trim(brand_model), ""),
+    ).label("name")
+    board_length = func.coalesce(Surfboard.length_ft, SurfSession.surfboard_length_ft).label("length_ft")
+    boards_rows = (
+        select(board_name, board_length, SurfSession.id)
+        .outerjoin(Surfboard, Surfboard.id == SurfSession.surfboard_id)
+        .where(*filters)
+        .subquery()
+    )
+    board_count = func.count(boards_rows.c.id).label("sessions_count")
+    surfboards = (
+        await db.execute(
+            select(boards_rows.c.name, boards_rows.c.length_ft, board_count)
+            .where(boards_rows.c.name.is_not(None))
+            .group_by(boards_rows.c.name, boards_rows.c.length_ft)
+            .order_by(desc(board_count), boards_rows.c.name)
+        )
+    ).all()
+
+    chart_start = _chart_start(range_, base_date)
+    daily = await db.execute(
+        select(
+            UserActivityDaily.date,
+            func.sum(UserActivityDaily.session_count),
+            func.sum(UserActivityDaily.total_minutes),
+            func.sum(UserActivityDaily.quality_sum),
+            func.sum(UserActivityDaily.reviewed_count),
+        )
+        .where(*_activity_filters(user_id, chart_start, end))
+        .group_by(UserActivityDaily.date)
+    )
+    # At most a year of days, so folding them into buckets here beats dialect-specific SQL.
+    by_start: dict[date, list[int]] = {}
+    for day, *sums in daily.all():
+        folded = by_start.setdefault(_bucket_start(bucket, _as_day(day), chart_start), [0, 0, 0, 0])
+        for index, value in enumerate(sums):
+            folded[index] += int(value)
+
+    buckets = []
+    for bucket_start in _bucket_starts(bucket, chart_start, end):
+        count, minutes, quality_sum, reviewed = by_start.get(bucket_start, (0, 0, 0, 0))
+        buckets.append(
+            {
+                "start": bucket_start,
+                "sessions_count": count,
+                "total_minutes": minutes,
+                "avg_quality": _average(quality_sum, reviewed),
+            }
+        )
+
+    sessions_count, total_minutes, quality_sum, reviewed = totals
+    return {
+        "range": range_,
+        "bucket": bucket,
+        "start": start,
+        "end": end,
+        "sessions_count": int(sessions_count),
+        "total_minutes": int(total_minutes),
+        "avg_quality": _average(quality_sum, reviewed),
+        "top_spot": spots[0].name if spots else None,
+        "spots": [{"name": row.name, "sessions_count": row.sessions_count} for row in spots],
+        "surfboards": [
+            {"name": row.name, "length_ft": row.length_ft, "sessions_count": row.sessions_count}
+            for row in surfboards
+        ],
+        "buckets": buckets,
+    }
@@ -1,8 +1,11 @@
 from sqlalchemy import delete, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.serialization import schema_columns
 from app.models.surfboard import Surfboard
-from app.schemas.surfboard import SurfboardCreate, SurfboardUpdate
+from app.schemas.surfboard import SurfboardCreate, SurfboardResponse, SurfboardUpdate
+
+SURFBOARD_ROW_KEYS, SURFBOARD_ROW_COLUMNS = schema_columns(SurfboardResponse, Surfboard.__table__)
 
 
 def _maybe_compute_volume_liters(
@@ -19,9 +22,8 @@ def _maybe_compute_volume_liters(
     return cubic_inches * 0.0163871  # in^3 to liters
 
 
-async def create_surfboard(
-    db: AsyncSession, surfboard_create: SurfboardCreate, owner_id: int
-) -> Surfboard:
+def build_surfboard(surfboard_create: SurfboardCreate, owner_id: int) -> Surfboard:
+    """Unsaved ``Surfboard`` for the payload, with volume derived from dimensions when omitted."""
     volume = (
         surfboard_create.volume_liters
         if surfboard_create.volume_liters is not None
@@ -31,7 +33,7 @@ async def create_surfboard(
             surfboard_create.thickness_in,
         )
     )
-    surfboard_model = Surfboard(
+    return Surfboard(
         name=surfboard_create.name,
         brand=surfboard_create.brand,
         model=surfboard_create.model,
@@ -41,6 +43,12 @@ async def create_surfboard(
         volume_liters=volume,
         owner_id=owner_id,
     )
+
+
+async def create_surfboard(
+    db: AsyncSession, surfboard_create: SurfboardCreate, owner_id: int
+) -> Surfboard:
+    surfboard_model = build_surfboard(surfboard_create, owner_id)
     db.add(surfboard_model)
     await db.commit()
     await db.refresh(surfboard_model)
@@ -55,6 +63,11 @@ async def get_surfboards_by_owner_id(db: AsyncSession, owner_id: int) -> list[Su
     result = await db.execute(select(Surfboard).where(Surfboard.owner_id == owner_id))
     return result.scalars().all()
 
+async def list_surfboard_rows(db: AsyncSession, owner_id: int) -> list[dict]:
+    """``get_surfboards_by_owner_id`` as ``SurfboardResponse``-shaped dicts, without ORM objects."""
+    result = await db.execute(select(*SURFBOARD_ROW_COLUMNS).where(Surfboard.owner_id == owner_id))
+    return [dict(zip(SURFBOARD_ROW_KEYS, row, strict=True)) for row in result.tuples()]
+
 async def update_surfboard(
     db: AsyncSession,
     surfboard_id: int,
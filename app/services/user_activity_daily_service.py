@@ -0,0 +1,181 @@
+"""Incrementally maintained per-user daily session rollups (``user_activity_daily``).
+
+Every session write adds or subtracts one contribution inside the caller's
+transaction; ``rebuild_user_activity_daily`` recomputes rows from scratch.
+"""
+
+from __future__ import annotations
+
+from datetime import date
+from typing import Iterable, NamedTuple
+
+from sqlalchemy import delete, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database import dialect_insert
+from app.models import SurfSession, SurfSessionReview, UserActivityDaily
+
+
+class ActivityContribution(NamedTuple):
+    """Snapshot of the session fields that feed the rollup."""
+
+    user_id: int
+    spot_id: int | None
+    day: date
+    minutes: int
+    quality: int | None
+
+
+def session_contribution(surf_session: SurfSession, quality: int | None) -> ActivityContribution:
+    return ActivityContribution(
+        user_id=surf_session.user_id,
+        spot_id=surf_session.spot_id,
+        day=surf_session.datetime.date(),
+        minutes=surf_session.duration_minutes or 0,
+        quality=quality,
+    )
+
+
+def _row_filter(contribution: ActivityContribution):
+    return (
+        UserActivityDaily.user_id == contribution.user_id,
+        UserActivityDaily.date == contribution.day,
+        UserActivityDaily.spot_id == contribution.spot_id,
+    )
+
+
+ACTIVITY_COUNTERS = ("session_count", "total_minutes", "reviewed_count", "quality_sum")
+
+
+def _deltas(contribution: ActivityContribution, sign: int) -> dict[str, int]:
+    reviewed = contribution.quality is not None
+    return {
+        "session_count": sign,
+        "total_minutes": sign * contribution.minutes,
+        "reviewed_count": sign if reviewed else 0,
+        "quality_sum": sign * contribution.quality if reviewed else 0,
+    }
+
+
+def _increments(deltas: dict[str, int]) -> dict:
+    return {name: getattr(UserActivityDaily, name) + delta for name, delta in deltas.items() if delta}
+
+
+async def add_session_to_activity(db: AsyncSession, contribution: ActivityContribution) -> None:
+    """Fold a new or updated session into its user/day/spot row with a single upsert."""
+    await add_sessions_to_activity(db, [contribution])
+
+
+async def add_sessions_to_activity(db: AsyncSession, contributions: Iterable[ActivityContribution]) -> None:
+    """Fold many sessions in with one batched upsert, one row per distinct user/day/spot."""
+    rows: dict[tuple, dict] = {}
+    for contribution in contributions:
+        if contribution.spot_id is None:
+            continue
+        deltas = _deltas(contribution, sign=1)
+        row = rows.get(contribution[:3])
+        if row is None:
+            rows[contribution[:3]] = {
+                "user_id": contribution.user_id,
+                "date": contribution.day,
+                "spot_id": contribution.spot_id,
+                **deltas,
+            }
+        else:
+            for name, delta in deltas.items():
+                row[name] += delta
+    if not rows:
+        return
+
+    # Core table + executemany: compiled once however many rows, sent as one driver call.
+    table = UserActivityDaily.__table__
+    stmt = dialect_insert(db)(table)
+    await db.execute(
+        stmt.on_conflict_do_update(
+            index_elements=["user_id", "date", "spot_id"],
+            set_={name: table.c[name] + stmt.excluded[name] for name in ACTIVITY_COUNTERS},
+        ),
+        list(rows.values()),
+    )
+
+
+async def remove_session_from_activity(db: AsyncSession, contribution: ActivityContribution) -> None:
+    """Subtract a previously recorded session from its user/day/spot row."""
+    if contribution.spot_id is None:
+        return
+    await db.execute(
+        update(UserActivityDaily).where(*_row_filter(contribution)).values(_increments(_deltas(contribution, sign=-1)))
+    )
+    await db.execute(delete(UserActivityDaily).where(*_row_filter(contribution), UserActivityDaily.session_count <= 0))
+
+
+async def replace_session_in_activity(
+    db: AsyncSession,
+    previous: ActivityContribution,
+    current: ActivityContribution,
+) -> None:
+    """Swap an edited session's contribution, in one UPDATE when it stays on the same row."""
+    if previous[:3] != current[:3] or current.spot_id is None:
+        await remove_session_from_activity(db, previous)
+        await add_session_to_activity(db, current)
+        return
+    removed = _deltas(previous, sign=-1)
+    net = {name: delta + removed[name] for name, delta in _deltas(current, sign=1).items()}
+    if any(net.values()):
+        await db.execute(update(UserActivityDaily).where(*_row_filter(current)).values(_increments(net)))
+
+
+async def rebuild_user_activity_daily(
+    db: AsyncSession,
+    user_ids: Iterable[int] | None = None,
+) -> int:
+    """Recompute rollup rows from ``surf_sessions``; returns the number of rows written.
+
+    The caller is responsible for committing.
+    """
+    user_ids = list(user_ids) if user_ids is not None else None
+
+    delete_stmt = delete(UserActivityDaily)
+    sessions_stmt = (
+        select(
+            SurfSession.user_id,
+            SurfSession.spot_id,
+            SurfSession.datetime,
+            SurfSession.duration_minutes,
+            SurfSessionReview.quality,
+        )
+        .outerjoin(SurfSessionReview, SurfSessionReview.surf_session_id == SurfSession.id)
+        .where(SurfSession.user_id.is_not(None), SurfSession.spot_id.is_not(None))
+    )
+    if user_ids is not None:
+        if not user_ids:
+            return 0
+        delete_stmt = delete_stmt.where(UserActivityDaily.user_id.in_(user_ids))
+        sessions_stmt = sessions_stmt.where(SurfSession.user_id.in_(user_ids))
+    await db.execute(delete_stmt)
+
+    rows: dict[tuple[int, date, int], dict] = {}
+    result = await db.stream(sessions_stmt.execution_options(yield_per=1000))
+    async for user_id, spot_id, when, minutes, quality in result:
+        key = (user_id, when.date(), spot_id)
+        row = rows.get(key)
+        if row is None:
+            row = {
+                "user_id": user_id,
+                "date": key[1],
+                "spot_id": spot_id,
+                "session_count": 0,
+                "total_minutes": 0,
+                "reviewed_count": 0,
+                "quality_sum": 0,
+            }
+            rows[key] = row
+        row["session_count"] += 1
+        row["total_minutes"] += minutes or 0
+        if quality is not None:
+            row["reviewed_count"] += 1
+            row["quality_sum"] += quality
+
+    if rows:
+        await db.execute(dialect_insert(db)(UserActivityDaily), list(rows.values()))
+    return len(rows)
@@ -0,0 +1,84 @@
+"""In-process cache of the authenticated-user principal resolved by ``get_current_user``.
+
+Entries live ``USER_CACHE_TTL_SECONDS`` and at most ``USER_CACHE_MAX_ENTRIES`` users
+are kept, least recently used evicted first. Like the spot catalogue cache this
+relies on the API running as a single process: ``invalidate_user`` is called after
+a user row changes (admin edits and deletions), and anything changed out of band
+is picked up once the entry expires.
+
+With ``AUTH_TRUST_TOKEN_CLAIMS`` a miss is filled from the token's signed principal
+claims instead of the database, but only for tokens issued within the last TTL: the
+claims are then no staler than a cached row could be, and older tokens (including
+every token that outlives a restart) revalidate against ``users``. Tokens issued
+before the user's last invalidation in this process are not trusted either.
+"""
+
+from __future__ import annotations
+
+import time
+from datetime import datetime
+from typing import Any, NamedTuple
+
+from app.core.config import settings
+from app.core.ttl_lru import TtlLru
+
+
+class UserPrincipal(NamedTuple):
+    id: int
+    email: str
+    created_at: datetime
+    is_admin: bool
+
+
+def principal_claims(user) -> dict[str, Any]:
+    """Claims added to access tokens so trusted mode can rebuild the principal without a query."""
+    return {"email": user.email, "created_at": user.created_at.isoformat(), "is_admin": bool(user.is_admin)}
+
+
+def principal_from_claims(user_id: int, payload: dict[str, Any]) -> UserPrincipal | None:
+    try:
+        return UserPrincipal(
+            id=user_id,
+            email=payload["email"],
+            created_at=datetime.fromisoformat(payload["created_at"]),
+            is_admin=bool(payload["is_admin"]),
+        )
+    except (KeyError, TypeError, ValueError):
+        # Tokens issued before the claims existed carry only ``sub``.
+        return None
+
+
+class UserPrincipalCache(TtlLru[int, UserPrincipal]):
+    def __init__(self, ttl_seconds: float, max_entries: int) -> None:
+        super().__init__(max_entries, ttl_seconds)
+        # user id -> wall-clock time of the last invalidation, compared against token ``iat``. Only
+        # tokens younger than the TTL are trusted, so a record is needed for one TTL at most. This is
+        # a plain dict pruned by age rather than an LRU: evicting a live record would re-trust tokens
+        # issued before the invalidation.
+        self._invalidated_at: dict[int, float] = {}
+
+    def invalidate(self, user_id: int) -> None:
+        self.pop(user_id)
+        now = time.time()
+        for stale in [uid for uid, at in self._invalidated_at.items() if now - at > self.ttl_seconds]:
+            del self._invalidated_at[stale]
+        self._invalidated_at[user_id] = now
+
+    def trusts_token(self, user_id: int, issued_at: Any) -> bool:
+        """Whether a token issued at ``issued_at`` (epoch seconds) is younger than the TTL and
+        postdates the user's last invalidation."""
+        if not isinstance(issued_at, int | float) or time.time() - issued_at > self.ttl_seconds:
+            return False
+        invalidated_at = self._invalidated_at.get(user_id)
+        return invalidated_at is None or issued_at > invalidated_at
+
+    def clear(self) -> None:
+        super().clear()
+        self._invalidated_at.clear()
+
+
+user_principal_cache = UserPrincipalCache(settings.USER_CACHE_TTL_SECONDS, settings.USER_CACHE_MAX_ENTRIES)
+
+
+def invalidate_user(user_id: int) -> None:
+    user_principal_cache.invalidate(user_id)
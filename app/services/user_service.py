@@ -1,19 +1,19 @@
-import asyncio
-
 from sqlalchemy import select
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.exceptions import BusinessLogicError
+from app.core.password_hashing import password_hash_pool
 from app.core.security import hash_password
 from app.models import User
 from app.schemas.user import UserCreate
+from app.services.user_cache import UserPrincipal
 
 
 async def create_user(db: AsyncSession, user_in: UserCreate) -> User:
     user_model = User(
         email=user_in.email,
-        hashed_password=await asyncio.to_thread(hash_password, user_in.password),
+        hashed_password=await password_hash_pool.run(hash_password, user_in.password),
         is_admin=False,
     )
 
@@ -33,7 +33,7 @@ async def create_admin_user(db: AsyncSession, email: str, password: str) -> User
     """Create an admin user; caller must ensure authorization for this action."""
     user_model = User(
         email=email,
-        hashed_password=await asyncio.to_thread(hash_password, password),
+        hashed_password=await password_hash_pool.run(hash_password, password),
         is_admin=True,
     )
 
@@ -56,3 +56,12 @@ async def get_user_by_email(db: AsyncSession, email: str) -> User | None:
 async def get_user(db: AsyncSession, user_id: int) -> User | None:
     result = await db.execute(select(User).where(User.id == user_id))
     return result.scalars().first()
+
+
+async def get_user_principal(db: AsyncSession, user_id: int) -> UserPrincipal | None:
+    """The columns ``get_current_user`` needs, without loading a ``User``."""
+    result = await db.execute(
+        select(User.id, User.email, User.created_at, User.is_admin).where(User.id == user_id)
+    )
+    row = result.first()
+    return UserPrincipal(*row) if row is not None else None
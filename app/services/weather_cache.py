@@ -0,0 +1,95 @@
+"""In-process cache of the hourly Open-Meteo series behind ``get_surf_report``.
+
+One entry holds a whole day of hourly marine and wind values for a place, keyed by
+coordinates rounded to ``COORDINATE_PRECISION`` decimals (about 1 km, finer than
+either model's grid), the date and the timezone. Reports for any hour of that day
+are then answered from memory. Entries live ``WEATHER_CACHE_TTL_SECONDS``, matched to
+the hourly refresh of Open-Meteo's forecast runs, and at most
+``WEATHER_CACHE_MAX_ENTRIES`` are kept, least recently used evicted first.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from datetime import date, datetime
+from typing import Any, NamedTuple
+
+from app.core.config import settings
+from app.core.ttl_lru import TtlLru
+
+COORDINATE_PRECISION = 2
+
+
+class WeatherKey(NamedTuple):
+    lat: float
+    lon: float
+    day: date
+    timezone: str
+
+
+def weather_key(lat: float, lon: float, day: date, timezone: str) -> WeatherKey:
+    return WeatherKey(round(lat, COORDINATE_PRECISION), round(lon, COORDINATE_PRECISION), day, timezone)
+
+
+def _at(values: list, index: int) -> Any:
+    return values[index] if index < len(values) else None
+
+
+class HourlySeries(NamedTuple):
+    """A day of hourly values; ``hours`` are the parsed ``times`` for nearest-hour lookups."""
+
+    times: list[str]
+    hours: list[datetime]
+    wave_height: list
+    wave_period: list
+    wave_direction: list
+    wind_speed: list
+    wind_direction: list
+
+    @classmethod
+    def from_responses(cls, marine_data: dict[str, Any], weather_data: dict[str, Any]) -> HourlySeries | None:
+        """Series from the marine and weather API bodies, or None when the wave data is missing."""
+        marine_hourly = marine_data.get("hourly", {})
+        times = marine_hourly.get("time", [])
+        wave_height = marine_hourly.get("wave_height", [])
+        wave_period = marine_hourly.get("wave_period", [])
+        wave_direction = marine_hourly.get("wave_direction", [])
+        if not times or not wave_height or not wave_period or not wave_direction:
+            return None
+        # Both APIs are queried with the same parameters, so their hourly timestamps line up.
+        weather_hourly = weather_data.get("hourly", {})
+        return cls(
+            times=times,
+            hours=[datetime.fromisoformat(t) for t in times],
+            wave_height=wave_height,
+            wave_period=wave_period,
+            wave_direction=wave_direction,
+            wind_speed=weather_hourly.get("wind_speed_10m", []),
+            wind_direction=weather_hourly.get("wind_direction_10m", []),
+        )
+
+    def nearest_index(self, at: datetime | None) -> int:
+        """Index of the hour closest to ``at`` (naive, in the series' timezone); the first hour when None."""
+        if at is None:
+            return 0
+        index = bisect_left(self.hours, at)
+        if index == len(self.hours):
+            return index - 1
+        if index > 0 and at - self.hours[index - 1] <= self.hours[index] - at:
+            return index - 1
+        return index
+
+    def report(self, index: int) -> dict[str, Any]:
+        return {
+            "time": self.times[index],
+            "wave_height": _at(self.wave_height, index),
+            "wave_period": _at(self.wave_period, index),
+            "wave_direction": _at(self.wave_direction, index),
+            "wind_speed": _at(self.wind_speed, index),
+            "wind_direction": _at(self.wind_direction, index),
+        }
+
+
+weather_cache: TtlLru[WeatherKey, HourlySeries] = TtlLru(
+    settings.WEATHER_CACHE_MAX_ENTRIES, ttl_seconds=settings.WEATHER_CACHE_TTL_SECONDS
+)
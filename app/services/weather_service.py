@@ -1,8 +1,34 @@
 import asyncio
 from datetime import date, datetime
 from typing import Any, Dict, Union
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
 from app.external_apis import OpenMeteoClient
+from app.services.weather_cache import HourlySeries, WeatherKey, weather_cache, weather_key
+
+# Process-wide client registered by the API lifespan (and by the worker), so calls
+# share its connection pool. Unset, each call opens and closes its own client.
+_shared_client: OpenMeteoClient | None = None
+
+
+def set_openmeteo_client(client: OpenMeteoClient | None) -> None:
+    global _shared_client
+    _shared_client = client
+
+
+def get_openmeteo_client() -> OpenMeteoClient | None:
+    return _shared_client
+
+
+def _local_naive(at: datetime, timezone: str) -> datetime:
+    """``at`` as a naive datetime in ``timezone``, comparable with the series' hourly timestamps."""
+    if at.tzinfo is None:
+        return at
+    try:
+        return at.astimezone(ZoneInfo(timezone)).replace(tzinfo=None)
+    except (ZoneInfoNotFoundError, ValueError):
+        # e.g. Open-Meteo's "auto"; the wall-clock time is the best guess.
+        return at.replace(tzinfo=None)
 
 
 async def get_surf_report(
@@ -14,9 +40,12 @@ async def get_surf_report(
 ) -> Dict[str, Any] | None:
     """
     Get a surf report combining marine (wave) and weather (wind) data for a single date.
-    Returns the first hour's data as a normalized dictionary, or None on error.
+    Returns the hour nearest ``target_date`` when it is a datetime, otherwise the first
+    hour of the day, as a normalized dictionary, or None on error.
 
-    Makes parallel calls to both the marine API (for wave data) and weather API (for wind data).
+    The day's hourly series is served from ``weather_cache`` when present; otherwise
+    both the marine API (for wave data) and weather API (for wind data) are called in
+    parallel and the whole series is cached.
 
     Args:
         lat: Latitude
@@ -24,66 +53,46 @@ async def get_surf_report(
         target_date: Target date or datetime (defaults to today if not provided)
         timezone: Timezone string (default: "GMT")
         client: Optional OpenMeteoClient instance for dependency injection (useful for testing).
-                If not provided, a new client will be created.
+                If not provided, the client registered with ``set_openmeteo_client`` is used,
+                or a new one is created for this call.
 
     Returns:
-        Dictionary with normalized surf data for the first hour, or None on error.
+        Dictionary with normalized surf data for the selected hour, or None on error.
         Keys: time, wave_height, wave_period, wave_direction, wind_speed, wind_direction
     """
+    target_time = None
+    if target_date is None:
+        target_date = date.today()
+    elif isinstance(target_date, datetime):
+        target_time = _local_naive(target_date, timezone)
+        target_date = target_time.date()
+
+    key = weather_key(lat, lon, target_date, timezone)
+    series = weather_cache.get(key)
+    if series is None:
+        series = await _fetch_series(key, client)
+        if series is None:
+            return None
+        weather_cache.put(key, series)
+    return series.report(series.nearest_index(target_time))
+
+
+async def _fetch_series(key: WeatherKey, client: OpenMeteoClient | None) -> HourlySeries | None:
+    if client is None:
+        client = _shared_client
     if client is None:
         client = OpenMeteoClient()
         owns_client = True
     else:
         owns_client = False
 
-    if target_date is None:
-        from datetime import date as date_class
-        target_date = date_class.today()
-    elif hasattr(target_date, "date"):
-        target_date = target_date.date()
-
     try:
-        # Make parallel calls to both APIs
+        # Make parallel calls to both APIs, at the rounded coordinates the series is cached under
         marine_data, weather_data = await asyncio.gather(
-            client.get_marine_hourly_forecast(
-                lat, lon, target_date, target_date, timezone
-            ),
-            client.get_weather_hourly_forecast(
-                lat, lon, target_date, target_date, timezone
-            ),
+            client.get_marine_hourly_forecast(key.lat, key.lon, key.day, key.day, key.timezone),
+            client.get_weather_hourly_forecast(key.lat, key.lon, key.day, key.day, key.timezone),
         )
-
-        # Extract hourly data from marine API
-        marine_hourly = marine_data.get("hourly", {})
-        marine_times = marine_hourly.get("time", [])
-        if not marine_times:
-            return None
-
-        # Extract hourly data from weather API
-        weather_hourly = weather_data.get("hourly", {})
-
-        # Get the first hour's data (both APIs use same parameters, so timestamps match)
-        first_time = marine_times[0]
-        wave_height_list = marine_hourly.get("wave_height", [])
-        wave_period_list = marine_hourly.get("wave_period", [])
-        wave_dir_list = marine_hourly.get("wave_direction", [])
-        wind_speed_list = weather_hourly.get("wind_speed_10m", [])
-        wind_dir_list = weather_hourly.get("wind_direction_10m", [])
-
-        if not wave_height_list or not wave_period_list or not wave_dir_list:
-            return None
-
-        # Build normalized result
-        result = {
-            "time": first_time,
-            "wave_height": wave_height_list[0],
-            "wave_period": wave_period_list[0],
-            "wave_direction": wave_dir_list[0],
-            "wind_speed": wind_speed_list[0] if wind_speed_list else None,
-            "wind_direction": wind_dir_list[0] if wind_dir_list else None,
-        }
-
-        return result
+        return HourlySeries.from_responses(marine_data, weather_data)
     finally:
         if owns_client:
             await client.aclose()
@@ -9,11 +9,15 @@ from sqlalchemy import delete, select
 from sqlalchemy.dialects.postgresql import insert
 
 from app.database import async_session
+from app.external_apis import OpenMeteoClient
 from app.logging import configure_logging, request_id_var
+from app.models.model_forecast import ModelForecast
 from app.models.spot import Spot
 from app.models.surf_forecast import SurfForecast
 from app.models.tide import Tide
+from app.services.model_forecast_service import ingest_model_forecasts
 from app.services.scraper import SurfScraper
+from app.services.weather_service import set_openmeteo_client
 
 DEFAULT_START_HOUR = 5
 DEFAULT_END_HOUR = 23
@@ -166,6 +170,21 @@ async def scrape_all_spots():
         request_id_var.reset(token)
 
 
+async def ingest_open_meteo_forecasts(client: OpenMeteoClient):
+    """Refresh model_forecasts for every spot with coordinates in batched Open-Meteo requests."""
+    job_id = str(uuid.uuid4())
+    token = request_id_var.set(job_id)
+    logger.info("model_forecast_job_started", extra={"job_id": job_id})
+    try:
+        async with async_session() as session:
+            rows = await ingest_model_forecasts(session, client)
+        logger.info("model_forecast_job_completed", extra={"job_id": job_id, "rows": rows})
+    except Exception:
+        logger.exception("model_forecast_job_failed", extra={"job_id": job_id})
+    finally:
+        request_id_var.reset(token)
+
+
 async def cleanup_stale_forecasts():
     """Delete SurfForecast and Tide rows whose timestamp is older than FORECAST_RETENTION_DAYS."""
     job_id = str(uuid.uuid4())
@@ -184,6 +203,9 @@ async def cleanup_stale_forecasts():
             tide_result = await session.execute(
                 delete(Tide).where(Tide.timestamp < cutoff)
             )
+            model_result = await session.execute(
+                delete(ModelForecast).where(ModelForecast.timestamp < cutoff)
+            )
             await session.commit()
 
             logger.info(
@@ -192,6 +214,7 @@ async def cleanup_stale_forecasts():
                     "job_id": job_id,
                     "forecasts_deleted": fc_result.rowcount,
                     "tides_deleted": tide_result.rowcount,
+                    "model_forecasts_deleted": model_result.rowcount,
                 },
             )
     except Exception:
@@ -201,12 +224,17 @@ async def cleanup_stale_forecasts():
 
 async def main():
     configure_logging()
+    # The worker keeps its own pooled Open-Meteo client for the life of the process.
+    openmeteo = OpenMeteoClient()
+    set_openmeteo_client(openmeteo)
     # 8. Setup Scheduler
     scheduler = AsyncIOScheduler()
 
     # Schedule jobs using configured hours (defaults: every ~4h from 05:00 through 23:00)
     scheduler.add_job(scrape_all_spots, 'cron', hour=SCHEDULE_HOURS_FIELD, minute=0)
     scheduler.add_job(cleanup_stale_forecasts, 'cron', hour=CLEANUP_HOUR, minute=0)
+    # Open-Meteo needs no scraping, so model forecasts refresh on the same hours, offset from the scrape.
+    scheduler.add_job(ingest_open_meteo_forecasts, 'cron', hour=SCHEDULE_HOURS_FIELD, minute=30, args=[openmeteo])
 
     logger.info("scheduler_configured", extra={"hours": SCHEDULE_HOURS, "hours_field": SCHEDULE_HOURS_FIELD})
     logger.info("scheduler_started")
@@ -219,6 +247,9 @@ async def main():
             await asyncio.sleep(1000)
     except (KeyboardInterrupt, SystemExit):
         pass
+    finally:
+        set_openmeteo_client(None)
+        await openmeteo.aclose()
 
 if __name__ == "__main__":
     try:
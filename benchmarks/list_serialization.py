@@ -0,0 +1,199 @@
+"""ORM + response_model path vs the Core-row read path for the hot list endpoints.
+
+Usage:
+    python -m benchmarks.list_serialization --sessions 5000 --spots 2000 --surfboards 500
+
+For GET /surf_session/, GET /spot/, GET /surfboard/ and GET /spot/{id}/reviews this
+compares what the endpoint did before (ORM load through the identity map,
+``response_model`` validation, dump, JSON encode) with the Core rows rendered
+directly. It checks the bodies are byte-identical and reports the median latency
+of ``--repeat`` runs plus the tracemalloc peak of one request, against a throwaway
+SQLite database.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+
+# The services reach app.database, which reads settings at import time.
+os.environ.setdefault("SECRET_KEY", "benchmark-secret-key")
+os.environ.setdefault("DATABASE_URL", "sqlite+aiosqlite:///:memory:")
+
+from pydantic import TypeAdapter  # noqa: E402
+from pydantic_core import to_json  # noqa: E402
+from sqlalchemy import insert  # noqa: E402
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine  # noqa: E402
+
+from app.core.serialization import RowJSONResponse  # noqa: E402
+from app.models import Base, Spot, Surfboard, SurfSession, SurfSessionReview, User  # noqa: E402
+from app.schemas.spot import SpotResponse  # noqa: E402
+from app.schemas.surf_session import SurfSessionResponse  # noqa: E402
+from app.schemas.surf_session_review import SpotReviewResponse  # noqa: E402
+from app.schemas.surfboard import SurfboardResponse  # noqa: E402
+from app.services.spot_review_daily_service import rebuild_spot_review_daily  # noqa: E402
+from app.services.spot_service import list_spot_rows, list_spots  # noqa: E402
+from app.services.surf_session_review_service import list_spot_review_rows, list_spot_reviews  # noqa: E402
+from app.services.surf_session_service import list_surf_session_rows, list_surf_sessions  # noqa: E402
+from app.services.surfboard_service import get_surfboards_by_owner_id, list_surfboard_rows  # noqa: E402
+
+BASE = datetime.now().replace(microsecond=0) - timedelta(days=365)
+SESSION_SPOTS = 20
+REVIEW_PAGE = 200
+
+
+def _fastapi_json(adapter: TypeAdapter, value) -> bytes:
+    content = adapter.dump_python(adapter.validate_python(value, from_attributes=True), mode="json")
+    return json.dumps(content, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")).encode()
+
+
+async def _seed(session, sessions: int, spots: int, surfboards: int) -> None:
+    await session.execute(insert(User).values(id=1, email="bench@example.com", hashed_password="x"))
+    await session.execute(
+        insert(Spot.__table__),
+        [
+            {"id": i, "name": f"Spot {i}", "latitude": 30 + i / 1000, "longitude": -9 - i / 1000, "difficulty": [1, 2]}
+            for i in range(1, spots + 1)
+        ],
+    )
+    await session.execute(
+        insert(Surfboard.__table__),
+        [
+            {"id": i, "name": f"Board {i}", "length_ft": 5.5 + i % 40 / 10, "owner_id": 1}
+            for i in range(1, surfboards + 1)
+        ],
+    )
+    await session.execute(
+        insert(SurfSession.__table__),
+        [
+            {
+                "id": i,
+                "user_id": 1,
+                "spot_id": i % SESSION_SPOTS + 1,
+                "surfboard_id": i % surfboards + 1 if i % 2 else None,
+                "datetime": BASE + timedelta(hours=1.5 * i),
+                "duration_minutes": 60 + i % 90,
+                "notes": f"session {i}",
+                "wave_height_m": 1.0 + i % 7 / 10,
+                "wave_dir": "NW",
+                "tide_height_m": 0.4,
+            }
+            for i in range(1, sessions + 1)
+        ],
+    )
+    await session.execute(
+        insert(SurfSessionReview.__table__),
+        [
+            {
+                "surf_session_id": i,
+                "spot_id": i % SESSION_SPOTS + 1,
+                "user_id": 1,
+                "observed_at": BASE + timedelta(hours=1.5 * i),
+                "quality": i % 11,
+                "crowded_level": 3,
+            }
+            for i in range(1, sessions + 1)
+            if i % 3
+        ],
+    )
+    await rebuild_spot_review_daily(session)
+    await session.commit()
+
+
+async def _measure(session_factory, build, repeat: int) -> tuple[float, float, bytes]:
+    """``(median ms, traced peak KiB, body)``; the traced run is separate so tracing does not skew latency."""
+    samples = []
+    body = b""
+    for _ in range(repeat):
+        # A fresh session per run, like one per request in production, so nothing comes from the identity map.
+        async with session_factory() as session:
+            started = time.perf_counter()
+            body = await build(session)
+            samples.append((time.perf_counter() - started) * 1000)
+    async with session_factory() as session:
+        tracemalloc.start()
+        await build(session)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    return statistics.median(samples), peak / 1024, body
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sessions", type=int, default=5_000)
+    parser.add_argument("--spots", type=int, default=2_000)
+    parser.add_argument("--surfboards", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    sessions_adapter = TypeAdapter(list[SurfSessionResponse])
+    spots_adapter = TypeAdapter(list[SpotResponse])
+    boards_adapter = TypeAdapter(list[SurfboardResponse])
+    reviews_adapter = TypeAdapter(list[SpotReviewResponse])
+    cases = (
+        (
+            "GET /surf_session/",
+            args.sessions,
+            lambda db: list_surf_sessions(db, 1),
+            lambda rows: _fastapi_json(sessions_adapter, rows),
+            lambda db: list_surf_session_rows(db, 1),
+            lambda rows: RowJSONResponse(rows).body,
+        ),
+        (
+            "GET /spot/",
+            args.spots,
+            list_spots,
+            lambda rows: spots_adapter.dump_json(spots_adapter.validate_python(rows, from_attributes=True)),
+            list_spot_rows,
+            to_json,
+        ),
+        (
+            "GET /surfboard/",
+            args.surfboards,
+            lambda db: get_surfboards_by_owner_id(db, 1),
+            lambda rows: _fastapi_json(boards_adapter, rows),
+            lambda db: list_surfboard_rows(db, 1),
+            lambda rows: RowJSONResponse(rows).body,
+        ),
+        (
+            "GET /spot/1/reviews",
+            REVIEW_PAGE,
+            lambda db: list_spot_reviews(db, 1, limit=REVIEW_PAGE),
+            lambda rows: _fastapi_json(reviews_adapter, rows),
+            lambda db: list_spot_review_rows(db, 1, limit=REVIEW_PAGE),
+            lambda rows: RowJSONResponse([row._asdict() for row in rows]).body,
+        ),
+    )
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_async_engine(f"sqlite+aiosqlite:///{os.path.join(tmp, 'bench.db')}")
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        session_factory = async_sessionmaker(bind=engine, expire_on_commit=False)
+        async with session_factory() as session:
+            await _seed(session, args.sessions, args.spots, args.surfboards)
+
+        for label, rows, load_models, render_models, load_rows, render_rows in cases:
+
+            async def model_path(db, load=load_models, render=render_models):
+                return render(await load(db))
+
+            async def row_path(db, load=load_rows, render=render_rows):
+                return render(await load(db))
+
+            before, before_peak, expected = await _measure(session_factory, model_path, args.repeat)
+            after, after_peak, body = await _measure(session_factory, row_path, args.repeat)
+            print(
+                f"{label:<20} {rows:>6} rows  orm {before:7.1f} ms {before_peak:8.0f} KiB  "
+                f"core {after:7.1f} ms {after_peak:8.0f} KiB  identical={body == expected}"
+            )
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,80 @@
+"""Repeated get_surf_report calls: a fresh OpenMeteoClient per call vs the shared pooled one.
+
+Usage:
+    python -m benchmarks.openmeteo_pool --calls 200
+
+Serves the bundled Open-Meteo stub (``app.external_apis.openmeteo_stub``) with
+uvicorn on 127.0.0.1, then times ``--calls`` sequential reports, with the weather
+cache cleared before each, using a new client per call (the old default: new
+connections every time) and one client shared for the whole run, as the API
+lifespan and the worker now do. Over loopback the saving is
+client setup (httpx builds an SSL context per client) and the TCP connect; against
+Open-Meteo each new connection also pays DNS and a TLS handshake.
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import time
+from datetime import date
+
+# The client reads its pool limits from settings.
+os.environ.setdefault("SECRET_KEY", "benchmark-secret-key")
+os.environ.setdefault("DATABASE_URL", "sqlite+aiosqlite:///:memory:")
+
+import uvicorn  # noqa: E402
+
+from app.external_apis import OpenMeteoClient  # noqa: E402
+from app.external_apis.openmeteo_stub import create_openmeteo_stub  # noqa: E402
+from app.services.weather_cache import weather_cache  # noqa: E402
+from app.services.weather_service import get_surf_report  # noqa: E402
+
+
+async def _time_calls(calls: int, make_client) -> list[float]:
+    samples = []
+    for _ in range(calls):
+        # Every call goes to the stub: only connection reuse differs between the runs.
+        weather_cache.clear()
+        started = time.perf_counter()
+        client, owned = make_client()
+        await get_surf_report(38.99, -9.42, date.today(), client=client)
+        if owned:
+            await client.aclose()
+        samples.append((time.perf_counter() - started) * 1000)
+    return samples
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=200)
+    args = parser.parse_args()
+
+    config = uvicorn.Config(create_openmeteo_stub(), host="127.0.0.1", port=0, log_level="warning", lifespan="off")
+    server = uvicorn.Server(config)
+    serving = asyncio.create_task(server.serve())
+    while not server.started:
+        await asyncio.sleep(0.01)
+    port = server.servers[0].sockets[0].getsockname()[1]
+    urls = {"marine_url": f"http://127.0.0.1:{port}/v1/marine", "forecast_url": f"http://127.0.0.1:{port}/v1/forecast"}
+
+    try:
+        fresh = await _time_calls(args.calls, lambda: (OpenMeteoClient(**urls), True))
+        shared_client = OpenMeteoClient(**urls)
+        try:
+            shared = await _time_calls(args.calls, lambda: (shared_client, False))
+        finally:
+            await shared_client.aclose()
+    finally:
+        server.should_exit = True
+        await serving
+
+    for label, samples in (("fresh client per call", fresh), ("shared pooled client", shared)):
+        print(
+            f"{label:<22} {args.calls:>5} calls  median {statistics.median(samples):6.2f} ms  "
+            f"p95 {statistics.quantiles(samples, n=20)[-1]:6.2f} ms  total {sum(samples):8.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,125 @@
+"""Peak memory of GET /surf_session/export against the list endpoint's ORM load.
+
+Usage:
+    python -m benchmarks.session_export --rows 100000
+
+Seeds a throwaway SQLite database with reviewed sessions, then drains
+``export_surf_sessions`` for every format (Parquet only when pyarrow is installed)
+and, for comparison, loads the same rows the way ``GET /surf_session/`` does. Export
+peaks should stay flat as the row count grows; the ORM load grows with it.
+"""
+
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+
+# The export path reaches app.database, which reads settings at import time.
+os.environ.setdefault("SECRET_KEY", "benchmark-secret-key")
+os.environ.setdefault("DATABASE_URL", "sqlite+aiosqlite:///:memory:")
+
+from sqlalchemy import insert  # noqa: E402
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine  # noqa: E402
+
+from app.models import Base, Spot, SurfSession, SurfSessionReview, User  # noqa: E402
+from app.services.surf_session_export_service import export_surf_sessions, parquet_available  # noqa: E402
+from app.services.surf_session_service import list_surf_sessions  # noqa: E402
+
+SPOTS = ("Fisherman", "Main Point", "Lazy Left", "Rams")
+BASE = datetime(2020, 1, 1, 6, 0)
+SEED_BATCH = 5000
+
+
+async def _seed(session, rows: int) -> None:
+    await session.execute(insert(User).values(id=1, email="bench@example.com", hashed_password="x"))
+    await session.execute(insert(Spot), [{"id": i + 1, "name": name} for i, name in enumerate(SPOTS)])
+    for start in range(0, rows, SEED_BATCH):
+        ids = range(start + 1, min(start + SEED_BATCH, rows) + 1)
+        await session.execute(
+            insert(SurfSession.__table__),
+            [
+                {
+                    "id": i,
+                    "user_id": 1,
+                    "spot_id": i % len(SPOTS) + 1,
+                    "datetime": BASE + timedelta(hours=7 * i),
+                    "duration_minutes": 90,
+                    "notes": f"session {i}",
+                    "wave_height_m": 1.0 + i % 5 / 10,
+                    "tide_height_m": 0.5,
+                }
+                for i in ids
+            ],
+        )
+        await session.execute(
+            insert(SurfSessionReview.__table__),
+            [
+                {
+                    "surf_session_id": i,
+                    "spot_id": i % len(SPOTS) + 1,
+                    "user_id": 1,
+                    "observed_at": BASE + timedelta(hours=7 * i),
+                    "quality": i % 11,
+                    "crowded_level": 3,
+                }
+                for i in ids
+            ],
+        )
+    await session.commit()
+
+
+async def _measure(label: str, rows: int, run) -> None:
+    tracemalloc.start()
+    started = time.perf_counter()
+    size = await run()
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{rows:>8} rows  {label:<8} {elapsed:7.2f} s  peak {peak / 2**20:7.1f} MiB  {size / 2**20:7.1f} MiB out")
+
+
+async def _run(rows: int) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_async_engine(f"sqlite+aiosqlite:///{os.path.join(tmp, 'bench.db')}")
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        session_factory = async_sessionmaker(bind=engine, expire_on_commit=False)
+        async with session_factory() as session:
+            await _seed(session, rows)
+
+        formats = ["csv", "ndjson"] + (["parquet"] if parquet_available() else [])
+        for export_format in formats:
+            async with session_factory() as session:
+
+                async def drain(session=session, export_format=export_format) -> int:
+                    size = 0
+                    async for chunk in export_surf_sessions(session, 1, export_format):
+                        size += len(chunk)
+                    return size
+
+                await _measure(export_format, rows, drain)
+
+        async with session_factory() as session:
+
+            async def load(session=session) -> int:
+                await list_surf_sessions(session, 1)
+                return 0
+
+            await _measure("orm list", rows, load)
+        await engine.dispose()
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100_000)
+    args = parser.parse_args()
+
+    for rows in sorted({max(args.rows // 10, 1), args.rows}):
+        await _run(rows)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
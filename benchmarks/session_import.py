@@ -0,0 +1,101 @@
+"""Throughput and peak memory of POST /surf_session/import at increasing row counts.
+
+Usage:
+    python -m benchmarks.session_import --rows 100000
+
+Streams a generated CSV (never held in memory) through ``import_surf_sessions``
+into a throwaway SQLite database, a few spots with forecasts included. The traced
+peak should stay flat as the row count grows. Throughput here is a floor: SQLite
+cannot guarantee RETURNING order, so SQLAlchemy sends the id-returning session
+INSERT one row at a time, while PostgreSQL batches it.
+"""
+
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+
+# The import path reaches app.database, which reads settings at import time.
+os.environ.setdefault("SECRET_KEY", "benchmark-secret-key")
+os.environ.setdefault("DATABASE_URL", "sqlite+aiosqlite:///:memory:")
+
+from sqlalchemy import insert  # noqa: E402
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine  # noqa: E402
+
+from app.models import Base, Spot, SurfForecast, User  # noqa: E402
+from app.services.spot_index import spot_index  # noqa: E402
+from app.services.surf_session_import_service import import_surf_sessions  # noqa: E402
+
+SPOTS = ("Fisherman", "Main Point", "Lazy Left", "Rams")
+HEADER = (
+    "spot_name,datetime,duration_minutes,notes,review_quality,review_crowded_level,"
+    "review_wave_height_index,review_short_long_index,review_wind_index\n"
+)
+BASE = datetime(2020, 1, 1, 6, 0)
+
+
+async def _csv_chunks(rows: int, rows_per_chunk: int = 200):
+    yield HEADER.encode()
+    for start in range(0, rows, rows_per_chunk):
+        lines = []
+        for i in range(start, min(start + rows_per_chunk, rows)):
+            when = BASE + timedelta(hours=7 * i)
+            review = f"{i % 11},3,5,5,5" if i % 3 else ",,,,"
+            lines.append(f"{SPOTS[i % len(SPOTS)]},{when.isoformat()},90,row {i},{review}\n")
+        yield "".join(lines).encode()
+
+
+async def _seed(session, rows: int) -> None:
+    await session.execute(insert(User).values(id=1, email="bench@example.com", hashed_password="x"))
+    await session.execute(insert(Spot), [{"id": i + 1, "name": name} for i, name in enumerate(SPOTS)])
+    hours = 7 * rows + 24
+    for spot_id in range(1, len(SPOTS) + 1):
+        for start in range(0, hours, 24 * 365):
+            await session.execute(
+                insert(SurfForecast),
+                [
+                    {"spot_id": spot_id, "timestamp": BASE + timedelta(hours=h), "wave_height": 1.0 + h % 5 / 10}
+                    for h in range(start, min(start + 24 * 365, hours), 3)
+                ],
+            )
+    await session.commit()
+
+
+async def _run(rows: int) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_async_engine(f"sqlite+aiosqlite:///{os.path.join(tmp, 'bench.db')}")
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        session_factory = async_sessionmaker(bind=engine, expire_on_commit=False)
+        spot_index.reset()
+
+        async with session_factory() as session:
+            await _seed(session, rows)
+            tracemalloc.start()
+            started = time.perf_counter()
+            report = await import_surf_sessions(session, 1, _csv_chunks(rows), "csv")
+            elapsed = time.perf_counter() - started
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+        print(
+            f"{rows:>8} rows  {elapsed:7.2f} s  {rows / elapsed:8.0f} rows/s  "
+            f"peak {peak / 2**20:6.1f} MiB  imported {report['imported']}"
+        )
+        await engine.dispose()
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100_000)
+    args = parser.parse_args()
+
+    for rows in sorted({max(args.rows // 10, 1), args.rows}):
+        await _run(rows)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,60 @@
+"""Latency of SpotIndex.nearest / within_bbox with tens of thousands of spots.
+
+Usage:
+    python -m benchmarks.spot_nearby --spots 50000
+"""
+
+import argparse
+import random
+import statistics
+import time
+
+from app.services.spot_index import SpotIndex, SpotPoint
+
+
+def _percentile(samples: list[float], pct: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct))]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--spots", type=int, default=50_000)
+    parser.add_argument("--queries", type=int, default=2_000)
+    parser.add_argument("--radius-km", type=float, default=20.0)
+    parser.add_argument("--limit", type=int, default=20)
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    # Cluster spots along "coastlines" so density resembles a real catalogue.
+    centers = [(rng.uniform(-50, 60), rng.uniform(-180, 180)) for _ in range(200)]
+    points = []
+    for spot_id in range(1, args.spots + 1):
+        lat, lon = rng.choice(centers)
+        points.append(SpotPoint(spot_id, f"spot-{spot_id}", lat + rng.gauss(0, 1.0), lon + rng.gauss(0, 1.0)))
+
+    index = SpotIndex()
+    index.load(points)
+    start = time.perf_counter()
+    index.within_bbox(-1, -1, 1, 1)  # forces the lazy build
+    print(f"build: {(time.perf_counter() - start) * 1000:.1f} ms for {args.spots} spots")
+
+    for name, run in (
+        ("nearest", lambda q: index.nearest(q.latitude, q.longitude, args.radius_km, args.limit)),
+        ("bbox", lambda q: index.within_bbox(q.longitude - 0.5, q.latitude - 0.5, q.longitude + 0.5, q.latitude + 0.5)),
+    ):
+        samples = []
+        hits = 0
+        for _ in range(args.queries):
+            query = rng.choice(points)
+            t0 = time.perf_counter()
+            hits += len(run(query))
+            samples.append((time.perf_counter() - t0) * 1000)
+        print(
+            f"{name:>8}: p50 {statistics.median(samples):.3f} ms  p99 {_percentile(samples, 0.99):.3f} ms  "
+            f"avg hits {hits / args.queries:.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
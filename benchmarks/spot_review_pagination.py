@@ -0,0 +1,122 @@
+"""Compare OFFSET and keyset pagination latency for GET /spot/{id}/reviews at increasing depth.
+
+Usage:
+    python -m benchmarks.spot_review_pagination --reviews 200000 --page-size 50
+
+Seeds a throwaway SQLite database with a single busy spot and times one page fetch
+through ``list_spot_reviews`` at several depths. Keyset pages should stay flat while
+OFFSET pages grow with depth.
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.models import Base, Spot, SurfSession, SurfSessionReview, User
+from app.services.surf_session_review_service import list_spot_reviews
+
+DEPTHS = (1, 10, 100, 1000, 3000)
+
+
+async def _seed(session, reviews: int) -> int:
+    await session.execute(insert(User).values(id=1, email="bench@example.com", hashed_password="x"))
+    await session.execute(insert(Spot).values(id=1, name="Busy Point"))
+    base = datetime(2020, 1, 1)
+    batch = 10_000
+    for start in range(0, reviews, batch):
+        rows = range(start, min(start + batch, reviews))
+        await session.execute(
+            insert(SurfSession),
+            [
+                {
+                    "id": i + 1,
+                    "spot_id": 1,
+                    "user_id": 1,
+                    "datetime": base + timedelta(minutes=i),
+                    "duration_minutes": 60,
+                }
+                for i in rows
+            ],
+        )
+        await session.execute(
+            insert(SurfSessionReview),
+            [
+                {
+                    "surf_session_id": i + 1,
+                    "spot_id": 1,
+                    "user_id": 1,
+                    # Duplicate timestamps in pairs so the id tiebreaker matters.
+                    "observed_at": base + timedelta(minutes=i // 2),
+                    "quality": i % 11,
+                }
+                for i in rows
+            ],
+        )
+    await session.commit()
+    return 1
+
+
+async def _time(coro_factory, repeats: int) -> float:
+    samples = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        await coro_factory()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--reviews", type=int, default=200_000)
+    parser.add_argument("--page-size", type=int, default=50)
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_async_engine(f"sqlite+aiosqlite:///{os.path.join(tmp, 'bench.db')}")
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        session_factory = async_sessionmaker(bind=engine, expire_on_commit=False)
+
+        async with session_factory() as session:
+            spot_id = await _seed(session, args.reviews)
+
+            print(f"{'page':>6} {'offset ms':>10} {'keyset ms':>10}")
+            for depth in DEPTHS:
+                offset = (depth - 1) * args.page_size
+                if offset >= args.reviews:
+                    break
+                after = None
+                if offset:
+                    boundary = await session.execute(
+                        select(SurfSessionReview.observed_at, SurfSessionReview.id)
+                        .where(SurfSessionReview.spot_id == spot_id)
+                        .order_by(SurfSessionReview.observed_at.desc(), SurfSessionReview.id.desc())
+                        .offset(offset - 1)
+                        .limit(1)
+                    )
+                    after = tuple(boundary.one())
+
+                offset_ms = await _time(
+                    lambda offset=offset: list_spot_reviews(session, spot_id, limit=args.page_size, offset=offset),
+                    args.repeats,
+                )
+                keyset_ms = await _time(
+                    lambda after=after: list_spot_reviews(session, spot_id, limit=args.page_size, after=after),
+                    args.repeats,
+                )
+                print(f"{depth:>6} {offset_ms:>10.2f} {keyset_ms:>10.2f}")
+                session.expunge_all()
+
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,67 @@
+"""Latency of the in-memory spot name search (SQLite fallback for GET /spot/search).
+
+Usage:
+    python -m benchmarks.spot_search --spots 20000
+"""
+
+import argparse
+import random
+import statistics
+import time
+
+from app.services.spot_index import SpotIndex, SpotPoint
+
+SYLLABLES = [consonant + vowel for consonant in "bcdfghjklmnprstvwyz" for vowel in "aeiou"]
+SUFFIXES = ["", " Bay", " Point", " Reef", " Beach", " Rights", " Lefts"]
+
+
+def _name(rng: random.Random, spot_id: int) -> str:
+    stem = "".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4))).capitalize()
+    return f"{stem}{rng.choice(SUFFIXES)} {spot_id}"
+
+
+def _typo(rng: random.Random, word: str) -> str:
+    i = rng.randrange(len(word))
+    return word[:i] + rng.choice("aeiou") + word[i + 1:]
+
+
+def _percentile(samples: list[float], pct: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct))]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--spots", type=int, default=20_000)
+    parser.add_argument("--queries", type=int, default=2_000)
+    parser.add_argument("--limit", type=int, default=10)
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    points = [SpotPoint(spot_id, _name(rng, spot_id), None, None) for spot_id in range(1, args.spots + 1)]
+
+    index = SpotIndex()
+    index.load(points)
+    start = time.perf_counter()
+    index.search("warm", 1)  # forces the lazy build
+    print(f"build: {(time.perf_counter() - start) * 1000:.1f} ms for {args.spots} spots")
+
+    for name, make_query in (
+        ("prefix", lambda p: p.name.split()[0][: rng.randint(2, 5)]),
+        ("typo", lambda p: _typo(rng, p.name.split()[0])),
+    ):
+        samples = []
+        hits = 0
+        for _ in range(args.queries):
+            query = make_query(rng.choice(points))
+            t0 = time.perf_counter()
+            hits += len(index.search(query, args.limit))
+            samples.append((time.perf_counter() - t0) * 1000)
+        print(
+            f"{name:>8}: p50 {statistics.median(samples):.3f} ms  p99 {_percentile(samples, 0.99):.3f} ms  "
+            f"avg hits {hits / args.queries:.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""Weather path throughput, cache effectiveness and tail latency against the bundled Open-Meteo stub.
+
+Usage:
+    python -m benchmarks.weather_service --requests 2000 --concurrency 50 --latency-ms 40
+
+Drives ``get_surf_report`` with a seeded, skewed mix of spots and hours (a few
+popular breaks, a long tail) through ``OpenMeteoClient`` mounted on the stub in
+``app.external_apis.openmeteo_stub`` over ``httpx.ASGITransport``, so nothing
+leaves the process. The stub adds ``--latency-ms`` plus up to ``--jitter-ms`` per
+call and fails ``--error-rate`` of them. The same workload runs once with the
+weather cache disabled (TTL 0; in-flight coalescing still applies) and once with
+it enabled, reporting throughput, p50/p95/p99, cache hit rate and how many calls
+reached the provider.
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import time
+from datetime import datetime, timedelta
+
+# The client and cache read their limits from settings.
+os.environ.setdefault("SECRET_KEY", "benchmark-secret-key")
+os.environ.setdefault("DATABASE_URL", "sqlite+aiosqlite:///:memory:")
+
+import httpx  # noqa: E402
+
+from app.core.exceptions import ExternalAPIError  # noqa: E402
+from app.external_apis import OpenMeteoClient  # noqa: E402
+from app.external_apis.openmeteo_stub import create_openmeteo_stub  # noqa: E402
+from app.services.weather_cache import weather_cache  # noqa: E402
+from app.services.weather_service import get_surf_report  # noqa: E402
+
+START = datetime(2026, 1, 13)
+
+
+def _workload(requests: int, spots: int, days: int, seed: int) -> list[tuple[float, float, datetime]]:
+    rng = random.Random(seed)
+    locations = [(38.5 + i * 0.05, -9.5 + (i % 7) * 0.03) for i in range(spots)]
+    # Zipf-like popularity: spot i is requested about 1/(i+1) as often as the busiest one.
+    weights = [1 / (i + 1) for i in range(spots)]
+    picks = rng.choices(locations, weights=weights, k=requests)
+    return [(lat, lon, START + timedelta(hours=rng.randrange(days * 24))) for lat, lon in picks]
+
+
+async def _run(workload, args, cache_ttl: float) -> dict:
+    stub = create_openmeteo_stub(
+        latency_ms=args.latency_ms, jitter_ms=args.jitter_ms, error_rate=args.error_rate, seed=args.seed
+    )
+    http = httpx.AsyncClient(transport=httpx.ASGITransport(app=stub))
+    client = OpenMeteoClient(http_client=http)
+    weather_cache.clear()
+    weather_cache.ttl_seconds = cache_ttl
+    gate = asyncio.Semaphore(args.concurrency)
+    latencies: list[float] = []
+    failures = 0
+
+    async def one(lat: float, lon: float, at: datetime) -> None:
+        nonlocal failures
+        async with gate:
+            started = time.perf_counter()
+            try:
+                await get_surf_report(lat, lon, at, client=client)
+            except ExternalAPIError:
+                failures += 1
+            latencies.append((time.perf_counter() - started) * 1000)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one(*item) for item in workload))
+    elapsed = time.perf_counter() - started
+    await http.aclose()
+
+    cuts = statistics.quantiles(latencies, n=100)
+    return {
+        "throughput": len(workload) / elapsed,
+        "p50": statistics.median(latencies),
+        "p95": cuts[94],
+        "p99": cuts[98],
+        "hit_rate": weather_cache.metrics()["hit_rate"],
+        "upstream": sum(stub.state.requests.values()),
+        "coalesced": client.metrics()["coalesced"],
+        "failures": failures,
+    }
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=2_000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--spots", type=int, default=40)
+    parser.add_argument("--days", type=int, default=3)
+    parser.add_argument("--latency-ms", type=float, default=40.0)
+    parser.add_argument("--jitter-ms", type=float, default=20.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    workload = _workload(args.requests, args.spots, args.days, args.seed)
+    configured_ttl = weather_cache.ttl_seconds
+    try:
+        for label, ttl in (("cache disabled", 0), ("cache enabled", configured_ttl)):
+            r = await _run(workload, args, ttl)
+            print(
+                f"{label:<15} {r['throughput']:8.0f} req/s  p50 {r['p50']:7.2f} ms  p95 {r['p95']:7.2f} ms  "
+                f"p99 {r['p99']:7.2f} ms  hit rate {r['hit_rate']:6.1%}  upstream {r['upstream']:5d}  "
+                f"coalesced {r['coalesced']:5d}  failed {r['failures']}"
+            )
+    finally:
+        weather_cache.ttl_seconds = configured_ttl
+        weather_cache.clear()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
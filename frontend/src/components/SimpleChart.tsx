@@ -79,7 +79,13 @@ const CustomTooltip = React.memo(({ active, payload, timeRange }: any) => {
           {getTitle()}
         </p>
         
-        {sessions.length === 0 ? (
+        {sessions.length === 0 && dataPoint.sessionsCount ? (
+          <div className="flex justify-between gap-4 text-xs text-content-secondary">
+            <span>{dataPoint.sessionsCount} {dataPoint.sessionsCount === 1 ? 'session' : 'sessions'}</span>
+            <span>Total: {payload[0].value} min</span>
+            <span>Avg: {avgQualityLabel}</span>
+          </div>
+        ) : sessions.length === 0 ? (
           <div className="text-xs text-content-tertiary">No sessions</div>
         ) : (
           <div className="space-y-3">
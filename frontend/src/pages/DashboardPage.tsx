@@ -2,41 +2,43 @@ import { useEffect, useState, useMemo } from 'react';
 import { Link } from 'react-router-dom';
 import { useSwipeable } from 'react-swipeable';
 import { surfSessionsAPI } from '../services/api';
-import { SurfSessionResponse } from '../types/api';
+import { SurfSessionResponse, SurfSessionStatsResponse } from '../types/api';
 import { Waves, Edit, ChevronLeft, ChevronRight } from 'lucide-react';
 import { Card, CardHeader, CardContent, EmptyState, Button, SectionTitle, SegmentedControl, Loading, Alert, AlertDescription } from '../components/ui';
 import { SimpleChart } from '../components/SimpleChart';
 import { PageHero } from '../components/PageHero';
 import { 
   addDays,
+  format,
   subDays,
 } from 'date-fns';
 import {
   calculateStats,
-  getSessionsForTimeRange,
-  getChartDataForTimeRange,
   formatDuration,
   formatWaveQuality,
   formatSessionDate,
-  groupSessionsBySpot,
-  groupSessionsBySurfboard,
   getTimeRangeLabel,
+  statsToChartData,
+  statsToSessionStats,
+  statsToSpotDistribution,
+  statsToSurfboardDistribution,
   type TimeRange
 } from '../utils/stats';
 import { SpotDistributionChart } from '../components/SpotDistributionChart';
 
 const DashboardPage = () => {
-  const [sessions, setSessions] = useState<SurfSessionResponse[]>([]);
+  const [recentSessions, setRecentSessions] = useState<SurfSessionResponse[]>([]);
+  const [stats, setStats] = useState<SurfSessionStatsResponse | null>(null);
   const [isLoading, setIsLoading] = useState(true);
   const [error, setError] = useState('');
   const [timeRange, setTimeRange] = useState<TimeRange>('week');
   const [currentDate, setCurrentDate] = useState(new Date());
 
   useEffect(() => {
-    const fetchSessions = async () => {
+    const fetchRecentSessions = async () => {
       try {
-        const data = await surfSessionsAPI.getAll();
-        setSessions(data);
+        const { sessions } = await surfSessionsAPI.getPage(5);
+        setRecentSessions(sessions);
       } catch (err: any) {
         setError('Failed to load sessions');
       } finally {
@@ -44,36 +46,40 @@ const DashboardPage = () => {
       }
     };
 
-    fetchSessions();
+    fetchRecentSessions();
   }, []);
 
-  // Calculate statistics for selected time range and current date
-  const timeRangeSessions = useMemo(() => {
-    return getSessionsForTimeRange(sessions, timeRange, currentDate);
-  }, [sessions, timeRange, currentDate]);
+  // Aggregates are computed server-side for the selected range and current date
+  useEffect(() => {
+    let cancelled = false;
+    surfSessionsAPI
+      .getStats(timeRange, format(currentDate, 'yyyy-MM-dd'))
+      .then((data) => {
+        if (!cancelled) setStats(data);
+      })
+      .catch(() => {
+        if (!cancelled) setError('Failed to load statistics');
+      });
+    return () => {
+      cancelled = true;
+    };
+  }, [timeRange, currentDate]);
 
   const timeRangeStats = useMemo(() => {
-    return calculateStats(timeRangeSessions);
-  }, [timeRangeSessions]);
+    return stats ? statsToSessionStats(stats) : calculateStats([]);
+  }, [stats]);
 
-  // Prepare chart data for selected time range
   const chartData = useMemo(() => {
-    return getChartDataForTimeRange(sessions, timeRange, currentDate);
-  }, [sessions, timeRange, currentDate]);
+    return stats ? statsToChartData(stats) : [];
+  }, [stats]);
 
   const spotDistributionData = useMemo(() => {
-    return groupSessionsBySpot(timeRangeSessions);
-  }, [timeRangeSessions]);
+    return stats ? statsToSpotDistribution(stats) : [];
+  }, [stats]);
 
   const surfboardDistributionData = useMemo(() => {
-    return groupSessionsBySurfboard(timeRangeSessions);
-  }, [timeRangeSessions]);
-
-  const recentSessions = useMemo(() => {
-    return [...sessions]
-      .sort((a, b) => new Date(b.datetime).getTime() - new Date(a.datetime).getTime())
-      .slice(0, 5);
-  }, [sessions]);
+    return stats ? statsToSurfboardDistribution(stats) : [];
+  }, [stats]);
 
   const handlePrevious = () => {
     if (timeRange === 'week') {
@@ -347,7 +353,7 @@ const DashboardPage = () => {
             </Alert>
           )}
 
-          {sessions.length === 0 ? (
+          {recentSessions.length === 0 ? (
             <EmptyState
               icon={<Waves className="h-12 w-12" />}
               title="No surf sessions yet"
@@ -436,7 +442,7 @@ const DashboardPage = () => {
                 ))}
               </div>
 
-              {sessions.length >= 5 && (
+              {recentSessions.length >= 5 && (
                 <div className="text-center pt-4">
                   <Link to="/sessions" className="text-accent hover:text-accent-hover text-body font-medium">
                     View all sessions →
@@ -6,10 +6,14 @@ import { Card, Button, Loading, Alert, AlertDescription } from '../components/ui
 import { SessionsTable } from '../components/SessionsTable';
 import { PageHero } from '../components/PageHero';
 
+const PAGE_SIZE = 50;
+
 const SurfSessionsPage = () => {
   const [sessions, setSessions] = useState<SurfSessionResponse[]>([]);
   const [isLoading, setIsLoading] = useState(true);
   const [error, setError] = useState('');
+  const [nextCursor, setNextCursor] = useState<string | null>(null);
+  const [isLoadingMore, setIsLoadingMore] = useState(false);
 
   useEffect(() => {
     fetchSessions();
@@ -17,9 +21,10 @@ const SurfSessionsPage = () => {
 
   const fetchSessions = async () => {
     try {
-      const data = await surfSessionsAPI.getAll();
-      const sortedData = [...data].sort((a, b) => new Date(b.datetime).getTime() - new Date(a.datetime).getTime());
-      setSessions(sortedData);
+      // The API returns sessions newest first; later pages are appended.
+      const { sessions: page, nextCursor: cursor } = await surfSessionsAPI.getPage(PAGE_SIZE);
+      setSessions(page);
+      setNextCursor(cursor);
     } catch (err: any) {
       setError('Failed to load sessions');
     } finally {
@@ -27,6 +32,22 @@ const SurfSessionsPage = () => {
     }
   };
 
+  const loadMoreSessions = async () => {
+    if (!nextCursor) {
+      return;
+    }
+    setIsLoadingMore(true);
+    try {
+      const { sessions: page, nextCursor: cursor } = await surfSessionsAPI.getPage(PAGE_SIZE, nextCursor);
+      setSessions(prev => [...prev, ...page]);
+      setNextCursor(cursor);
+    } catch (err: any) {
+      setError('Failed to load sessions');
+    } finally {
+      setIsLoadingMore(false);
+    }
+  };
+
   const handleDelete = async (id: number) => {
     if (!confirm('Are you sure you want to delete this session? This cannot be undone.')) {
       return;
@@ -76,6 +97,20 @@ const SurfSessionsPage = () => {
           emptyActionLabel="Add Your First Session"
         />
       </Card>
+
+      {nextCursor && (
+        <div className="flex justify-center">
+          <Button
+            type="button"
+            variant="secondary"
+            size="md"
+            onClick={loadMoreSessions}
+            disabled={isLoadingMore}
+          >
+            {isLoadingMore ? 'Loading...' : 'Load more sessions'}
+          </Button>
+        </div>
+      )}
     </div>
   );
 };
@@ -27,6 +27,7 @@ const SurfSpotsPage = () => {
   const [expandedSpotId, setExpandedSpotId] = useState<number | null>(null);
   const [reviewsBySpot, setReviewsBySpot] = useState<Record<number, SpotReviewResponse[]>>({});
   const [reviewsHasMore, setReviewsHasMore] = useState<Record<number, boolean>>({});
+  const [reviewsCursor, setReviewsCursor] = useState<Record<number, string | null>>({});
   const [reviewsLoading, setReviewsLoading] = useState<Record<number, boolean>>({});
 
   useEffect(() => {
@@ -96,14 +97,15 @@ const SurfSpotsPage = () => {
 
   const loadSpotReviews = async (spotId: number, append: boolean) => {
     setReviewsLoading(prev => ({ ...prev, [spotId]: true }));
-    const offset = append ? (reviewsBySpot[spotId]?.length || 0) : 0;
+    const cursor = append ? reviewsCursor[spotId] : null;
     try {
-      const loadedReviews = await spotsAPI.getReviews(spotId, 10, offset);
+      const { reviews: loadedReviews, nextCursor } = await spotsAPI.getReviews(spotId, 10, cursor);
       setReviewsBySpot(prev => ({
         ...prev,
         [spotId]: append ? [...(prev[spotId] || []), ...loadedReviews] : loadedReviews,
       }));
-      setReviewsHasMore(prev => ({ ...prev, [spotId]: loadedReviews.length === 10 }));
+      setReviewsCursor(prev => ({ ...prev, [spotId]: nextCursor }));
+      setReviewsHasMore(prev => ({ ...prev, [spotId]: nextCursor !== null }));
     } finally {
       setReviewsLoading(prev => ({ ...prev, [spotId]: false }));
     }
@@ -9,6 +9,8 @@ import {
   SpotReviewResponse,
   SurfSessionCreate,
   SurfSessionResponse,
+  SurfSessionStatsResponse,
+  StatsRange,
   SurfboardCreate,
   SurfboardResponse,
   SurfboardUpdate
@@ -70,6 +72,24 @@ export const surfSessionsAPI = {
     return response.data;
   },
 
+  getPage: async (
+    limit = 50,
+    cursor?: string | null,
+  ): Promise<{ sessions: SurfSessionResponse[]; nextCursor: string | null }> => {
+    const response = await api.get('/surf_session/', {
+      params: cursor ? { limit, cursor } : { limit },
+    });
+    return {
+      sessions: response.data,
+      nextCursor: response.headers['x-next-cursor'] ?? null,
+    };
+  },
+
+  getStats: async (range: StatsRange, date: string): Promise<SurfSessionStatsResponse> => {
+    const response = await api.get('/surf_session/stats', { params: { range, date } });
+    return response.data;
+  },
+
   getById: async (id: number): Promise<SurfSessionResponse> => {
     const response = await api.get(`/surf_session/${id}`);
     return response.data;
@@ -134,10 +154,17 @@ export const spotsAPI = {
     return response.data;
   },
 
-  getReviews: async (spotId: number, limit = 50, offset = 0): Promise<SpotReviewResponse[]> => {
+  getReviews: async (
+    spotId: number,
+    limit = 50,
+    cursor?: string | null,
+  ): Promise<{ reviews: SpotReviewResponse[]; nextCursor: string | null }> => {
     const response = await api.get(`/spot/${spotId}/reviews`, {
-      params: { limit, offset },
+      params: cursor ? { limit, cursor } : { limit },
     });
-    return response.data;
+    return {
+      reviews: response.data,
+      nextCursor: response.headers['x-next-cursor'] ?? null,
+    };
   },
 };
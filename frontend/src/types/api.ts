@@ -162,3 +162,38 @@ export interface SurfSessionResponse {
   tide_low_m?: number;
   tide_high_m?: number;
 }
+
+export type StatsRange = 'week' | 'month' | '3month' | 'all';
+export type StatsBucket = 'day' | 'week' | 'month';
+
+export interface SurfSessionStatsBucket {
+  start: string;
+  sessions_count: number;
+  total_minutes: number;
+  avg_quality?: number | null;
+}
+
+export interface SurfSessionStatsSpot {
+  name: string;
+  sessions_count: number;
+}
+
+export interface SurfSessionStatsSurfboard {
+  name: string;
+  length_ft?: number | null;
+  sessions_count: number;
+}
+
+export interface SurfSessionStatsResponse {
+  range: StatsRange;
+  bucket: StatsBucket;
+  start?: string | null;
+  end: string;
+  sessions_count: number;
+  total_minutes: number;
+  avg_quality?: number | null;
+  top_spot?: string | null;
+  spots: SurfSessionStatsSpot[];
+  surfboards: SurfSessionStatsSurfboard[];
+  buckets: SurfSessionStatsBucket[];
+}
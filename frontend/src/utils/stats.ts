@@ -1,4 +1,4 @@
-import { SurfSessionResponse } from '../types/api';
+import { SurfSessionResponse, SurfSessionStatsResponse } from '../types/api';
 import { startOfMonth, endOfMonth, subMonths, subDays, isWithinInterval, format, parseISO, eachDayOfInterval, startOfDay, addMinutes } from 'date-fns';
 
 export type TimeRange = 'week' | 'month' | '3month' | 'all';
@@ -16,6 +16,7 @@ export interface ChartDataPoint {
   date: Date;
   avgWaveQuality?: number;
   sessions?: SurfSessionResponse[];
+  sessionsCount?: number;
 }
 
 export interface PieChartDataPoint {
@@ -25,6 +26,17 @@ export interface PieChartDataPoint {
   legendLabel?: string;
 }
 
+const DISTRIBUTION_COLORS = [
+  '#06b6d4', // cyan-500
+  '#22c55e', // green-500
+  '#eab308', // yellow-500
+  '#f97316', // orange-500
+  '#ef4444', // red-500
+  '#a855f7', // purple-500
+  '#ec4899', // pink-500
+  '#6366f1', // indigo-500
+];
+
 /**
  * Calculate statistics for a given set of sessions
  */
@@ -358,23 +370,12 @@ export function groupSessionsBySpot(sessions: SurfSessionResponse[]): PieChartDa
     spotCounts[spotName] = (spotCounts[spotName] || 0) + 1;
   });
 
-  const colors = [
-    '#06b6d4', // cyan-500
-    '#22c55e', // green-500
-    '#eab308', // yellow-500
-    '#f97316', // orange-500
-    '#ef4444', // red-500
-    '#a855f7', // purple-500
-    '#ec4899', // pink-500
-    '#6366f1', // indigo-500
-  ];
-
   return Object.entries(spotCounts)
     .sort((a, b) => b[1] - a[1]) // Sort by count descending
     .map(([name, value], index) => ({
       name,
       value,
-      color: colors[index % colors.length]
+      color: DISTRIBUTION_COLORS[index % DISTRIBUTION_COLORS.length]
     }));
 }
 
@@ -406,27 +407,71 @@ export function groupSessionsBySurfboard(sessions: SurfSessionResponse[]): PieCh
     boardCounts[boardKey].count += 1;
   });
 
-  const colors = [
-    '#06b6d4', // cyan-500
-    '#22c55e', // green-500
-    '#eab308', // yellow-500
-    '#f97316', // orange-500
-    '#ef4444', // red-500
-    '#a855f7', // purple-500
-    '#ec4899', // pink-500
-    '#6366f1', // indigo-500
-  ];
-
   return Object.entries(boardCounts)
     .sort((a, b) => b[1].count - a[1].count)
     .map(([_, info], index) => ({
       name: info.name,
       legendLabel: info.legendLabel,
       value: info.count,
-      color: colors[index % colors.length]
+      color: DISTRIBUTION_COLORS[index % DISTRIBUTION_COLORS.length]
     }));
 }
 
+/**
+ * Headline numbers from the server-side stats endpoint
+ */
+export function statsToSessionStats(stats: SurfSessionStatsResponse): SessionStats {
+  return {
+    sessionsCount: stats.sessions_count,
+    totalSurfTime: stats.total_minutes,
+    avgWaveQuality: stats.avg_quality ?? 0,
+    mostPopularSpot: stats.top_spot ?? '—',
+  };
+}
+
+/**
+ * Chart points from the server-side stats buckets
+ */
+export function statsToChartData(stats: SurfSessionStatsResponse): ChartDataPoint[] {
+  const labelFormat = stats.bucket === 'month' ? 'MMM yyyy' : 'MMM d';
+  return stats.buckets.map(bucket => {
+    const date = parseISO(bucket.start);
+    return {
+      label: format(date, labelFormat),
+      value: bucket.total_minutes,
+      date,
+      avgWaveQuality: bucket.avg_quality ?? 0,
+      sessionsCount: bucket.sessions_count,
+    };
+  });
+}
+
+/**
+ * Spot distribution from the server-side stats (already sorted by count)
+ */
+export function statsToSpotDistribution(stats: SurfSessionStatsResponse): PieChartDataPoint[] {
+  return stats.spots.map((spot, index) => ({
+    name: spot.name,
+    value: spot.sessions_count,
+    color: DISTRIBUTION_COLORS[index % DISTRIBUTION_COLORS.length],
+  }));
+}
+
+/**
+ * Surfboard distribution from the server-side stats (already sorted by count)
+ */
+export function statsToSurfboardDistribution(stats: SurfSessionStatsResponse): PieChartDataPoint[] {
+  return stats.surfboards.map((board, index) => {
+    const lengthLabel = formatSurfboardLength(board.length_ft);
+    return {
+      name: board.name,
+      legendLabel: lengthLabel ? `${board.name} ${lengthLabel}` : board.name,
+      value: board.sessions_count,
+      color: DISTRIBUTION_COLORS[index % DISTRIBUTION_COLORS.length],
+    };
+  });
+}
+
 function formatSurfboardLength(lengthFt?: number | null): string | null {
   if (lengthFt == null || Number.isNaN(lengthFt)) return null;
 
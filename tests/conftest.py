@@ -8,6 +8,7 @@ from typing import AsyncGenerator
 import pytest
 import pytest_asyncio
 from httpx import ASGITransport, AsyncClient
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.pool import StaticPool
 
@@ -25,6 +26,9 @@ from app.models.surf_forecast import SurfForecast
 from app.models.surf_session import SurfSession
 from app.models.surf_session_review import SurfSessionReview
 from app.models.users import User
+from app.services.spot_catalogue_cache import bump_spot_catalogue_version
+from app.services.spot_index import spot_index
+from app.services.user_cache import user_principal_cache
 
 SQLALCHEMY_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
 
@@ -53,6 +57,19 @@ async def _dispose_async_engines():
     await app_async_engine.dispose()
 
 
+@pytest.fixture(autouse=True)
+def _fresh_spot_caches():
+    """Tests seed spots directly through the ORM, so never reuse spot state cached by another test."""
+    bump_spot_catalogue_version()
+    spot_index.reset()
+
+
+@pytest.fixture(autouse=True)
+def _fresh_user_cache():
+    """Test users share ids across rolled-back transactions, so never serve a principal cached by another test."""
+    user_principal_cache.clear()
+
+
 @pytest_asyncio.fixture
 async def test_db() -> AsyncGenerator[AsyncSession, None]:
     # Create tables
@@ -82,6 +99,39 @@ async def client(test_db: AsyncSession) -> AsyncGenerator[AsyncClient, None]:
     app.dependency_overrides.clear()
 
 
+class QueryCounter:
+    """Collects SQL statements executed on the test engine while active."""
+
+    def __init__(self):
+        self.statements: list[str] = []
+        self.active = False
+
+    @property
+    def count(self) -> int:
+        return len(self.statements)
+
+    def __enter__(self):
+        self.statements.clear()
+        self.active = True
+        return self
+
+    def __exit__(self, *args):
+        self.active = False
+
+
+@pytest.fixture
+def query_counter():
+    counter = QueryCounter()
+
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if counter.active:
+            counter.statements.append(statement)
+
+    event.listen(async_engine.sync_engine, "before_cursor_execute", _before_cursor_execute)
+    yield counter
+    event.remove(async_engine.sync_engine, "before_cursor_execute", _before_cursor_execute)
+
+
 @pytest_asyncio.fixture
 async def test_spots(test_db: AsyncSession):
     spots = [
@@ -185,6 +235,34 @@ async def authenticated_client(client: AsyncClient, auth_token):
     return client
 
 
+@pytest_asyncio.fixture
+async def admin_user(test_db: AsyncSession):
+    from app.core.security import hash_password
+
+    user = User(
+        email="admin@example.com",
+        hashed_password=hash_password("adminpassword123"),
+        is_admin=True,
+    )
+    test_db.add(user)
+    await test_db.commit()
+    await test_db.refresh(user)
+    return user
+
+
+@pytest_asyncio.fixture
+async def authenticated_admin_client(client: AsyncClient, admin_user):
+    login_data = {
+        "username": "admin@example.com",
+        "password": "adminpassword123",
+    }
+    response = await client.post("/auth/login", data=login_data)
+    assert response.status_code == 200
+    token_data = response.json()
+    client.headers.update({"Authorization": f"Bearer {token_data['access_token']}"})
+    return client
+
+
 # Ensure pytest's caplog handler remains attached when dictConfig runs in lifespan
 def _retain_pytest_handlers(func):
     def wrapper(*args, **kwargs):
@@ -1,8 +1,15 @@
-from datetime import datetime, timezone
+import asyncio
+import threading
+import time
+from datetime import datetime, timedelta, timezone
 
 import pytest
 
-from app.core.security import verify_token
+from app.core import security
+from app.core.config import settings
+from app.core.password_hashing import password_hash_pool
+from app.core.security import create_access_token, decoded_token_cache, verify_token
+from app.services.user_cache import UserPrincipalCache, invalidate_user, user_principal_cache
 
 
 @pytest.mark.asyncio
@@ -102,3 +109,113 @@ async def test_login_remember_me_token_ttl_is_long(client, test_user):
     seconds_until_expiry = payload["exp"] - int(datetime.now(timezone.utc).timestamp())
     expected_30_days = 30 * 24 * 60 * 60
     assert expected_30_days - (24 * 60 * 60) <= seconds_until_expiry <= expected_30_days + (24 * 60 * 60)
+
+
+def _user_queries(query_counter) -> list[str]:
+    return [statement for statement in query_counter.statements if "FROM users" in statement]
+
+
+@pytest.mark.asyncio
+async def test_current_user_is_cached_until_invalidated(authenticated_client, test_db, test_user, query_counter):
+    with query_counter:
+        assert (await authenticated_client.get("/auth/me")).status_code == 200
+        assert (await authenticated_client.get("/auth/me")).status_code == 200
+    assert len(_user_queries(query_counter)) == 1
+
+    await test_db.delete(test_user)
+    await test_db.commit()
+    # Still served from the cache until the row change is reported.
+    assert (await authenticated_client.get("/auth/me")).status_code == 200
+    invalidate_user(test_user.id)
+    response = await authenticated_client.get("/auth/me")
+    assert response.status_code == 401
+    assert response.json()["detail"] == "User not found"
+
+
+@pytest.mark.asyncio
+async def test_trusted_token_claims_skip_user_query(client, test_user, query_counter, monkeypatch):
+    login = {"username": test_user.email, "password": "testpassword123"}
+    token = (await client.post("/auth/login", data=login)).json()["access_token"]
+    assert "email" not in verify_token(token)
+
+    monkeypatch.setattr(settings, "AUTH_TRUST_TOKEN_CLAIMS", True)
+    token = (await client.post("/auth/login", data=login)).json()["access_token"]
+    assert verify_token(token)["email"] == test_user.email
+    client.headers.update({"Authorization": f"Bearer {token}"})
+    with query_counter:
+        response = await client.get("/auth/me")
+    assert response.status_code == 200
+    assert response.json()["email"] == test_user.email
+    assert _user_queries(query_counter) == []
+
+    # A token issued before the invalidation is no longer trusted and falls back to the database.
+    invalidate_user(test_user.id)
+    query_counter.statements.clear()
+    with query_counter:
+        assert (await client.get("/auth/me")).status_code == 200
+    assert len(_user_queries(query_counter)) == 1
+
+    # Claims are only trusted within one TTL of issue; older tokens (e.g. across a restart) revalidate.
+    user_principal_cache.clear()
+    monkeypatch.setattr(user_principal_cache, "ttl_seconds", 0)
+    query_counter.statements.clear()
+    with query_counter:
+        assert (await client.get("/auth/me")).status_code == 200
+    assert len(_user_queries(query_counter)) == 1
+
+
+def test_invalidation_records_outlive_cache_eviction():
+    cache = UserPrincipalCache(ttl_seconds=60, max_entries=2)
+    issued_at = time.time() - 1
+    for user_id in range(1, 5):
+        cache.invalidate(user_id)
+    # More users were invalidated than the cache holds, yet every pre-invalidation token stays untrusted.
+    assert not any(cache.trusts_token(user_id, issued_at) for user_id in range(1, 5))
+    assert cache.trusts_token(5, issued_at)
+
+
+@pytest.mark.asyncio
+async def test_login_is_rejected_when_password_hashing_is_saturated(
+    client, authenticated_admin_client, test_user, monkeypatch
+):
+    # ``client`` carries the admin token the metrics endpoint requires.
+    monkeypatch.setattr(password_hash_pool, "max_queue", 0)
+    before = (await client.get("/health/password-hashing")).json()
+    release = threading.Event()
+    blockers = [asyncio.create_task(password_hash_pool.run(release.wait)) for _ in range(password_hash_pool.workers)]
+    await asyncio.sleep(0)
+    try:
+        response = await client.post("/auth/login", data={"username": test_user.email, "password": "testpassword123"})
+        assert response.status_code == 429
+        assert response.json()["code"] == "PASSWORD_HASHING_BUSY"
+        assert (await client.get("/health/password-hashing")).json()["in_flight"] == password_hash_pool.workers
+    finally:
+        release.set()
+        await asyncio.gather(*blockers)
+
+    response = await client.post("/auth/login", data={"username": test_user.email, "password": "testpassword123"})
+    assert response.status_code == 200
+    after = (await client.get("/health/password-hashing")).json()
+    assert after["rejected"] == before["rejected"] + 1
+    assert after["completed"] == before["completed"] + password_hash_pool.workers + 1
+    assert after["in_flight"] == 0 and after["max_hash_ms"] > 0
+
+
+@pytest.mark.asyncio
+async def test_verified_tokens_are_cached_until_exp(authenticated_admin_client, monkeypatch):
+    decodes = []
+    decode = security.jwt.decode
+    monkeypatch.setattr(security.jwt, "decode", lambda *args, **kwargs: decodes.append(1) or decode(*args, **kwargs))
+    decoded_token_cache.clear()
+
+    for _ in range(3):
+        assert (await authenticated_admin_client.get("/auth/me")).status_code == 200
+    assert len(decodes) == 1
+    # The metrics request itself is authenticated from the cache too.
+    metrics = (await authenticated_admin_client.get("/health/token-cache")).json()
+    assert (metrics["hits"], metrics["misses"], metrics["entries"]) == (3, 1, 1)
+
+    expired = create_access_token({"sub": "1"}, expires_delta=timedelta(seconds=-1))
+    assert verify_token(expired) is None
+    assert verify_token("not-a-token") is None
+    assert decoded_token_cache.metrics()["entries"] == 1
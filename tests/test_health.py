@@ -24,3 +24,11 @@ async def test_health_echoes_request_id_header(client):
     resp = await client.get("/health", headers={"X-Request-ID": custom_id})
     assert resp.status_code == 200
     assert resp.headers.get("X-Request-ID") == custom_id
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("path", ["/health/password-hashing", "/health/token-cache", "/health/openmeteo"])
+async def test_metrics_endpoints_require_admin(client, authenticated_client, path):
+    assert (await authenticated_client.get(path)).status_code == 403
+    client.headers.pop("Authorization")
+    assert (await client.get(path)).status_code == 401
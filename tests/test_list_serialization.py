@@ -0,0 +1,134 @@
+import json
+from datetime import datetime, timedelta, timezone
+
+import pytest
+import pytest_asyncio
+from pydantic import TypeAdapter
+
+from app.models import Spot, Surfboard, SurfSession, SurfSessionReview
+from app.schemas.spot import SpotResponse
+from app.schemas.surf_session import SurfSessionNormalizedListResponse, SurfSessionResponse
+from app.schemas.surf_session_review import SpotReviewResponse
+from app.schemas.surfboard import SurfboardResponse
+from app.services.spot_review_daily_service import rebuild_spot_review_daily
+from app.services.spot_service import list_spots
+from app.services.surf_session_review_service import list_spot_reviews
+from app.services.surf_session_service import list_surf_sessions
+from app.services.surfboard_service import get_surfboards_by_owner_id
+
+
+def _fastapi_json(adapter: TypeAdapter, value) -> bytes:
+    """What FastAPI sends for ``value`` under ``response_model``: validate, dump, then ``JSONResponse``."""
+    content = adapter.dump_python(adapter.validate_python(value, from_attributes=True), mode="json")
+    return json.dumps(content, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")).encode()
+
+
+@pytest_asyncio.fixture
+async def mixed_sessions(test_db, test_user):
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    spots = [Spot(name="Pipeline", difficulty=[3, 4]), Spot(name="Ericeira – Coxos", latitude=38.99, longitude=-9.42)]
+    board = Surfboard(name="Fish", brand="Lost", length_ft=5.6, width_in=21.25, owner_id=test_user.id)
+    test_db.add_all([*spots, board])
+    await test_db.flush()
+    sessions = [
+        SurfSession(
+            spot_id=spots[0].id,
+            surfboard_id=board.id,
+            datetime=now - timedelta(hours=3, microseconds=120),
+            duration_minutes=95,
+            notes="glassy ☀ café",
+            user_id=test_user.id,
+            wave_height_m=1e-7,
+            wave_dir=" NE ",
+            wind_dir="",
+            rating=3,
+            tide_height_m=0.30000000000000004,
+        ),
+        SurfSession(
+            spot_id=spots[1].id,
+            datetime=now - timedelta(days=2),
+            duration_minutes=40,
+            surfboard_name="Borrowed",
+            surfboard_length_ft=9.0,
+            user_id=test_user.id,
+        ),
+        SurfSession(spot_id=spots[0].id, datetime=now - timedelta(days=5), duration_minutes=60, user_id=test_user.id),
+    ]
+    test_db.add_all(sessions)
+    await test_db.flush()
+    for surf_session, quality in ((sessions[0], 9), (sessions[2], 4)):
+        test_db.add(
+            SurfSessionReview(
+                surf_session_id=surf_session.id,
+                spot_id=surf_session.spot_id,
+                user_id=test_user.id,
+                observed_at=surf_session.datetime,
+                quality=quality,
+                wind_index=2,
+            )
+        )
+    await rebuild_spot_review_daily(test_db)
+    await test_db.commit()
+    test_db.expunge_all()
+    return sessions
+
+
+@pytest.mark.asyncio
+async def test_session_list_matches_response_model_bytes(authenticated_client, test_db, test_user, mixed_sessions):
+    response = await authenticated_client.get("/surf_session/")
+    test_db.expunge_all()
+    expected = _fastapi_json(TypeAdapter(list[SurfSessionResponse]), await list_surf_sessions(test_db, test_user.id))
+    assert response.content == expected
+    assert response.json()[0]["wave_dir"] == "NE" and response.json()[0]["wind_dir"] is None
+
+    page = await authenticated_client.get("/surf_session/", params={"limit": 2})
+    assert page.json() == response.json()[:2]
+    assert "x-next-cursor" in page.headers
+
+
+@pytest.mark.asyncio
+async def test_normalized_session_list_matches_response_model_bytes(
+    authenticated_client, test_db, test_user, mixed_sessions
+):
+    response = await authenticated_client.get("/surf_session/", params={"shape": "normalized"})
+    test_db.expunge_all()
+    sessions = await list_surf_sessions(test_db, test_user.id)
+    spots = sorted({session.spot for session in sessions}, key=lambda spot: spot.id)
+    expected = SurfSessionNormalizedListResponse(
+        sessions=sessions,
+        spots={spot.id: spot for spot in spots},
+        surfboards={session.surfboard.id: session.surfboard for session in sessions if session.surfboard},
+    )
+    assert response.content == _fastapi_json(TypeAdapter(SurfSessionNormalizedListResponse), expected)
+
+
+@pytest.mark.asyncio
+async def test_spot_and_surfboard_lists_match_response_model_bytes(
+    authenticated_client, test_db, test_user, mixed_sessions
+):
+    spot_response = await authenticated_client.get("/spot/")
+    test_db.expunge_all()
+    spot_adapter = TypeAdapter(list[SpotResponse])
+    spots = spot_adapter.validate_python(await list_spots(test_db), from_attributes=True)
+    assert spot_response.content == spot_adapter.dump_json(spots)
+    assert len(spot_response.json()[0]["recent_reviews"]) == 2
+
+    board_response = await authenticated_client.get("/surfboard/")
+    expected_boards = _fastapi_json(
+        TypeAdapter(list[SurfboardResponse]), await get_surfboards_by_owner_id(test_db, test_user.id)
+    )
+    assert board_response.content == expected_boards
+
+
+@pytest.mark.asyncio
+async def test_review_list_matches_response_model_bytes(authenticated_client, test_db, mixed_sessions):
+    spot_id = mixed_sessions[0].spot_id
+    response = await authenticated_client.get(f"/spot/{spot_id}/reviews", params={"limit": 1})
+    test_db.expunge_all()
+    expected = _fastapi_json(TypeAdapter(list[SpotReviewResponse]), await list_spot_reviews(test_db, spot_id, limit=1))
+    assert response.content == expected
+
+    rest = await authenticated_client.get(
+        f"/spot/{spot_id}/reviews", params={"cursor": response.headers["x-next-cursor"]}
+    )
+    assert [review["quality"] for review in rest.json()] == [4]
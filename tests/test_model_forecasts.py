@@ -0,0 +1,167 @@
+"""Tests for batched Open-Meteo ingestion into model_forecasts."""
+
+from datetime import date, datetime, timedelta
+from unittest.mock import patch
+
+import httpx
+import pytest
+import pytest_asyncio
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.external_apis import OpenMeteoClient
+from app.external_apis.openmeteo_stub import create_openmeteo_stub
+from app.models import ModelForecast, Spot
+from app.services.model_forecast_service import ingest_model_forecasts, model_forecast_rows
+
+DAY = date(2026, 1, 13)
+
+
+class _FakeSessionCtx:
+    def __init__(self, db: AsyncSession):
+        self._db = db
+
+    async def __aenter__(self):
+        return self._db
+
+    async def __aexit__(self, *args):
+        pass
+
+
+class _MultiLocationStub:
+    """Answers like Open-Meteo: one hourly object per comma-separated location, a bare object for one."""
+
+    def __init__(self, wave_height: float = 1.0, fail_latitudes: tuple[str, ...] = ()):
+        self.wave_height = wave_height
+        self.fail_latitudes = fail_latitudes
+        self.requests: list[httpx.Request] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        latitudes = request.url.params["latitude"].split(",")
+        if any(lat in self.fail_latitudes for lat in latitudes):
+            return httpx.Response(500)
+        start = datetime.fromisoformat(request.url.params["start_date"])
+        times = [(start + timedelta(hours=h)).strftime("%Y-%m-%dT%H:%M") for h in range(24)]
+        locations = []
+        for i, _ in enumerate(latitudes):
+            if request.url.path.endswith("/marine"):
+                hourly = {
+                    "time": times,
+                    "wave_height": [self.wave_height + i] * 24,
+                    "wave_period": [9.0] * 24,
+                    "wave_direction": [280.0] * 24,
+                }
+            else:
+                hourly = {"time": times, "wind_speed_10m": [12.0] * 24, "wind_direction_10m": [45.0] * 24}
+            locations.append({"latitude": float(latitudes[i]), "hourly": hourly})
+        return httpx.Response(200, json=locations if len(locations) > 1 else locations[0])
+
+
+def _client(stub: _MultiLocationStub) -> OpenMeteoClient:
+    return OpenMeteoClient(http_client=httpx.AsyncClient(transport=httpx.MockTransport(stub)))
+
+
+@pytest_asyncio.fixture
+async def located_spots(test_db: AsyncSession):
+    spots = [
+        Spot(name="Coxos", latitude=38.99, longitude=-9.42, surf_forecast_name="Coxos"),
+        Spot(name="Ribeira", latitude=38.98, longitude=-9.42),
+        Spot(name="Supertubos", latitude=39.34, longitude=-9.36),
+        Spot(name="Somewhere", latitude=None, longitude=None),
+    ]
+    test_db.add_all(spots)
+    await test_db.commit()
+    return spots
+
+
+@pytest.mark.asyncio
+async def test_ingest_batches_locations_and_upserts(test_db: AsyncSession, located_spots):
+    from app.worker import ingest_open_meteo_forecasts
+
+    stub = _MultiLocationStub()
+    with (
+        patch("app.worker.async_session", return_value=_FakeSessionCtx(test_db)),
+        patch("app.services.model_forecast_service.date") as fake_date,
+    ):
+        fake_date.today.return_value = DAY
+        await ingest_open_meteo_forecasts(_client(stub))
+
+    # One marine and one weather request cover all three located spots for the week.
+    assert [r.url.params["latitude"] for r in stub.requests] == ["38.99,38.98,39.34"] * 2
+    assert stub.requests[0].url.params["end_date"] == "2026-01-19"
+    rows = (await test_db.execute(select(ModelForecast).order_by(ModelForecast.spot_id))).scalars().all()
+    assert len(rows) == 3 * 24
+    first = rows[0]
+    assert (first.spot_id, first.timestamp) == (located_spots[0].id, datetime(2026, 1, 13))
+    assert (first.wave_height, first.wind_speed, first.wind_direction) == (1.0, 12.0, 45.0)
+
+    # A second run in batches of two updates the same hours in place.
+    stub = _MultiLocationStub(wave_height=2.0)
+    written = await ingest_model_forecasts(test_db, _client(stub), start_date=DAY, days=1, batch_size=2)
+    assert [r.url.params["latitude"] for r in stub.requests] == ["38.99,38.98"] * 2 + ["39.34"] * 2
+    assert written == 3 * 24
+    assert (await test_db.execute(select(func.count()).select_from(ModelForecast))).scalar_one() == 3 * 24
+    test_db.expunge_all()
+    refreshed = await test_db.get(ModelForecast, (located_spots[1].id, datetime(2026, 1, 13, 5)))
+    assert refreshed.wave_height == 3.0
+
+
+@pytest.mark.asyncio
+async def test_failed_batch_is_skipped(test_db: AsyncSession, located_spots):
+    stub = _MultiLocationStub(fail_latitudes=("39.34",))
+    written = await ingest_model_forecasts(test_db, _client(stub), start_date=DAY, days=1, batch_size=2)
+    assert written == 2 * 24
+    spot_ids = (await test_db.execute(select(ModelForecast.spot_id).distinct())).scalars().all()
+    assert sorted(spot_ids) == [located_spots[0].id, located_spots[1].id]
+
+
+@pytest.mark.asyncio
+async def test_ingest_against_openmeteo_stub(test_db: AsyncSession, located_spots):
+    stub = create_openmeteo_stub()
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=stub)) as http:
+        written = await ingest_model_forecasts(test_db, OpenMeteoClient(http_client=http), start_date=DAY, days=2)
+    assert written == 3 * 2 * 24
+    assert stub.state.requests == {"/v1/marine": 1, "/v1/forecast": 1}
+    last = await test_db.get(ModelForecast, (located_spots[2].id, datetime(2026, 1, 14, 23)))
+    assert last is not None and None not in (last.wave_height, last.wind_direction)
+
+
+def test_model_forecast_rows_align_weather_to_marine_hours():
+    marine = {
+        "hourly": {
+            "time": ["2026-01-13T00:00", "2026-01-13T01:00", "2026-01-13T02:00", "2026-01-13T03:00"],
+            "wave_height": [1.2, None, None, 1.5],
+            "wave_period": [9.0, None, None],
+            "wave_direction": [280, None, None, 290],
+        }
+    }
+    # Weather is missing hour 02:00 and 01:00 has no wind either, so that hour is dropped entirely.
+    weather = {
+        "hourly": {
+            "time": ["2026-01-13T00:00", "2026-01-13T01:00", "2026-01-13T03:00"],
+            "wind_speed_10m": [10.0, None, 14.0],
+            "wind_direction_10m": [40, None, 60],
+        }
+    }
+    expected = [
+        {
+            "spot_id": 7,
+            "timestamp": datetime(2026, 1, 13, 0),
+            "wave_height": 1.2,
+            "wave_period": 9.0,
+            "wave_direction": 280,
+            "wind_speed": 10.0,
+            "wind_direction": 40,
+        },
+        {
+            "spot_id": 7,
+            "timestamp": datetime(2026, 1, 13, 3),
+            "wave_height": 1.5,
+            "wave_period": None,
+            "wave_direction": 290,
+            "wind_speed": 14.0,
+            "wind_direction": 60,
+        },
+    ]
+    assert model_forecast_rows(7, marine, weather) == expected
@@ -0,0 +1,74 @@
+from datetime import date, datetime
+
+import httpx
+import pytest
+import pytest_asyncio
+
+from app.core.exceptions import ExternalAPIError
+from app.external_apis import OpenMeteoClient
+from app.external_apis.openmeteo_stub import create_openmeteo_stub
+from app.services.weather_cache import weather_cache
+from app.services.weather_service import get_surf_report
+
+DAY = date(2026, 1, 13)
+
+
+@pytest.fixture(autouse=True)
+def _fresh_weather_cache():
+    weather_cache.clear()
+
+
+@pytest_asyncio.fixture
+async def stub_client():
+    stubs = []
+
+    async def make(**options):
+        stub = create_openmeteo_stub(**options)
+        http = httpx.AsyncClient(transport=httpx.ASGITransport(app=stub))
+        stubs.append(http)
+        return OpenMeteoClient(http_client=http), stub
+
+    yield make
+    for http in stubs:
+        await http.aclose()
+
+
+@pytest.mark.asyncio
+async def test_surf_report_is_deterministic_against_stub(stub_client):
+    client, stub = await stub_client()
+    report = await get_surf_report(38.99, -9.42, datetime(2026, 1, 13, 6, 10), client=client)
+    weather_cache.clear()
+    other_client, _ = await stub_client()
+    again = await get_surf_report(38.99, -9.42, datetime(2026, 1, 13, 6, 10), client=other_client)
+
+    assert report == again
+    assert report["time"] == "2026-01-13T06:00"
+    assert set(report) == {"time", "wave_height", "wave_period", "wave_direction", "wind_speed", "wind_direction"}
+    assert all(value is not None for value in report.values())
+    assert stub.state.requests == {"/v1/marine": 1, "/v1/forecast": 1}
+
+
+@pytest.mark.asyncio
+async def test_stub_answers_multi_location_requests(stub_client):
+    client, _ = await stub_client()
+    coordinates = [(38.99, -9.42), (39.34, -9.36), (5.97, 80.43)]
+    locations = await client.get_marine_hourly_forecasts(coordinates, DAY, date(2026, 1, 14))
+    assert [(location["latitude"], location["longitude"]) for location in locations] == coordinates
+    assert all(len(location["hourly"]["wave_height"]) == 48 for location in locations)
+    assert locations[0]["hourly"]["wave_height"] != locations[1]["hourly"]["wave_height"]
+
+    # A single location is a bare object on the wire; the batch method still returns a list.
+    single = await client.get_weather_hourly_forecasts(coordinates[:1], DAY, DAY)
+    assert len(single) == 1 and single[0]["hourly"]["time"][-1] == "2026-01-13T23:00"
+
+
+@pytest.mark.asyncio
+async def test_stub_injects_errors_and_validates_params(stub_client):
+    client, stub = await stub_client(error_rate=1.0)
+    with pytest.raises(ExternalAPIError):
+        await client.get_marine_hourly_forecast(38.99, -9.42, DAY, DAY)
+    assert stub.state.errors["/v1/marine"] == 1
+
+    client, _ = await stub_client()
+    with pytest.raises(ExternalAPIError, match="400"):
+        await client.get_marine_hourly_forecast(38.99, -9.42, DAY, date(2026, 1, 12))
@@ -0,0 +1,64 @@
+import csv
+import io
+import json
+
+import pytest
+
+from app.services import surf_session_export_service
+
+
+@pytest.mark.asyncio
+async def test_export_csv_round_trips_through_import(authenticated_client, test_surf_sessions, monkeypatch):
+    monkeypatch.setattr(surf_session_export_service, "EXPORT_BATCH_SIZE", 1)
+    response = await authenticated_client.get("/surf_session/export", params={"format": "csv"})
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+    assert 'filename="surf_sessions.csv"' in response.headers["content-disposition"]
+
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert [(row["spot_name"], row["datetime"], row["review_quality"]) for row in rows] == [
+        ("Main Point", "2026-01-05T08:00:00", "3"),
+        ("Fisherman", "2026-01-13T08:00:00", "8"),
+    ]
+    assert rows[0]["wave_height_m"] == ""
+
+    # Export columns are import columns; drop the ones the import cannot take.
+    imported = io.StringIO()
+    fields = ["spot_name", "datetime", "duration_minutes", "notes"]
+    writer = csv.DictWriter(imported, fields, extrasaction="ignore")
+    writer.writeheader()
+    writer.writerows(rows)
+    response = await authenticated_client.post(
+        "/surf_session/import", content=imported.getvalue(), headers={"Content-Type": "text/csv"}
+    )
+    assert response.json()["imported"] == 2
+
+
+@pytest.mark.asyncio
+async def test_export_ndjson(authenticated_client, test_surf_sessions):
+    response = await authenticated_client.get("/surf_session/export", params={"format": "ndjson"})
+    assert response.status_code == 200
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    assert [row["notes"] for row in rows] == ["It was really not very good good", "It was really very good good"]
+    assert rows[1]["review_observed_at"] == "2026-01-13T08:00:00"
+    assert rows[1]["tide_height_m"] is None
+
+
+@pytest.mark.asyncio
+async def test_export_parquet(authenticated_client, test_surf_sessions, monkeypatch):
+    pq = pytest.importorskip("pyarrow.parquet")
+    monkeypatch.setattr(surf_session_export_service, "EXPORT_BATCH_SIZE", 1)
+    response = await authenticated_client.get("/surf_session/export", params={"format": "parquet"})
+    assert response.status_code == 200
+    parquet_file = pq.ParquetFile(io.BytesIO(response.content))
+    assert parquet_file.metadata.num_row_groups == 2
+    table = parquet_file.read()
+    assert table.column("duration_minutes").to_pylist() == [40, 120]
+    assert table.column("spot_name").to_pylist() == ["Main Point", "Fisherman"]
+
+
+@pytest.mark.asyncio
+async def test_export_parquet_without_pyarrow(authenticated_client, monkeypatch):
+    monkeypatch.setattr(surf_session_export_service, "pq", None)
+    response = await authenticated_client.get("/surf_session/export", params={"format": "parquet"})
+    assert response.status_code == 501
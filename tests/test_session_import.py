@@ -0,0 +1,71 @@
+import json
+
+import pytest
+
+from app.services import surf_session_import_service
+
+CSV_HEADERS = {"Content-Type": "text/csv"}
+
+
+@pytest.mark.asyncio
+async def test_import_csv_reports_rejected_lines(authenticated_client, test_spots, test_surf_forecasts):
+    body = (
+        "spot_name,datetime,duration_minutes,notes,review_quality,review_crowded_level,"
+        "review_wave_height_index,review_short_long_index,review_wind_index\n"
+        'Fisherman,2026-01-13T08:00:00,60,"glassy,\nthen windy",8,3,6,5,4\n'
+        "Main Point,2026-01-14T07:00:00,45,,,,,,\n"
+        "Nowhere,2026-01-14T07:00:00,45,,,,,,\n"
+        "Fisherman,not-a-date,45,,,,,,\n"
+        "Fisherman,2026-01-15T07:00:00\n"
+    )
+    response = await authenticated_client.post("/surf_session/import", content=body, headers=CSV_HEADERS)
+    assert response.status_code == 200
+    report = response.json()
+    assert (report["imported"], report["failed"], report["errors_truncated"]) == (2, 3, False)
+    assert [error["line"] for error in report["errors"]] == [5, 6, 7]
+    assert report["errors"][0]["errors"] == ["Spot 'Nowhere' not found"]
+    assert report["errors"][1]["errors"][0].startswith("datetime:")
+    assert report["errors"][2]["errors"] == ["expected 9 columns, got 2"]
+
+    sessions = (await authenticated_client.get("/surf_session/")).json()
+    by_spot = {session["spot"]["name"]: session for session in sessions}
+    assert by_spot["Fisherman"]["notes"] == "glassy,\nthen windy"
+    assert by_spot["Fisherman"]["review"]["quality"] == 8
+    assert by_spot["Fisherman"]["wave_height_m"] is not None
+    assert by_spot["Main Point"]["review"] is None
+
+    stats = await authenticated_client.get("/surf_session/stats", params={"range": "all", "date": "2026-01-31"})
+    assert (stats.json()["sessions_count"], stats.json()["total_minutes"]) == (2, 105)
+
+
+@pytest.mark.asyncio
+async def test_import_ndjson_in_batches(authenticated_client, test_spots, monkeypatch):
+    monkeypatch.setattr(surf_session_import_service, "IMPORT_BATCH_SIZE", 2)
+    rows = [
+        {"spot_id": test_spots[i % 2].id, "datetime": f"2026-02-{i + 1:02d}T07:00:00", "duration_minutes": 30}
+        for i in range(5)
+    ]
+    lines = [json.dumps(row) for row in rows] + ["", "[1, 2]", "{broken"]
+    response = await authenticated_client.post(
+        "/surf_session/import",
+        params={"format": "ndjson"},
+        content="\n".join(lines),
+    )
+    assert response.status_code == 200
+    report = response.json()
+    assert (report["imported"], report["failed"]) == (5, 2)
+    assert [error["line"] for error in report["errors"]] == [7, 8]
+
+    stats = await authenticated_client.get("/surf_session/stats", params={"range": "all", "date": "2026-02-28"})
+    assert stats.json()["spots"] == [
+        {"name": "Fisherman", "sessions_count": 3},
+        {"name": "Main Point", "sessions_count": 2},
+    ]
+
+
+@pytest.mark.asyncio
+async def test_import_rejects_unknown_format(authenticated_client):
+    response = await authenticated_client.post(
+        "/surf_session/import", content="{}", headers={"Content-Type": "application/json"}
+    )
+    assert response.status_code == 415
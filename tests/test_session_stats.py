@@ -0,0 +1,247 @@
+import time
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from app.admin.views import SurfSessionAdmin, SurfSessionReviewAdmin, UserAdmin
+from app.models import SurfSession, SurfSessionReview, User, UserActivityDaily
+from app.services.user_activity_daily_service import rebuild_user_activity_daily
+
+
+@pytest_asyncio.fixture
+async def stats_sessions(test_db, test_user, test_spots):
+    fisherman, main_point = test_spots
+    other_user = User(email="other@example.com", hashed_password="x")
+    test_db.add(other_user)
+    await test_db.flush()
+
+    fish = {"surfboard_name": "Fish", "surfboard_length_ft": 5.8}
+    ghost = {"surfboard_brand": "Pyzel", "surfboard_model": "Ghost"}
+    rows = [
+        (test_user.id, fisherman.id, datetime(2026, 3, 10, 8, 0), 60, 8, fish),
+        (test_user.id, main_point.id, datetime(2026, 3, 10, 16, 0), 30, None, ghost),
+        (test_user.id, fisherman.id, datetime(2026, 3, 5, 7, 0), 90, 4, {}),
+        (test_user.id, main_point.id, datetime(2026, 1, 20, 7, 0), 45, 6, {}),
+        (test_user.id, fisherman.id, datetime(2025, 6, 1, 7, 0), 120, None, {}),
+        (other_user.id, main_point.id, datetime(2026, 3, 9, 7, 0), 500, 1, {}),
+    ]
+    for user_id, spot_id, when, minutes, quality, extra in rows:
+        surf_session = SurfSession(spot_id=spot_id, datetime=when, duration_minutes=minutes, user_id=user_id, **extra)
+        test_db.add(surf_session)
+        await test_db.flush()
+        if quality is not None:
+            test_db.add(
+                SurfSessionReview(
+                    surf_session_id=surf_session.id,
+                    spot_id=spot_id,
+                    user_id=user_id,
+                    observed_at=when,
+                    quality=quality,
+                )
+            )
+    await rebuild_user_activity_daily(test_db)
+    await test_db.commit()
+
+
+@pytest.mark.asyncio
+async def test_week_stats(authenticated_client, stats_sessions):
+    response = await authenticated_client.get("/surf_session/stats", params={"range": "week", "date": "2026-03-10"})
+    assert response.status_code == 200
+    data = response.json()
+    assert (data["start"], data["end"], data["bucket"]) == ("2026-03-04", "2026-03-11", "day")
+    assert (data["sessions_count"], data["total_minutes"]) == (3, 180)
+    assert data["avg_quality"] == pytest.approx(6.0)
+    assert data["top_spot"] == "Fisherman"
+    assert data["spots"] == [
+        {"name": "Fisherman", "sessions_count": 2},
+        {"name": "Main Point", "sessions_count": 1},
+    ]
+    assert data["surfboards"] == [
+        {"name": "Fish", "length_ft": 5.8, "sessions_count": 1},
+        {"name": "Pyzel Ghost", "length_ft": None, "sessions_count": 1},
+    ]
+
+    buckets = {bucket["start"]: bucket for bucket in data["buckets"]}
+    assert len(buckets) == 7
+    assert buckets["2026-03-10"] == {
+        "start": "2026-03-10",
+        "sessions_count": 2,
+        "total_minutes": 90,
+        "avg_quality": 8.0,
+    }
+    assert buckets["2026-03-05"]["total_minutes"] == 90
+    assert buckets["2026-03-06"] == {
+        "start": "2026-03-06",
+        "sessions_count": 0,
+        "total_minutes": 0,
+        "avg_quality": None,
+    }
+
+
+@pytest.mark.asyncio
+async def test_three_month_and_all_time_stats(authenticated_client, stats_sessions):
+    quarter = (
+        await authenticated_client.get("/surf_session/stats", params={"range": "3month", "date": "2026-03-10"})
+    ).json()
+    assert quarter["bucket"] == "week"
+    assert quarter["buckets"][0]["start"] == "2025-12-11"
+    assert len(quarter["buckets"]) == 13
+    assert sum(bucket["sessions_count"] for bucket in quarter["buckets"]) == quarter["sessions_count"] == 4
+    assert quarter["buckets"][-1]["sessions_count"] == 3
+
+    everything = (
+        await authenticated_client.get("/surf_session/stats", params={"range": "all", "date": "2026-03-10"})
+    ).json()
+    assert everything["start"] is None
+    assert (everything["sessions_count"], everything["total_minutes"]) == (5, 345)
+    assert [bucket["start"] for bucket in everything["buckets"]][:3] == ["2025-04-01", "2025-05-01", "2025-06-01"]
+    assert len(everything["buckets"]) == 12
+    assert everything["buckets"][2]["total_minutes"] == 120
+
+    by_day = (
+        await authenticated_client.get(
+            "/surf_session/stats", params={"range": "month", "bucket": "day", "date": "2026-03-10"}
+        )
+    ).json()
+    assert len(by_day["buckets"]) == 30
+
+
+@pytest.mark.asyncio
+async def test_stats_empty_and_validation(authenticated_client):
+    empty = await authenticated_client.get("/surf_session/stats", params={"range": "week"})
+    assert empty.status_code == 200
+    data = empty.json()
+    assert (data["sessions_count"], data["total_minutes"], data["avg_quality"], data["top_spot"]) == (0, 0, None, None)
+
+    invalid = await authenticated_client.get("/surf_session/stats", params={"range": "year"})
+    assert invalid.status_code == 422
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("tz", ["Etc/GMT+12", "Etc/GMT-14"])
+async def test_stats_default_date_is_utc(authenticated_client, monkeypatch, tz):
+    # Between them these zones disagree with the UTC date at every hour of the day.
+    monkeypatch.setenv("TZ", tz)
+    time.tzset()
+    try:
+        data = (await authenticated_client.get("/surf_session/stats", params={"range": "week"})).json()
+    finally:
+        monkeypatch.undo()
+        time.tzset()
+    assert data["end"] == (datetime.now(timezone.utc).date() + timedelta(days=1)).isoformat()
+
+
+async def _activity_rows(test_db, user_id):
+    result = await test_db.execute(
+        select(UserActivityDaily)
+        .where(UserActivityDaily.user_id == user_id)
+        .order_by(UserActivityDaily.spot_id, UserActivityDaily.date)
+    )
+    return [
+        (row.date, row.spot_id, row.session_count, row.total_minutes, row.reviewed_count, row.quality_sum)
+        for row in result.scalars().all()
+    ]
+
+
+@pytest.mark.asyncio
+async def test_session_writes_maintain_user_activity_daily(authenticated_client, test_db, test_user, test_spots):
+    fisherman, main_point = test_spots
+    review = {"quality": 7, "crowded_level": 2, "wave_height_index": 5, "short_long_index": 5, "wind_index": 5}
+    first = await authenticated_client.post(
+        "/surf_session/",
+        json={"spot_id": fisherman.id, "datetime": "2026-03-10T08:00:00", "duration_minutes": 60, "review": review},
+    )
+    second = await authenticated_client.post(
+        "/surf_session/",
+        json={"spot_id": fisherman.id, "datetime": "2026-03-10T16:00:00", "duration_minutes": 30},
+    )
+    assert first.status_code == 201
+    assert second.status_code == 201
+    day = datetime(2026, 3, 10).date()
+    assert await _activity_rows(test_db, test_user.id) == [(day, fisherman.id, 2, 90, 1, 7)]
+
+    moved = await authenticated_client.put(
+        f"/surf_session/{second.json()['id']}",
+        json={
+            "spot_id": main_point.id,
+            "datetime": "2026-03-10T16:00:00",
+            "duration_minutes": 45,
+            "review": {**review, "quality": 3},
+        },
+    )
+    assert moved.status_code == 200
+    assert await _activity_rows(test_db, test_user.id) == [
+        (day, fisherman.id, 1, 60, 1, 7),
+        (day, main_point.id, 1, 45, 1, 3),
+    ]
+
+    deleted = await authenticated_client.delete(f"/surf_session/{first.json()['id']}")
+    assert deleted.status_code == 204
+    incremental = await _activity_rows(test_db, test_user.id)
+    assert incremental == [(day, main_point.id, 1, 45, 1, 3)]
+
+    assert await rebuild_user_activity_daily(test_db, [test_user.id]) == 1
+    assert await _activity_rows(test_db, test_user.id) == incremental
+
+
+def _admin_view(view_class, db):
+    """An admin view whose sqladmin sessions run on the test connection."""
+    view = view_class()
+    view.session_maker = async_sessionmaker(bind=db.bind)
+    view.is_async = True
+    return view
+
+
+async def _admin_update(view_class, model, data, db) -> None:
+    await _admin_view(view_class, db).update_model(SimpleNamespace(state=SimpleNamespace()), str(model.id), data)
+    await db.refresh(model)
+
+
+async def _admin_delete(view_class, model, db) -> None:
+    await _admin_view(view_class, db).delete_model(SimpleNamespace(state=SimpleNamespace()), str(model.id))
+
+
+@pytest.mark.asyncio
+async def test_admin_writes_maintain_user_activity_daily(authenticated_client, test_db, test_user, test_spots):
+    fisherman, main_point = test_spots
+    review = {"quality": 7, "crowded_level": 2, "wave_height_index": 5, "short_long_index": 5, "wind_index": 5}
+    for when in ("2026-03-10T08:00:00", "2026-03-10T16:00:00"):
+        response = await authenticated_client.post(
+            "/surf_session/",
+            json={"spot_id": fisherman.id, "datetime": when, "duration_minutes": 60, "review": review},
+        )
+        assert response.status_code == 201
+    first, second = (await test_db.scalars(select(SurfSession).order_by(SurfSession.datetime))).all()
+    day = datetime(2026, 3, 10).date()
+    assert await _activity_rows(test_db, test_user.id) == [(day, fisherman.id, 2, 120, 2, 14)]
+
+    move = {"spot": str(main_point.id), "datetime": datetime(2026, 3, 11, 9, 0), "duration_minutes": 45}
+    await _admin_update(SurfSessionAdmin, second, move, test_db)
+    assert await _activity_rows(test_db, test_user.id) == [
+        (day, fisherman.id, 1, 60, 1, 7),
+        (datetime(2026, 3, 11).date(), main_point.id, 1, 45, 1, 7),
+    ]
+
+    await _admin_view(SurfSessionAdmin, test_db).insert_model(
+        SimpleNamespace(state=SimpleNamespace()),
+        {
+            "user": str(test_user.id),
+            "spot": str(fisherman.id),
+            "datetime": datetime(2026, 3, 12, 7, 0),
+            "duration_minutes": 30,
+        },
+    )
+    first_review = await test_db.scalar(select(SurfSessionReview).where(SurfSessionReview.surf_session_id == first.id))
+    await _admin_update(SurfSessionReviewAdmin, first_review, {"quality": 2}, test_db)
+    await _admin_delete(SurfSessionAdmin, second, test_db)
+    incremental = await _activity_rows(test_db, test_user.id)
+    assert incremental == [(day, fisherman.id, 1, 60, 1, 2), (datetime(2026, 3, 12).date(), fisherman.id, 1, 30, 0, 0)]
+    assert await rebuild_user_activity_daily(test_db, [test_user.id]) == 2
+    assert await _activity_rows(test_db, test_user.id) == incremental
+
+    await _admin_delete(UserAdmin, test_user, test_db)
+    assert (await test_db.scalars(select(UserActivityDaily))).all() == []
@@ -1,5 +1,9 @@
+from datetime import datetime, timedelta
+
 import pytest
 
+from app.models import SurfSession
+
 
 def _review_payload(quality: int = 8) -> dict:
     return {
@@ -129,6 +133,58 @@ async def test_list_surf_session(authenticated_client, test_surf_sessions):
     assert data[1]["spot"]["name"] == "Main Point"
 
 
+@pytest.mark.asyncio
+async def test_list_surf_sessions_cursor_pagination(authenticated_client, test_db, test_user, test_spots):
+    base = datetime(2026, 2, 1, 6, 0, 0)
+    for index in range(7):
+        test_db.add(
+            SurfSession(
+                spot_id=test_spots[index % 2].id,
+                # Two sessions share every timestamp so the id tiebreaker is exercised.
+                datetime=base + timedelta(days=index // 2),
+                duration_minutes=60,
+                user_id=test_user.id,
+            )
+        )
+    await test_db.commit()
+
+    full = await authenticated_client.get("/surf_session/")
+    expected = [(item["datetime"], item["id"]) for item in full.json()]
+    assert expected == sorted(expected, reverse=True)
+    assert "x-next-cursor" not in full.headers
+
+    seen: list[tuple[str, int]] = []
+    cursor = None
+    pages = 0
+    while True:
+        params = {"limit": 3}
+        if cursor:
+            params["cursor"] = cursor
+        page = await authenticated_client.get("/surf_session/", params=params)
+        assert page.status_code == 200
+        seen.extend((item["datetime"], item["id"]) for item in page.json())
+        pages += 1
+        cursor = page.headers.get("x-next-cursor")
+        if cursor is None:
+            break
+    assert pages == 3
+    assert seen == expected
+
+    filtered = await authenticated_client.get(
+        "/surf_session/",
+        params={"from": "2026-02-02T00:00:00", "to": "2026-02-04T00:00:00", "spot_id": test_spots[0].id},
+    )
+    assert [item["datetime"] for item in filtered.json()] == ["2026-02-03T06:00:00", "2026-02-02T06:00:00"]
+    assert {item["spot_id"] for item in filtered.json()} == {test_spots[0].id}
+
+
+@pytest.mark.asyncio
+async def test_list_surf_sessions_invalid_cursor(authenticated_client):
+    response = await authenticated_client.get("/surf_session/", params={"limit": 5, "cursor": "not-a-cursor"})
+    assert response.status_code == 400
+    assert response.json()["code"] == "INVALID_CURSOR"
+
+
 @pytest.mark.asyncio
 async def test_update_session_with_review(authenticated_client, test_surf_sessions):
     update_data = {
@@ -225,6 +281,19 @@ async def test_create_session_with_spot_name(authenticated_client, test_surf_ses
     assert data["review"]["quality"] == 7
 
 
+@pytest.mark.asyncio
+async def test_spot_name_resolution_skips_lookup_query(authenticated_client, test_surf_sessions, query_counter):
+    payload = {"spot_name": "Fisherman", "datetime": "2026-01-14T08:00:00", "duration_minutes": 60}
+    warm = await authenticated_client.post("/surf_session/", json=payload)
+    assert warm.status_code == 201
+
+    with query_counter:
+        response = await authenticated_client.post("/surf_session/", json=payload)
+    assert response.status_code == 201
+    assert response.json()["spot_id"] == 1
+    assert not any("WHERE spots.name =" in statement for statement in query_counter.statements)
+
+
 @pytest.mark.asyncio
 async def test_create_session_with_inline_surfboard_one_time(authenticated_client, test_spots):
     surf_session = {
@@ -305,3 +374,70 @@ async def test_update_session_with_spot_name(authenticated_client, test_surf_ses
     assert data["spot"]["name"] == "Main Point"
     assert data["duration_minutes"] == 80
     assert data["review"]["quality"] == 9
+
+
+# Statement budgets per write endpoint. The identity map is cleared before each request
+# so, as in production, nothing is served from objects an earlier request loaded.
+CREATE_SESSION_BUDGET = 8  # user, spot, 2 forecast lookups, 2 INSERTs, 2 rollup upserts
+UPDATE_SESSION_BUDGET = 6  # user, joined load, UPDATE, activity delta, 2 forecast lookups
+DELETE_SESSION_BUDGET = 7  # user, joined load, 2 + 2 rollup decrements, DELETE
+
+
+@pytest.mark.asyncio
+async def test_session_write_statement_budgets(authenticated_client, test_db, test_spots, query_counter):
+    payload = {"spot_id": 1, "datetime": "2026-01-14T08:00:00", "duration_minutes": 60, "review": _review_payload()}
+
+    test_db.expunge_all()
+    with query_counter:
+        created = await authenticated_client.post("/surf_session/", json=payload)
+    assert created.status_code == 201
+    assert created.json()["spot"]["name"] == "Fisherman"
+    assert query_counter.count <= CREATE_SESSION_BUDGET, query_counter.statements
+    assert not any(statement.startswith("SELECT surf_sessions") for statement in query_counter.statements)
+
+    test_db.expunge_all()
+    with query_counter:
+        updated = await authenticated_client.put(
+            f"/surf_session/{created.json()['id']}",
+            json={**payload, "duration_minutes": 90, "notes": "glassy"},
+        )
+    assert updated.status_code == 200
+    assert (updated.json()["duration_minutes"], updated.json()["notes"]) == (90, "glassy")
+    assert updated.json()["spot"]["name"] == "Fisherman"
+    assert updated.json()["review"]["quality"] == 8
+    assert query_counter.count <= UPDATE_SESSION_BUDGET, query_counter.statements
+
+    test_db.expunge_all()
+    with query_counter:
+        deleted = await authenticated_client.delete(f"/surf_session/{created.json()['id']}")
+    assert deleted.status_code == 204
+    assert query_counter.count <= DELETE_SESSION_BUDGET, query_counter.statements
+
+
+@pytest.mark.asyncio
+async def test_create_session_with_unknown_ids_is_404(authenticated_client, test_spots):
+    base = {"datetime": "2026-01-14T08:00:00", "duration_minutes": 60}
+    missing_spot = await authenticated_client.post("/surf_session/", json={**base, "spot_id": 999})
+    assert missing_spot.status_code == 404
+    missing_board = await authenticated_client.post("/surf_session/", json={**base, "spot_id": 1, "surfboard_id": 999})
+    assert missing_board.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_list_surf_sessions_normalized_shape(authenticated_client, test_db, test_surf_sessions, query_counter):
+    nested = (await authenticated_client.get("/surf_session/")).json()
+
+    test_db.expunge_all()
+    with query_counter:
+        response = await authenticated_client.get("/surf_session/", params={"shape": "normalized"})
+    assert response.status_code == 200
+    data = response.json()
+    assert set(data["spots"]) == {"1", "2"}
+    assert data["spots"]["1"] == nested[0]["spot"]
+    assert data["surfboards"] == {}
+    for flat, full in zip(data["sessions"], nested, strict=True):
+        assert "spot" not in flat and "surfboard" not in flat
+        assert flat == {key: value for key, value in full.items() if key not in ("spot", "surfboard")}
+    # sessions joined to reviews, spots (no surfboards referenced); the user principal is cached by the first request
+    assert query_counter.count == 2, query_counter.statements
+    assert sum(statement.startswith("SELECT spots") for statement in query_counter.statements) == 1
@@ -0,0 +1,175 @@
+import random
+
+import pytest
+
+from app.models.spot import Spot
+from app.services.spot_index import SpotIndex, SpotPoint, haversine_km
+
+
+def _spot(spot_id: int, name: str, latitude: float | None, longitude: float | None) -> Spot:
+    return Spot(id=spot_id, name=name, latitude=latitude, longitude=longitude)
+
+
+def _random_points(count: int, seed: int = 7) -> list[SpotPoint]:
+    rng = random.Random(seed)
+    return [
+        SpotPoint(i, f"spot-{i}", rng.uniform(-60, 60), rng.uniform(-180, 180))
+        for i in range(1, count + 1)
+    ]
+
+
+def test_within_bbox_matches_brute_force():
+    points = _random_points(5000)
+    index = SpotIndex()
+    index.load(points)
+
+    rng = random.Random(11)
+    for _ in range(50):
+        min_lon, max_lon = sorted(rng.uniform(-180, 180) for _ in range(2))
+        min_lat, max_lat = sorted(rng.uniform(-60, 60) for _ in range(2))
+        expected = [
+            p.id for p in points if min_lon <= p.longitude <= max_lon and min_lat <= p.latitude <= max_lat
+        ]
+        assert [p.id for p in index.within_bbox(min_lon, min_lat, max_lon, max_lat)] == expected
+
+
+def test_within_bbox_skips_spots_without_coordinates():
+    index = SpotIndex()
+    index.load([SpotPoint(1, "a", None, None), SpotPoint(2, "b", 1.0, 1.0)])
+    assert [p.id for p in index.within_bbox(-180, -90, 180, 90)] == [2]
+    assert [p.id for p in index.all()] == [1, 2]
+
+
+def test_empty_index():
+    index = SpotIndex()
+    assert index.within_bbox(-180, -90, 180, 90) == []
+
+
+def test_nearest_matches_brute_force():
+    points = _random_points(3000)
+    index = SpotIndex()
+    index.load(points)
+
+    rng = random.Random(3)
+    for _ in range(40):
+        lat, lon = rng.uniform(-60, 60), rng.uniform(-180, 180)
+        radius_km = rng.choice([50, 500, 2000])
+        limit = rng.choice([1, 5, 25])
+        expected = sorted(
+            ((haversine_km(lat, lon, p.latitude, p.longitude), p.id) for p in points),
+        )
+        expected = [pid for dist, pid in expected if dist <= radius_km][:limit]
+        found = index.nearest(lat, lon, radius_km, limit)
+        assert [p.id for p, _ in found] == expected
+        assert all(distance <= radius_km for _, distance in found)
+
+
+def test_nearest_across_antimeridian():
+    index = SpotIndex()
+    index.load([SpotPoint(1, "east", 0.0, 179.9), SpotPoint(2, "west", 0.0, -179.9), SpotPoint(3, "far", 0.0, 0.0)])
+    found = index.nearest(0.0, 180.0, radius_km=50, limit=10)
+    assert {p.id for p, _ in found} == {1, 2}
+    assert all(distance == pytest.approx(11.12, abs=0.01) for _, distance in found)
+
+
+def test_incremental_writes_without_repack(monkeypatch):
+    points = _random_points(500)
+    index = SpotIndex()
+    index.load(points)
+    index.within_bbox(-180, -90, 180, 90)
+
+    builds = []
+    monkeypatch.setattr("app.services.spot_index.build_kdtree", lambda pts: builds.append(pts))
+
+    moved = points[0]
+    index.upsert(_spot(moved.id, moved.name, 10.0, 10.0))
+    index.upsert(_spot(9999, "new", 10.001, 10.001))
+    index.remove(points[1].id)
+
+    assert builds == []
+    assert [p.id for p, _ in index.nearest(10.0, 10.0, radius_km=1, limit=5)] == [moved.id, 9999]
+    assert points[1].id not in {p.id for p in index.within_bbox(-180, -90, 180, 90)}
+    assert {moved.id, 9999} <= {p.id for p in index.within_bbox(9.9, 9.9, 10.1, 10.1)}
+    assert builds == []
+
+
+def test_repacks_after_many_writes():
+    index = SpotIndex()
+    index.load(_random_points(100))
+    index.within_bbox(-180, -90, 180, 90)
+    for spot_id in range(1000, 1000 + SpotIndex.REPACK_MIN_CHANGES + 1):
+        index.upsert(_spot(spot_id, "bulk", 1.0, 1.0))
+    assert len(index.within_bbox(0.9, 0.9, 1.1, 1.1)) == SpotIndex.REPACK_MIN_CHANGES + 1
+    assert index._pending == {}
+
+
+def test_clusters_partition_every_located_spot():
+    points = _random_points(2000)
+    index = SpotIndex()
+    index.load(points + [SpotPoint(9999, "nowhere", None, None)])
+
+    for zoom in (0, 3, 8):
+        clusters = index.clusters(zoom)
+        assert sum(c.count for c in clusters) == len(points)
+        assert all((c.spot_id is None) == (c.count > 1) for c in clusters)
+    assert len(index.clusters(0)) <= 16
+    assert len(index.clusters(3)) < len(index.clusters(8))
+
+
+def test_clusters_filter_by_bbox_and_follow_writes():
+    index = SpotIndex()
+    index.load([SpotPoint(1, "a", 5.97, 80.42), SpotPoint(2, "b", 5.96, 80.43), SpotPoint(3, "c", -17.8, 177.2)])
+
+    (cluster,) = index.clusters(4, 80.0, 5.0, 81.0, 6.5)
+    assert (cluster.count, cluster.spot_id) == (2, None)
+    assert cluster.latitude == pytest.approx(5.965)
+    assert [c.name for c in index.clusters(4, 170, -20, -170, -10)] == ["c"]
+
+    cached = index._clusters[4]
+    assert index.clusters(4, 80.0, 5.0, 81.0, 6.5) == [cluster]
+    assert index._clusters[4] is cached
+
+    index.remove(2)
+    assert index._clusters == {}
+    assert [(c.count, c.spot_id) for c in index.clusters(4, 80.0, 5.0, 81.0, 6.5)] == [(1, 1)]
+
+
+def test_clusters_include_cells_overlapping_the_bbox_edge():
+    index = SpotIndex()
+    # Same zoom-4 cell (lon 78.75-84.375); the centroid at lon 82.05 lies outside the viewport.
+    index.load([SpotPoint(1, "inside", 5.0, 80.1), SpotPoint(2, "outside", 5.0, 84.0)])
+    (cluster,) = index.clusters(4, 79.0, 4.0, 81.0, 6.0)
+    assert cluster.count == 2
+    assert cluster.longitude == pytest.approx(82.05)
+
+
+def test_name_lookup_follows_renames_and_deletes():
+    index = SpotIndex()
+    index.load([SpotPoint(1, "Weligama", 5.97, 80.42)])
+    assert index.id_for_name("Weligama") == 1
+
+    index.upsert(_spot(1, "Weligama Bay", 5.97, 80.42))
+    assert index.id_for_name("Weligama") is None
+    assert index.id_for_name("Weligama Bay") == 1
+    assert [p.id for p in index.search("weligama b", 5)] == [1]
+
+    index.remove(1)
+    assert index.id_for_name("Weligama Bay") is None
+    assert index.search("weligama", 5) == []
+
+
+def test_search_ranks_prefixes_before_typos():
+    index = SpotIndex()
+    index.load(
+        [
+            SpotPoint(1, "Arugam Bay", 6.84, 81.84),
+            SpotPoint(2, "Bay of Plenty", -37.6, 176.2),
+            SpotPoint(3, "Baía Formosa", -6.37, -35.0),
+            SpotPoint(4, "Uluwatu", -8.81, 115.09),
+        ]
+    )
+    assert [p.id for p in index.search("Bay", 5)] == [2, 1]
+    assert [p.id for p in index.search("baia", 5)] == [3]
+    assert [p.id for p in index.search("uluwattu", 5)] == [4]
+    assert [p.id for p in index.search("aru bay", 5)] == [1]
+    assert index.search("!!", 5) == []
@@ -1,6 +1,15 @@
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
 
 import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from app.admin.views import SurfSessionReviewAdmin, UserAdmin
+from app.models import Spot, SpotReviewDaily, SurfSession, SurfSessionReview
+from app.services.spot_review_daily_service import rebuild_spot_review_daily, review_weight
+from app.services.spot_service import list_spots
+from app.services.surf_session_review_service import get_spot_review_summaries, get_spot_review_summary
 
 
 def _review_payload(quality: int) -> dict:
@@ -93,3 +102,268 @@ async def test_spot_reviews_are_visible_across_users_and_anonymous(client, test_
     assert "recent_reviews" in spot_data
     assert len(spot_data["recent_reviews"]) >= 2
     assert all("user_id" not in item for item in spot_data["recent_reviews"])
+
+
+@pytest.mark.asyncio
+async def test_list_spots_uses_constant_number_of_queries(test_db, test_user, query_counter):
+    # Noon today, so the reviews a few minutes earlier never straddle midnight; list_spots reads today's rows.
+    now = datetime.combine(datetime.now(timezone.utc).date(), datetime.min.time()) + timedelta(hours=12)
+    spots = [Spot(name=f"Batch Spot {i}") for i in range(12)]
+    test_db.add_all(spots)
+    await test_db.flush()
+    for index, spot in enumerate(spots):
+        for offset in range(4):
+            surf_session = SurfSession(
+                spot_id=spot.id,
+                datetime=now - timedelta(minutes=offset),
+                duration_minutes=60,
+                user_id=test_user.id,
+            )
+            test_db.add(surf_session)
+            await test_db.flush()
+            test_db.add(
+                SurfSessionReview(
+                    surf_session_id=surf_session.id,
+                    spot_id=spot.id,
+                    user_id=test_user.id,
+                    observed_at=now - timedelta(minutes=offset),
+                    quality=(index + offset) % 10,
+                )
+            )
+    await rebuild_spot_review_daily(test_db)
+    await test_db.commit()
+
+    with query_counter:
+        listed = await list_spots(test_db)
+    assert query_counter.count == 3
+
+    by_id = {spot.id: spot for spot in listed}
+    for spot in spots:
+        expected = await get_spot_review_summary(test_db, spot.id, now=now)
+        batched = await get_spot_review_summaries(test_db, [spot.id], now=now)
+        assert batched[spot.id] == expected
+        assert by_id[spot.id].review_summary.review_count == 4
+        recent = by_id[spot.id].recent_reviews
+        assert len(recent) == 3
+        assert [r.observed_at for r in recent] == sorted((r.observed_at for r in recent), reverse=True)
+
+
+@pytest.mark.asyncio
+async def test_session_writes_maintain_spot_review_daily(authenticated_client, test_db, test_spots):
+    today_utc = datetime.now(timezone.utc).date()
+    spot_id = test_spots[0].id
+    early = datetime.combine(today_utc, datetime.min.time()) + timedelta(hours=6)
+    late = early + timedelta(hours=3)
+
+    first = await authenticated_client.post(
+        "/surf_session/",
+        json={
+            "spot_id": spot_id,
+            "datetime": early.isoformat(),
+            "duration_minutes": 60,
+            "review": _review_payload(quality=8),
+        },
+    )
+    second = await authenticated_client.post(
+        "/surf_session/",
+        json={
+            "spot_id": spot_id,
+            "datetime": late.isoformat(),
+            "duration_minutes": 60,
+            "review": _review_payload(quality=2),
+        },
+    )
+    assert first.status_code == 201
+    assert second.status_code == 201
+
+    def _expected_quality(pairs):
+        return sum(q * review_weight(t) for q, t in pairs) / sum(review_weight(t) for _, t in pairs)
+
+    summary = await get_spot_review_summary(test_db, spot_id)
+    assert summary.review_count == 2
+    assert summary.latest_observed_at == late
+    assert summary.weighted_quality == pytest.approx(_expected_quality([(8, early), (2, late)]))
+    assert summary.avg_crowded_level == pytest.approx(4)
+
+    update_response = await authenticated_client.put(
+        f"/surf_session/{second.json()['id']}",
+        json={
+            "spot_id": spot_id,
+            "datetime": late.isoformat(),
+            "duration_minutes": 60,
+            "review": _review_payload(quality=6),
+        },
+    )
+    assert update_response.status_code == 200
+    summary = await get_spot_review_summary(test_db, spot_id)
+    assert summary.review_count == 2
+    assert summary.weighted_quality == pytest.approx(_expected_quality([(8, early), (6, late)]))
+
+    delete_response = await authenticated_client.delete(f"/surf_session/{second.json()['id']}")
+    assert delete_response.status_code == 204
+    summary = await get_spot_review_summary(test_db, spot_id)
+    assert summary.review_count == 1
+    assert summary.latest_observed_at == early
+    assert summary.weighted_quality == pytest.approx(8)
+
+    remove_review = await authenticated_client.put(
+        f"/surf_session/{first.json()['id']}",
+        json={"spot_id": spot_id, "datetime": early.isoformat(), "duration_minutes": 60},
+    )
+    assert remove_review.status_code == 200
+    summary = await get_spot_review_summary(test_db, spot_id)
+    assert summary.review_count == 0
+    assert summary.weighted_quality is None
+    rows = await test_db.execute(select(SpotReviewDaily).where(SpotReviewDaily.spot_id == spot_id))
+    assert rows.scalars().all() == []
+
+
+def _admin_request() -> SimpleNamespace:
+    return SimpleNamespace(state=SimpleNamespace())
+
+
+def _admin_view(view_class, db):
+    """An admin view whose sqladmin sessions run on the test connection."""
+    view = view_class()
+    view.session_maker = async_sessionmaker(bind=db.bind)
+    view.is_async = True
+    return view
+
+
+@pytest.mark.asyncio
+async def test_admin_review_writes_maintain_spot_review_daily(authenticated_client, test_db, test_spots):
+    observed = datetime.combine(datetime.now(timezone.utc).date(), datetime.min.time()) + timedelta(hours=7)
+    response = await authenticated_client.post(
+        "/surf_session/",
+        json={
+            "spot_id": test_spots[0].id,
+            "datetime": observed.isoformat(),
+            "duration_minutes": 60,
+            "review": _review_payload(quality=8),
+        },
+    )
+    assert response.status_code == 201
+    review = await test_db.scalar(select(SurfSessionReview))
+    view = _admin_view(SurfSessionReviewAdmin, test_db)
+
+    await view.update_model(_admin_request(), str(review.id), {"quality": 4, "spot": str(test_spots[1].id)})
+    assert (await get_spot_review_summary(test_db, test_spots[0].id)).review_count == 0
+    moved = await get_spot_review_summary(test_db, test_spots[1].id)
+    assert moved.review_count == 1
+    assert moved.weighted_quality == pytest.approx(4)
+
+    await view.delete_model(_admin_request(), str(review.id))
+    assert (await get_spot_review_summary(test_db, test_spots[1].id)).review_count == 0
+
+
+@pytest.mark.asyncio
+async def test_admin_user_delete_drops_their_reviews_from_spot_review_daily(
+    authenticated_client, test_db, test_user, test_spots
+):
+    observed = datetime.combine(datetime.now(timezone.utc).date(), datetime.min.time()) + timedelta(hours=7)
+    for spot in test_spots:
+        response = await authenticated_client.post(
+            "/surf_session/",
+            json={
+                "spot_id": spot.id,
+                "datetime": observed.isoformat(),
+                "duration_minutes": 60,
+                "review": _review_payload(quality=8),
+            },
+        )
+        assert response.status_code == 201
+
+    view = UserAdmin()
+    request = _admin_request()
+    await view.on_model_delete(test_user, request)
+    await test_db.delete(test_user)
+    await test_db.commit()
+    await view.after_model_delete(test_user, request)
+
+    assert (await test_db.scalars(select(SurfSessionReview))).all() == []
+    assert (await test_db.scalars(select(SpotReviewDaily))).all() == []
+
+
+@pytest.mark.asyncio
+async def test_rebuild_spot_review_daily_matches_incremental(authenticated_client, test_db, test_spots):
+    today_utc = datetime.now(timezone.utc).date()
+    base = datetime.combine(today_utc, datetime.min.time()) + timedelta(hours=5)
+    for hours, quality in [(0, 3), (2, 9), (4, 7)]:
+        response = await authenticated_client.post(
+            "/surf_session/",
+            json={
+                "spot_id": test_spots[1].id,
+                "datetime": (base + timedelta(hours=hours)).isoformat(),
+                "duration_minutes": 45,
+                "review": _review_payload(quality=quality),
+            },
+        )
+        assert response.status_code == 201
+
+    incremental = await get_spot_review_summary(test_db, test_spots[1].id)
+    assert await rebuild_spot_review_daily(test_db, [test_spots[1].id]) == 1
+    rebuilt = await get_spot_review_summary(test_db, test_spots[1].id)
+
+    assert rebuilt.review_count == incremental.review_count == 3
+    assert rebuilt.latest_observed_at == incremental.latest_observed_at
+    assert rebuilt.weighted_quality == pytest.approx(incremental.weighted_quality)
+
+
+@pytest.mark.asyncio
+async def test_spot_reviews_cursor_pagination(authenticated_client, test_db, test_user, test_spots):
+    base = datetime(2026, 2, 1, 6, 0, 0)
+    for index in range(7):
+        surf_session = SurfSession(
+            spot_id=test_spots[0].id,
+            # Two reviews share every timestamp so the id tiebreaker is exercised.
+            datetime=base + timedelta(hours=index // 2),
+            duration_minutes=60,
+            user_id=test_user.id,
+        )
+        test_db.add(surf_session)
+        await test_db.flush()
+        test_db.add(
+            SurfSessionReview(
+                surf_session_id=surf_session.id,
+                spot_id=test_spots[0].id,
+                user_id=test_user.id,
+                observed_at=surf_session.datetime,
+                quality=index,
+            )
+        )
+    await test_db.commit()
+
+    offset_response = await authenticated_client.get(f"/spot/{test_spots[0].id}/reviews", params={"limit": 50})
+    expected_ids = [item["id"] for item in offset_response.json()]
+    assert len(expected_ids) == 7
+    assert "x-next-cursor" not in offset_response.headers
+
+    seen_ids: list[int] = []
+    cursor = None
+    pages = 0
+    while True:
+        params = {"limit": 3}
+        if cursor:
+            params["cursor"] = cursor
+        page = await authenticated_client.get(f"/spot/{test_spots[0].id}/reviews", params=params)
+        assert page.status_code == 200
+        seen_ids.extend(item["id"] for item in page.json())
+        pages += 1
+        cursor = page.headers.get("x-next-cursor")
+        if cursor is None:
+            break
+
+    assert pages == 3
+    assert seen_ids == expected_ids
+
+    legacy_page = await authenticated_client.get(
+        f"/spot/{test_spots[0].id}/reviews", params={"limit": 3, "offset": 3}
+    )
+    assert [item["id"] for item in legacy_page.json()] == expected_ids[3:6]
+
+
+@pytest.mark.asyncio
+async def test_spot_reviews_invalid_cursor(authenticated_client, test_spots):
+    response = await authenticated_client.get(f"/spot/{test_spots[0].id}/reviews", params={"cursor": "not-a-cursor"})
+    assert response.status_code == 400
+    assert response.json()["code"] == "INVALID_CURSOR"
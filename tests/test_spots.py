@@ -3,34 +3,7 @@ import pytest_asyncio
 from httpx import AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.security import hash_password
-from app.models.users import User
-
-
-@pytest_asyncio.fixture
-async def admin_user(test_db: AsyncSession):
-    user = User(
-        email="admin@example.com",
-        hashed_password=hash_password("adminpassword123"),
-        is_admin=True,
-    )
-    test_db.add(user)
-    await test_db.commit()
-    await test_db.refresh(user)
-    return user
-
-
-@pytest_asyncio.fixture
-async def authenticated_admin_client(client: AsyncClient, admin_user):
-    login_data = {
-        "username": "admin@example.com",
-        "password": "adminpassword123",
-    }
-    response = await client.post("/auth/login", data=login_data)
-    assert response.status_code == 200
-    token_data = response.json()
-    client.headers.update({"Authorization": f"Bearer {token_data['access_token']}"})
-    return client
+from app.models.spot import Spot
 
 
 @pytest.mark.asyncio
@@ -81,3 +54,212 @@ async def test_delete_spot_admin_success(authenticated_admin_client: AsyncClient
     # Ensure the spot is actually deleted
     get_response = await authenticated_admin_client.get(f"/spot/{spot_id}")
     assert get_response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_list_spots_conditional_get(authenticated_admin_client: AsyncClient, test_spots, query_counter):
+    first = await authenticated_admin_client.get("/spot/")
+    assert first.status_code == 200
+    etag = first.headers["etag"]
+    assert {spot["name"] for spot in first.json()} == {"Fisherman", "Main Point"}
+
+    with query_counter:
+        not_modified = await authenticated_admin_client.get("/spot/", headers={"If-None-Match": etag})
+    assert not_modified.status_code == 304
+    assert not_modified.headers["etag"] == etag
+    assert not_modified.content == b""
+    assert not any("spots" in statement for statement in query_counter.statements)
+
+    with query_counter:
+        cached = await authenticated_admin_client.get("/spot/")
+    assert cached.content == first.content
+    assert not any("spots" in statement for statement in query_counter.statements)
+
+    created = await authenticated_admin_client.post("/spot/", json={"name": "Fresh Spot"})
+    assert created.status_code == 201
+
+    refreshed = await authenticated_admin_client.get("/spot/", headers={"If-None-Match": etag})
+    assert refreshed.status_code == 200
+    assert refreshed.headers["etag"] != etag
+    assert "Fresh Spot" in {spot["name"] for spot in refreshed.json()}
+
+
+@pytest.mark.asyncio
+async def test_review_write_invalidates_spot_catalogue(authenticated_client: AsyncClient, test_spots):
+    first = await authenticated_client.get("/spot/")
+    etag = first.headers["etag"]
+
+    response = await authenticated_client.post(
+        "/surf_session/",
+        json={
+            "spot_id": test_spots[0].id,
+            "datetime": "2026-01-13T08:00:00",
+            "duration_minutes": 60,
+            "review": {
+                "quality": 7,
+                "crowded_level": 3,
+                "wave_height_index": 5,
+                "short_long_index": 5,
+                "wind_index": 2,
+            },
+        },
+    )
+    assert response.status_code == 201
+
+    after = await authenticated_client.get("/spot/", headers={"If-None-Match": etag})
+    assert after.status_code == 200
+    assert after.headers["etag"] != etag
+
+
+@pytest_asyncio.fixture
+async def located_spots(test_db: AsyncSession):
+    spots = [
+        Spot(name="Weligama", latitude=5.97, longitude=80.42),
+        Spot(name="Hiriketiya", latitude=5.96, longitude=80.71),
+        Spot(name="Arugam Bay", latitude=6.84, longitude=81.84),
+        Spot(name="Fiji Cloudbreak", latitude=-17.86, longitude=177.19),
+        Spot(name="Samoa Salani", latitude=-14.0, longitude=-171.5),
+        Spot(name="Unmapped"),
+    ]
+    test_db.add_all(spots)
+    await test_db.commit()
+    return spots
+
+
+@pytest.mark.asyncio
+async def test_list_spots_bbox_returns_marker_projection(
+    authenticated_client: AsyncClient, located_spots, query_counter
+):
+    with query_counter:
+        response = await authenticated_client.get("/spot/", params={"bbox": "80.0,5.5,81.0,6.5"})
+    assert response.status_code == 200
+    data = response.json()
+    assert [item["name"] for item in data] == ["Weligama", "Hiriketiya"]
+    assert set(data[0]) == {"id", "name", "latitude", "longitude"}
+    assert not any("surf_session_reviews" in statement for statement in query_counter.statements)
+    assert not any("spot_review_daily" in statement for statement in query_counter.statements)
+
+    projected = await authenticated_client.get(
+        "/spot/", params={"bbox": "80.0,5.5,82.0,7.0", "fields": "id,latitude,longitude"}
+    )
+    assert projected.status_code == 200
+    assert all(set(item) == {"id", "latitude", "longitude"} for item in projected.json())
+    assert len(projected.json()) == 3
+
+
+@pytest.mark.asyncio
+async def test_list_spots_bbox_across_antimeridian(authenticated_client: AsyncClient, located_spots):
+    response = await authenticated_client.get("/spot/", params={"bbox": "170,-20,-170,-10"})
+    assert response.status_code == 200
+    assert {item["name"] for item in response.json()} == {"Fiji Cloudbreak", "Samoa Salani"}
+
+
+@pytest.mark.asyncio
+async def test_list_spots_bbox_reflects_spot_writes(authenticated_admin_client: AsyncClient, located_spots):
+    bbox = {"bbox": "80.0,5.5,81.0,6.5", "fields": "name"}
+    before = await authenticated_admin_client.get("/spot/", params=bbox)
+    assert [item["name"] for item in before.json()] == ["Weligama", "Hiriketiya"]
+
+    created = await authenticated_admin_client.post(
+        "/spot/", json={"name": "Mirissa", "latitude": 5.94, "longitude": 80.45}
+    )
+    assert created.status_code == 201
+    moved = await authenticated_admin_client.put(
+        f"/spot/{located_spots[1].id}", json={"latitude": 6.84, "longitude": 81.83}
+    )
+    assert moved.status_code == 200
+    deleted = await authenticated_admin_client.delete(f"/spot/{located_spots[0].id}")
+    assert deleted.status_code == 204
+
+    after = await authenticated_admin_client.get("/spot/", params=bbox)
+    assert [item["name"] for item in after.json()] == ["Mirissa"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "params",
+    [
+        {"bbox": "80,5"},
+        {"bbox": "a,b,c,d"},
+        {"bbox": "80,7,81,6"},
+        {"bbox": "80,5,81,6", "fields": "id,review_summary"},
+    ],
+)
+async def test_list_spots_bbox_validation(authenticated_client: AsyncClient, params):
+    response = await authenticated_client.get("/spot/", params=params)
+    assert response.status_code == 422
+    assert response.json()["code"] == "VALIDATION_ERROR"
+
+
+@pytest.mark.asyncio
+async def test_nearby_spots(authenticated_admin_client: AsyncClient, located_spots):
+    response = await authenticated_admin_client.get(
+        "/spot/nearby", params={"lat": 5.97, "lon": 80.45, "radius_km": 40}
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert [item["name"] for item in data] == ["Weligama", "Hiriketiya"]
+    assert data[0]["distance_km"] < data[1]["distance_km"] < 40
+
+    created = await authenticated_admin_client.post(
+        "/spot/", json={"name": "Mirissa", "latitude": 5.945, "longitude": 80.455}
+    )
+    assert created.status_code == 201
+    limited = await authenticated_admin_client.get(
+        "/spot/nearby", params={"lat": 5.95, "lon": 80.455, "radius_km": 40, "limit": 1}
+    )
+    assert [item["name"] for item in limited.json()] == ["Mirissa"]
+
+
+@pytest.mark.asyncio
+async def test_nearby_spots_validation(authenticated_client: AsyncClient):
+    response = await authenticated_client.get("/spot/nearby", params={"lat": 95, "lon": 0})
+    assert response.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_spot_clusters(authenticated_admin_client: AsyncClient, located_spots):
+    response = await authenticated_admin_client.get("/spot/clusters", params={"zoom": 2})
+    assert response.status_code == 200
+    data = response.json()
+    assert sum(item["count"] for item in data) == 5
+    sri_lanka = next(item for item in data if item["count"] == 3)
+    assert sri_lanka["spot_id"] is None and sri_lanka["name"] is None
+
+    viewport = await authenticated_admin_client.get("/spot/clusters", params={"zoom": 12, "bbox": "80.0,5.5,81.0,6.5"})
+    assert sorted(item["name"] for item in viewport.json()) == ["Hiriketiya", "Weligama"]
+
+    created = await authenticated_admin_client.post(
+        "/spot/", json={"name": "Mirissa", "latitude": 5.945, "longitude": 80.455}
+    )
+    assert created.status_code == 201
+    refreshed = await authenticated_admin_client.get("/spot/clusters", params={"zoom": 2})
+    assert sum(item["count"] for item in refreshed.json()) == 6
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("params", [{}, {"zoom": 21}, {"zoom": 3, "bbox": "1,2,3"}, {"zoom": 12}])
+async def test_spot_clusters_validation(authenticated_client: AsyncClient, params):
+    response = await authenticated_client.get("/spot/clusters", params=params)
+    assert response.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_search_spots(authenticated_admin_client: AsyncClient, located_spots):
+    response = await authenticated_admin_client.get("/spot/search", params={"q": "weli"})
+    assert response.status_code == 200
+    assert response.json() == [{"id": located_spots[0].id, "name": "Weligama", "latitude": 5.97, "longitude": 80.42}]
+
+    typo = await authenticated_admin_client.get("/spot/search", params={"q": "hirikatiya"})
+    assert [item["name"] for item in typo.json()] == ["Hiriketiya"]
+
+    renamed = await authenticated_admin_client.put(f"/spot/{located_spots[2].id}", json={"name": "Arugam Point"})
+    assert renamed.status_code == 200
+    point = await authenticated_admin_client.get("/spot/search", params={"q": "arugam p"})
+    assert [item["name"] for item in point.json()] == ["Arugam Point"]
+
+
+@pytest.mark.asyncio
+async def test_search_spots_validation(authenticated_client: AsyncClient):
+    response = await authenticated_client.get("/spot/search", params={"q": ""})
+    assert response.status_code == 422
@@ -0,0 +1,37 @@
+from app.core.ttl_lru import TtlLru
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_entries_expire_and_count_lookups():
+    clock = _Clock()
+    cache: TtlLru[str, int] = TtlLru(max_entries=10, ttl_seconds=5, clock=clock)
+    cache.put("a", 1)
+    cache.put("b", 2, expires_at=101.0)
+    assert cache.get("a") == 1 and cache.get("b") == 2
+
+    clock.now = 101.0
+    assert cache.get("b") is None
+    clock.now = 105.0
+    assert cache.get("a") is None
+    assert len(cache) == 0
+    assert cache.metrics() == {"entries": 0, "max_entries": 10, "hits": 2, "misses": 2, "hit_rate": 0.5}
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache: TtlLru[str, int] = TtlLru(max_entries=2, ttl_seconds=60)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    cache.get("a")
+    cache.put("c", 3)
+    assert (cache.get("a"), cache.get("b"), cache.get("c")) == (1, None, 3)
+
+    cache.pop("a")
+    cache.clear()
+    assert len(cache) == 0 and cache.metrics()["hits"] == 0
@@ -1,11 +1,22 @@
-from datetime import datetime, timedelta
+import asyncio
+from datetime import date, datetime, timedelta
 
+import httpx
 import pytest
 import pytest_asyncio
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.exceptions import ExternalAPIError
+from app.external_apis import OpenMeteoClient
 from app.models.surf_forecast import SurfForecast
 from app.services.session_forecast_service import get_weather_for_session
+from app.services.weather_cache import weather_cache
+from app.services.weather_service import get_surf_report, set_openmeteo_client
+
+
+@pytest.fixture(autouse=True)
+def _fresh_weather_cache():
+    weather_cache.clear()
 
 
 @pytest_asyncio.fixture
@@ -93,3 +104,103 @@ async def test_get_weather_for_session_closest_within_offset(
     assert result["wave_period"] == 8.0
     assert result["wave_dir"] == "NE"
     assert result["wind_dir"] == "SW"
+
+
+class _OpenMeteoStub:
+    """Two hours of marine or wind data per request, recording every request it answers."""
+
+    def __init__(self) -> None:
+        self.requests: list[httpx.Request] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        times = ["2026-01-13T00:00", "2026-01-13T01:00"]
+        if request.url.path == "/v1/marine":
+            hourly = {
+                "time": times,
+                "wave_height": [1.1, 1.3],
+                "wave_period": [9.0, 10.0],
+                "wave_direction": [280, 290],
+            }
+        else:
+            hourly = {"time": times, "wind_speed_10m": [12.0, 14.0], "wind_direction_10m": [45, 50]}
+        return httpx.Response(200, json={"hourly": hourly})
+
+
+@pytest.fixture
+def openmeteo_stub() -> _OpenMeteoStub:
+    return _OpenMeteoStub()
+
+
+@pytest.mark.asyncio
+async def test_get_surf_report_uses_registered_client(openmeteo_stub):
+    http = httpx.AsyncClient(transport=httpx.MockTransport(openmeteo_stub))
+    set_openmeteo_client(OpenMeteoClient(http_client=http))
+    try:
+        for _ in range(2):
+            report = await get_surf_report(38.99, -9.42, date(2026, 1, 13))
+            assert report["wave_height"] == 1.1 and report["wind_direction"] == 45
+        # The shared client is not closed after a call.
+        assert not http.is_closed
+    finally:
+        set_openmeteo_client(None)
+        await http.aclose()
+
+
+@pytest.mark.asyncio
+async def test_get_surf_report_serves_nearest_hour_from_cache(openmeteo_stub):
+    client = OpenMeteoClient(http_client=httpx.AsyncClient(transport=httpx.MockTransport(openmeteo_stub)))
+    try:
+        first = await get_surf_report(38.991, -9.424, datetime(2026, 1, 13, 0, 20), client=client)
+        later = await get_surf_report(38.994, -9.422, datetime(2026, 1, 13, 0, 40), client=client)
+        last = await get_surf_report(38.99, -9.42, datetime(2026, 1, 13, 9, 0), client=client)
+    finally:
+        await client.aclose()
+
+    assert (first["time"], first["wave_height"], first["wind_speed"]) == ("2026-01-13T00:00", 1.1, 12.0)
+    assert (later["time"], later["wave_period"], later["wind_direction"]) == ("2026-01-13T01:00", 10.0, 50)
+    assert last["time"] == "2026-01-13T01:00"
+    # One marine and one weather call for the day, fetched at the rounded coordinates.
+    assert len(openmeteo_stub.requests) == 2
+    assert {request.url.params["latitude"] for request in openmeteo_stub.requests} == {"38.99"}
+    assert len(weather_cache) == 1
+
+
+@pytest.mark.asyncio
+async def test_identical_in_flight_requests_are_coalesced(authenticated_admin_client, openmeteo_stub):
+    release = asyncio.Event()
+    status = 200
+
+    async def slow_stub(request: httpx.Request) -> httpx.Response:
+        await release.wait()
+        return openmeteo_stub(request) if status == 200 else httpx.Response(status)
+
+    openmeteo = OpenMeteoClient(http_client=httpx.AsyncClient(transport=httpx.MockTransport(slow_stub)))
+    set_openmeteo_client(openmeteo)
+    try:
+        reports = [asyncio.create_task(get_surf_report(38.99, -9.42, date(2026, 1, 13))) for _ in range(5)]
+        await asyncio.sleep(0.01)
+        assert (await authenticated_admin_client.get("/health/openmeteo")).json()["in_flight"] == 2
+        release.set()
+        assert {report["wave_height"] for report in await asyncio.gather(*reports)} == {1.1}
+        assert len(openmeteo_stub.requests) == 2
+        metrics = (await authenticated_admin_client.get("/health/openmeteo")).json()
+        assert metrics == {
+            "requests": 10,
+            "upstream_requests": 2,
+            "coalesced": 8,
+            "coalescing_ratio": 0.8,
+            "in_flight": 0,
+        }
+
+        # Every coalesced caller sees the shared failure.
+        status = 503
+        failures = await asyncio.gather(
+            *(openmeteo.get_marine_hourly_forecast(1.0, 2.0, date(2026, 1, 14), date(2026, 1, 14)) for _ in range(3)),
+            return_exceptions=True,
+        )
+        assert all(isinstance(failure, ExternalAPIError) for failure in failures)
+        assert openmeteo.metrics()["upstream_requests"] == 3
+    finally:
+        set_openmeteo_client(None)
+        await openmeteo.aclose()